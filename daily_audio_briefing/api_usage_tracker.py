@@ -8,10 +8,12 @@ Thread-safe singleton that wraps every generate_content() call with:
 - JSON persistence with lazy day/month rollover
 """
 
+import bisect
 import json
 import os
 import sys
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import date, datetime
 from typing import Optional, Tuple
@@ -47,6 +49,9 @@ FREE_TIER_LIMITS = {
 }
 # Default fallback if model not in table
 FREE_TIER_DEFAULT = {"rpm": 5, "rpd": 100}
+# A call over the RPM limit waits for a free slot up to this long; past it
+# FreeTierExceeded is raised so the caller can fall back (Groq / local)
+MAX_RPM_WAIT_SECONDS = 60
 MAX_LOG_ENTRIES = 500
 MAX_HISTORY_DAYS = 90
 
@@ -143,8 +148,9 @@ class APIUsageTracker:
     def __init__(self):
         self._lock = threading.Lock()
         self._path = _get_usage_path()
-        # Per-minute call timestamps for RPM enforcement (in-memory only)
-        self._recent_calls: list = []  # list of datetime
+        # Per-minute call timestamps for RPM enforcement (in-memory only).
+        # Sorted; may include the future start times of calls waiting a slot.
+        self._recent_calls: list = []  # list of epoch seconds
         self._data = self._load()
         self._apply_env_overrides()
 
@@ -333,28 +339,37 @@ class APIUsageTracker:
                 return limits
         return FREE_TIER_DEFAULT
 
-    def _enforce_free_tier(self, model):
+    def _enforce_free_tier(self, model) -> float:
         """Check RPM and RPD against free tier limits. Must be called under lock.
 
-        Raises FreeTierExceeded if the call would exceed free tier limits.
+        Reserves an RPM slot for the call and returns how many seconds the
+        caller must wait before making it (0 when under the limit), so a burst
+        is spread across the minute instead of failing over.
+        Raises FreeTierExceeded if the daily limit is reached or the wait
+        would exceed MAX_RPM_WAIT_SECONDS.
         """
-        now = datetime.now()
+        now = time.time()
         ft = self._get_free_tier_limits(model)
 
-        # RPM check — count calls in the last 60 seconds
-        one_minute_ago = now.timestamp() - 60
-        self._recent_calls = [t for t in self._recent_calls if t > one_minute_ago]
-        if len(self._recent_calls) >= ft["rpm"]:
-            raise FreeTierExceeded("rpm", len(self._recent_calls), ft["rpm"])
-
         # RPD check — use daily_calls from persisted data
         period = self._data.get("current_period", {})
         daily = period.get("daily_calls", 0)
         if daily >= ft["rpd"]:
             raise FreeTierExceeded("rpd", daily, ft["rpd"])
 
-        # Record this call timestamp for RPM tracking
-        self._recent_calls.append(now.timestamp())
+        # RPM check — calls in the last 60 seconds, plus calls already queued
+        one_minute_ago = now - 60
+        self._recent_calls = [t for t in self._recent_calls if t > one_minute_ago]
+        start = now
+        if len(self._recent_calls) >= ft["rpm"]:
+            # Go once the rpm-th latest call has left the 60-second window
+            start = self._recent_calls[-ft["rpm"]] + 60
+            if start - now > MAX_RPM_WAIT_SECONDS:
+                raise FreeTierExceeded("rpm", len(self._recent_calls), ft["rpm"])
+
+        # Record this call's start time for RPM tracking
+        bisect.insort(self._recent_calls, start)
+        return start - now
 
     # --- Core API ---
 
@@ -480,6 +495,7 @@ class APIUsageTracker:
         task_id, task_name = get_current_task()
 
         # Pre-flight limit check
+        wait = 0.0
         with self._lock:
             self._maybe_rollover()
             limits = self._data.get("limits", {})
@@ -507,21 +523,25 @@ class APIUsageTracker:
             # Free tier rate limiting — enforced regardless of other limits.
             # Keeps usage within Google AI Studio's free tier to avoid billing.
             if limits.get("free_tier_only", True):
-                self._enforce_free_tier(model)
+                wait = self._enforce_free_tier(model)
 
-        # Sleep outside lock if we're close to RPM to space out calls
-        import time
-        time.sleep(0.5)  # small delay between calls to stay well under RPM
+        # Wait for the reserved RPM slot outside the lock
+        if wait > 0:
+            time.sleep(wait)
 
-        # Make the actual API call (outside lock) with timeout guard
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(model.generate_content, prompt)
-            try:
-                response = future.result(timeout=timeout)
-            except FuturesTimeoutError:
-                raise TimeoutError(
-                    f"API call timed out after {timeout}s (caller={caller})"
-                )
+        # Make the actual API call (outside lock) with timeout guard. Not a
+        # `with` block: its exit would wait for a hung call to finish, so the
+        # timeout would never hand control back to the fallback chain.
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(model.generate_content, prompt)
+        try:
+            response = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            raise TimeoutError(
+                f"API call timed out after {timeout}s (caller={caller})"
+            )
+        finally:
+            executor.shutdown(wait=False)
 
         # Extract model name
         model_name = (
@@ -18,17 +18,27 @@ Features:
 import csv
 import os
 import re
+import sys
+import copy
 import json
 import ssl
+import logging
+import logging.handlers
+import functools
+import threading
+import traceback
 import urllib.request
 import requests
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from html import unescape
+from collections import Counter, deque
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass, field, asdict
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import time
+import fetch_failure_cache
 
 # Create SSL context that's more permissive for sites with strict SSL configs
 try:
@@ -37,14 +47,74 @@ try:
 except:
     SSL_CONTEXT = None
 
+# Only advertise content-encodings urllib3 can decode in this environment
+# (br needs brotli, zstd needs zstandard — see requirements files)
+try:
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Optional fast HTML parser for article bodies (falls back to BeautifulSoup)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None
+    HAS_SELECTOLAX = False
+
+
+# =============================================================================
+# LOGGING
+# =============================================================================
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler bound to the *current* sys.stdout (GUI/scheduler redirect it)."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Progress output is buffered and written in batches instead of one blocking
+# print() per line. Long loops flush after each URL/article/page so progress
+# still shows as it happens, and entry points flush on return.
+logger = logging.getLogger(__name__)
+_stdout_handler = _StdoutHandler()
+_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_buffer = logging.handlers.MemoryHandler(capacity=256, target=_stdout_handler)
+logger.addHandler(_log_buffer)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def _flushes_log(func):
+    """Flush buffered log output when a public entry point returns."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _log_buffer.flush()
+    return wrapper
+
 
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedItem:
-    """Represents a single extracted item from a source."""
+    """
+    Represents a single extracted item from a source.
+
+    Slotted (no per-instance __dict__) since batches can hold thousands of
+    items. custom_fields stays an ordered dict: its keys become CSV/Sheet
+    columns in insertion order and extractors may add arbitrary fields.
+    """
     title: str = ""
     url: str = ""
     original_url: str = ""  # Before redirect resolution
@@ -76,7 +146,9 @@ class ExtractionConfig:
     ])
     timeout: int = 10
     max_workers: int = 5
+    fast_mode: bool = False  # Regex-only article text (no DOM / content targeting)
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    cache_dir: str = ""  # Where fetch caches persist across runs (empty = in-memory only)
 
     # Fetch limiting
     fetch_limit: int = 0  # 0 = no limit
@@ -119,6 +191,8 @@ class ExtractionConfig:
             config.timeout = config_dict['timeout']
         if 'fetch_limit' in config_dict:
             config.fetch_limit = config_dict['fetch_limit']
+        if 'fast_mode' in config_dict:
+            config.fast_mode = config_dict['fast_mode']
 
         return config
 
@@ -195,7 +269,7 @@ class URLProcessor:
             self._redirect_cache[url] = final_url
             return final_url
         except Exception as e:
-            print(f"  [!] Could not resolve redirect for {url[:50]}...: {e}")
+            logger.warning(f"  [!] Could not resolve redirect for {url[:50]}...: {e}")
             return url
 
     def process_url(self, url: str) -> tuple[str, str]:
@@ -298,7 +372,7 @@ class BeehiivExtractor(BaseExtractor):
             return url
 
         # This is a homepage/archive URL — fetch it and find the latest post
-        print(f"    [Beehiiv] Archive page detected, finding latest newsletter post...")
+        logger.info(f"    [Beehiiv] Archive page detected, finding latest newsletter post...")
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
@@ -308,13 +382,13 @@ class BeehiivExtractor(BaseExtractor):
             resp.raise_for_status()
             latest_url = self._find_latest_post_url(resp.text, url)
             if latest_url:
-                print(f"    [Beehiiv] Latest post: {latest_url[:80]}...")
+                logger.info(f"    [Beehiiv] Latest post: {latest_url[:80]}...")
                 return latest_url
             else:
-                print(f"    [Beehiiv] No posts found on archive page, using original URL")
+                logger.info(f"    [Beehiiv] No posts found on archive page, using original URL")
                 return url
         except Exception as e:
-            print(f"    [Beehiiv] Error fetching archive: {e}")
+            logger.warning(f"    [Beehiiv] Error fetching archive: {e}")
             return url
 
     def get_archive_posts(self, base_url: str, since_date: str = None, on_progress=None) -> List[Dict[str, str]]:
@@ -678,7 +752,7 @@ class BeehiivExtractor(BaseExtractor):
             # Use separator=' ' to preserve word boundaries between elements
             text = parent_element.get_text(separator=' ', strip=True)
             # Normalize multiple spaces to single space
-            text = ' '.join(text.split())
+            text = _WS_RE.sub(' ', text)
             return text[:200]
         return ""
 
@@ -988,6 +1062,7 @@ class CSVManager:
     def __init__(self, config: ExtractionConfig):
         self.config = config
 
+    @_flushes_log
     def write_items(self, items: List[ExtractedItem], output_path: str,
                     custom_columns: List[str] = None) -> str:
         """
@@ -1002,7 +1077,7 @@ class CSVManager:
             Path to the written CSV file
         """
         if not items:
-            print("No items to write.")
+            logger.info("No items to write.")
             return output_path
 
         # Define the CANONICAL column order matching the user's sheet EXACTLY
@@ -1060,7 +1135,7 @@ class CSVManager:
                         row[col] = 'FALSE'
                 writer.writerow(row)
 
-        print(f"{'Appended' if mode == 'a' else 'Wrote'} {len(items)} items to {output_path}")
+        logger.info(f"{'Appended' if mode == 'a' else 'Wrote'} {len(items)} items to {output_path}")
         return output_path
 
     def _read_existing_columns(self, path: str) -> List[str]:
@@ -1072,6 +1147,7 @@ class CSVManager:
         except:
             return []
 
+    @_flushes_log
     def deduplicate(self, output_path: str, key_column: str = 'url') -> int:
         """Remove duplicate entries from CSV based on key column."""
         if not os.path.exists(output_path):
@@ -1099,11 +1175,104 @@ class CSVManager:
                 writer.writeheader()
                 writer.writerows(unique_rows)
 
-            print(f"Removed {duplicates} duplicate entries.")
+            logger.info(f"Removed {duplicates} duplicate entries.")
 
         return duplicates
 
 
+# =============================================================================
+# ARTICLE RESEARCH PATTERNS
+# =============================================================================
+
+# Simple capitalized names (4+ chars to avoid noise)
+_ENTITY_WORD_PATTERN = r'\b(?P<word>[A-Z][a-z]{3,})\b'
+
+# Entity candidates in an article's opening text, as one alternation so the
+# text is scanned once; each named group is one kind of entity name
+_ENTITY_RE = re.compile(
+    # Company/project names with suffixes
+    r'\b(?P<org>[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\s+(?:Labs?|Protocol|Network|Finance|Capital|Ventures|Fund|Foundation|Exchange|Wallet|DAO)\b'
+    # CamelCase names (like DeFi projects)
+    r'|\b(?P<camel>[A-Z][a-z]+[A-Z][a-z]+(?:[A-Z][a-z]*)*)\b'
+    # Names with crypto suffixes
+    r'|\b(?P<suffix>[A-Z][a-z]+(?:Fi|Swap|Dex|Pay|Lend|Stake|Mint|Chain|Layer|Bridge|Vault|Coin|Token))\b'
+    r'|' + _ENTITY_WORD_PATTERN
+)
+# Only org matches can contain other candidates: the capitalized words inside
+# them ("Uniswap" and "Labs" in "The Uniswap Labs"), which finditer skips
+_ENTITY_WORD_RE = re.compile(_ENTITY_WORD_PATTERN)
+
+
+# Priority ecosystems whose support is checked in every researched article
+_SUPPORT_ECOSYSTEMS = {
+    'Solana': ['solana', 'sol'],
+    'Starknet': ['starknet', 'strk'],
+    'USDT': ['usdt', 'tether']
+}
+
+# Positive support indicators (text near an ecosystem mention suggesting
+# actual support rather than a passing reference). These and the mention
+# patterns below are lowercase and case-sensitive: they run against the
+# article text lowercased once, which is cheaper than re.IGNORECASE
+_SUPPORT_INDICATOR_RE = re.compile('|'.join([
+    r'(?:launch|deploy|build|integrate|support|add|enable|live|available|expand)\w*\s+(?:on|to|for|with)',
+    r'(?:on|to|for|with)\s+\w*\s*(?:launch|deploy|integration|support)',
+    r'(?:native|built|powered)\s+(?:on|by)',
+    r'(?:chain|network|blockchain|ecosystem)',
+    r'(?:wallet|swap|bridge|dex|defi|nft)',
+]))
+
+# One alternation over every ecosystem's terms, one named group per ecosystem
+# (eco0, eco1, ...), so an article is scanned once for all of them
+_ECOSYSTEM_GROUPS = {f'eco{i}': ecosystem for i, ecosystem in enumerate(_SUPPORT_ECOSYSTEMS)}
+_ECOSYSTEM_MENTION_RE = re.compile(
+    '|'.join(
+        rf'\b(?P<eco{i}>' + '|'.join(re.escape(t) for t in terms) + r')\b'
+        for i, terms in enumerate(_SUPPORT_ECOSYSTEMS.values())
+    )
+)
+# Plain lowercase terms for a str.find prefilter before running the regex
+_ECOSYSTEM_TERMS = tuple(t for terms in _SUPPORT_ECOSYSTEMS.values() for t in terms)
+_SUPPORT_CONTEXT_CHARS = 100  # Context checked before/after each mention
+
+# Research failure comments, picked by the first key found in the lowercased
+# error message ({url} is the truncated article URL)
+_RESEARCH_ERROR_COMMENTS = [
+    (('timeout',), "Timeout: {url}... took too long"),
+    (('connection', 'refused'), "Connection error: Could not reach {url}..."),
+    (('403', '401'), "Access denied: {url}... requires auth"),
+    (('404',), "Not found: {url}... may be deleted"),
+    (('unpack',), "Parse error: Data format issue in article text"),
+]
+
+# Article body extraction: elements that are never article content, class/id
+# fragments of "related articles"-style blocks, and common content containers
+_NON_CONTENT_TAGS = ['script', 'style', 'nav', 'footer', 'header',
+                     'aside', 'iframe', 'noscript', 'form']
+_RELATED_PATTERNS = [
+    'related', 'recommended', 'more-stories', 'more-articles',
+    'also-read', 'you-may-like', 'trending', 'popular',
+    'sidebar', 'widget', 'advertisement', 'ad-container',
+    'social-share', 'comments', 'newsletter', 'subscribe'
+]
+_CONTENT_CLASSES = ['article-content', 'article-body', 'post-content',
+                    'entry-content', 'story-body', 'article__body',
+                    'content-body', 'main-content', 'article-text']
+
+# The same rules as CSS selectors (one tree walk each instead of one per pattern)
+_RELATED_SELECTOR = ','.join(f'[class*="{p}" i],[id*="{p}" i]' for p in _RELATED_PATTERNS)
+_CONTENT_CLASS_SELECTOR = ','.join(f'[class*="{c}" i]' for c in _CONTENT_CLASSES)
+
+# Regex-only fast path (ExtractionConfig.fast_mode): strip non-content blocks,
+# then all tags, then collapse whitespace — no DOM is built
+_BLOCK_STRIP_RE = re.compile(
+    r'<(' + '|'.join(_NON_CONTENT_TAGS) + r')\b[^>]*>.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')  # Also used for whitespace cleanup on every text path
+
+
 # =============================================================================
 # MAIN PROCESSOR
 # =============================================================================
@@ -1147,6 +1316,18 @@ class DataCSVProcessor:
 
         # Source-specific custom instructions
         self.source_instructions: Dict[str, Dict] = {}
+        self._source_patterns: List[tuple] = []  # (lowercased pattern, instructions)
+
+        # Domain-based extractor lookups, keyed by netloc
+        self._extractor_cache: Dict[str, Optional[BaseExtractor]] = {}
+
+        # URLs that failed every fetch method, skipped until their backoff expires
+        self._failure_cache = fetch_failure_cache.load_cache(self.config.cache_dir)
+        self._failure_lock = threading.Lock()
+
+        # Per-host fetch limits for concurrent article research
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_lock = threading.Lock()
 
     def register_source_instructions(self, domain_pattern: str, instructions: Dict):
         """
@@ -1157,15 +1338,17 @@ class DataCSVProcessor:
             instructions: Dictionary of extraction instructions
         """
         self.source_instructions[domain_pattern] = instructions
+        self._source_patterns = [(p.lower(), instr) for p, instr in self.source_instructions.items()]
 
     def _get_instructions_for_url(self, url: str, custom_instructions: Dict = None) -> Dict:
         """Get combined instructions for a URL."""
         combined = {}
 
-        # Check registered source instructions
-        parsed = urlparse(url)
-        for pattern, instructions in self.source_instructions.items():
-            if pattern.lower() in parsed.netloc.lower() or pattern.lower() in url.lower():
+        # Check registered source instructions (the netloc is part of the URL,
+        # so a substring check on the lowercased URL covers both)
+        url_lower = url.lower()
+        for pattern, instructions in self._source_patterns:
+            if pattern in url_lower:
                 combined.update(instructions)
                 break
 
@@ -1175,17 +1358,65 @@ class DataCSVProcessor:
 
         return combined
 
-    # Max HTML size to load into memory (10MB) — prevents OOM on 512MB servers
-    MAX_RESPONSE_SIZE = 10 * 1024 * 1024
+    # Max HTML size to load into memory (2MB) — prevents OOM on 512MB servers.
+    # Bodies are streamed and cut off at this size rather than read in full.
+    MAX_RESPONSE_SIZE = 2 * 1024 * 1024
+    FETCH_CHUNK_SIZE = 64 * 1024
+
+    def _read_capped(self, response) -> str:
+        """Stream a requests response body, stopping once MAX_RESPONSE_SIZE is reached."""
+        chunks = []
+        total = 0
+        try:
+            for chunk in response.iter_content(self.FETCH_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= self.MAX_RESPONSE_SIZE:
+                    logger.warning(f"    [!] Response body over {self.MAX_RESPONSE_SIZE // 1024 // 1024}MB, truncating")
+                    break
+        finally:
+            response.close()
+
+        body = b"".join(chunks)[:self.MAX_RESPONSE_SIZE]
+        try:
+            return body.decode(response.encoding or 'utf-8', errors='ignore')
+        except LookupError:
+            return body.decode('utf-8', errors='ignore')
 
     def _fetch_content(self, url: str) -> str:
+        """
+        Fetch HTML content from URL, skipping URLs that failed recently.
+
+        A URL where every fetch method fails is backed off exponentially
+        (see fetch_failure_cache) and cleared again on the next success.
+        """
+        with self._failure_lock:
+            if fetch_failure_cache.should_skip(self._failure_cache, url):
+                logger.info(f"    [*] Skipping recently failed URL: {url[:60]}...")
+                return ""
+
+        html = self._fetch_uncached(url)
+
+        with self._failure_lock:
+            if html:
+                changed = fetch_failure_cache.clear_failure(self._failure_cache, url)
+            else:
+                entry = fetch_failure_cache.record_failure(self._failure_cache, url)
+                logger.warning(f"    [!] All fetch methods failed, retry in {int(entry['next_retry_at'] - time.time())}s")
+                changed = True
+            if changed:
+                fetch_failure_cache.save_cache(self.config.cache_dir, self._failure_cache)
+
+        return html
+
+    def _fetch_uncached(self, url: str) -> str:
         """Fetch HTML content from URL with multiple fallback methods."""
         # Browser-like headers to bypass bot detection
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -1206,31 +1437,24 @@ class DataCSVProcessor:
                 stream=True
             )
             response.raise_for_status()
-            # Guard against huge responses (OOM on 512MB servers)
-            content_len = response.headers.get('content-length')
-            if content_len and int(content_len) > self.MAX_RESPONSE_SIZE:
-                print(f"    [!] Response too large ({int(content_len) // 1024 // 1024}MB), skipping")
-                response.close()
-                return ""
-            text = response.text
-            if len(text) > self.MAX_RESPONSE_SIZE:
-                print(f"    [!] Response body too large ({len(text) // 1024 // 1024}MB), truncating")
-                text = text[:self.MAX_RESPONSE_SIZE]
-            return text
+            return self._read_capped(response)
         except Exception as e:
-            print(f"    [!] requests failed: {e}")
+            logger.warning(f"    [!] requests failed: {e}")
+
+        # urllib does not decompress response bodies, so ask for them uncompressed
+        headers['Accept-Encoding'] = 'identity'
 
         # Method 2: Try urllib with custom SSL context
         try:
             req = urllib.request.Request(url, headers=headers)
             if SSL_CONTEXT:
                 with urllib.request.urlopen(req, timeout=self.config.timeout, context=SSL_CONTEXT) as response:
-                    return response.read().decode('utf-8', errors='ignore')
+                    return response.read(self.MAX_RESPONSE_SIZE).decode('utf-8', errors='ignore')
             else:
                 with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                    return response.read().decode('utf-8', errors='ignore')
+                    return response.read(self.MAX_RESPONSE_SIZE).decode('utf-8', errors='ignore')
         except Exception as e:
-            print(f"    [!] urllib failed: {e}")
+            logger.warning(f"    [!] urllib failed: {e}")
 
         # Method 3: Try with no SSL verification
         try:
@@ -1240,9 +1464,9 @@ class DataCSVProcessor:
             no_verify_ctx.verify_mode = ssl.CERT_NONE
             req = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(req, timeout=self.config.timeout, context=no_verify_ctx) as response:
-                return response.read().decode('utf-8', errors='ignore')
+                return response.read(self.MAX_RESPONSE_SIZE).decode('utf-8', errors='ignore')
         except Exception as e:
-            print(f"    [!] SSL bypass failed: {e}")
+            logger.warning(f"    [!] SSL bypass failed: {e}")
 
         # All direct fetch methods failed
         return ""
@@ -1259,7 +1483,7 @@ class DataCSVProcessor:
             if len(search_query) < 10:
                 return ""
 
-            print(f"    [*] Searching for article: {search_query[:50]}...")
+            logger.info(f"    [*] Searching for article: {search_query[:50]}...")
 
             # Search DuckDuckGo HTML
             search_url = f"https://html.duckduckgo.com/html/?q={urllib.parse.quote(search_query + ' crypto news')}"
@@ -1269,8 +1493,9 @@ class DataCSVProcessor:
             }
 
             req = urllib.request.Request(search_url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                search_html = response.read().decode('utf-8', errors='ignore')
+            with self._host_semaphore(search_url):
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    search_html = response.read(self.MAX_RESPONSE_SIZE).decode('utf-8', errors='ignore')
 
             # Parse search results (try lxml, fall back to html.parser)
             try:
@@ -1289,15 +1514,10 @@ class DataCSVProcessor:
                 # DuckDuckGo returns redirect URLs like //duckduckgo.com/l/?uddg=https%3A...
                 # Extract the actual URL from the uddg parameter
                 if 'uddg=' in raw_url:
-                    try:
-                        parsed = urllib.parse.urlparse(raw_url)
-                        params = urllib.parse.parse_qs(parsed.query)
-                        if 'uddg' in params:
-                            result_url = urllib.parse.unquote(params['uddg'][0])
-                        else:
-                            continue
-                    except Exception:
+                    encoded = raw_url.partition('uddg=')[2].split('&', 1)[0]
+                    if not encoded:
                         continue
+                    result_url = urllib.parse.unquote(encoded)
                 elif raw_url.startswith('http'):
                     result_url = raw_url
                 else:
@@ -1310,29 +1530,42 @@ class DataCSVProcessor:
                 # Try to fetch this alternative source
                 try:
                     alt_req = urllib.request.Request(result_url, headers=headers)
-                    with urllib.request.urlopen(alt_req, timeout=10) as alt_response:
-                        alt_html = alt_response.read().decode('utf-8', errors='ignore')
+                    with self._host_semaphore(result_url):
+                        with urllib.request.urlopen(alt_req, timeout=10) as alt_response:
+                            alt_html = alt_response.read(self.MAX_RESPONSE_SIZE).decode('utf-8', errors='ignore')
 
                     # Extract article body
                     alt_text = self._extract_article_body(alt_html)
                     if alt_text and len(alt_text) > 200:
-                        print(f"    [*] Found alternative: {result_domain}")
+                        logger.info(f"    [*] Found alternative: {result_domain}")
                         return alt_text
 
                 except Exception:
                     continue
 
-            print(f"    [!] No accessible alternative sources found")
+            logger.warning(f"    [!] No accessible alternative sources found")
             return ""
 
         except Exception as e:
-            print(f"    [!] Web search failed: {e}")
+            logger.warning(f"    [!] Web search failed: {e}")
             return ""
 
     def _get_extractor(self, url: str) -> BaseExtractor:
         """Get the appropriate extractor for a URL."""
+        # Domain-based extractors (Beehiiv, Telegram) are registered ahead of the
+        # path-based ones and only look at the host, so memoize them per netloc
+        netloc = urlparse(url).netloc
+        if netloc not in self._extractor_cache:
+            self._extractor_cache[netloc] = next(
+                (e for e in self.extractors if e.supported_domains and e.can_handle(url)),
+                None
+            )
+        extractor = self._extractor_cache[netloc]
+        if extractor:
+            return extractor
+
         for extractor in self.extractors:
-            if extractor.can_handle(url):
+            if not extractor.supported_domains and extractor.can_handle(url):
                 return extractor
         return self.extractors[-1]  # Generic fallback
 
@@ -1486,17 +1719,19 @@ class DataCSVProcessor:
                             pass
 
                 if oldest_item_date and oldest_item_date < target_start:
-                    print(f"    Reached target date range at page {pages_fetched}")
+                    logger.info(f"    Reached target date range at page {pages_fetched}")
                     break
 
             # If no date filtering needed, just get first page
             if not need_older:
                 break
 
-            print(f"    Page {pages_fetched}: {len(new_items)} new items (total: {len(all_items)})")
+            logger.info(f"    Page {pages_fetched}: {len(new_items)} new items (total: {len(all_items)})")
+            _log_buffer.flush()  # Show progress per page
 
         return all_items
 
+    @_flushes_log
     def process_url(self, url: str, custom_instructions: Dict = None) -> List[ExtractedItem]:
         """
         Process a single URL and extract items.
@@ -1508,54 +1743,72 @@ class DataCSVProcessor:
         Returns:
             List of ExtractedItem objects
         """
-        print(f"\n[*] Processing: {url[:80]}...")
+        return self._process_url(url, custom_instructions)
 
-        # Get appropriate extractor
-        extractor = self._get_extractor(url)
-        print(f"    Using extractor: {extractor.name}")
+    def _plan_fetch(self, url: str) -> tuple:
+        """
+        Pick the extractor for a URL and the URL to fetch.
 
+        Returns:
+            (extractor, fetch_url, paginated) - paginated is True when the
+            source is walked page by page instead of fetched once
+        """
+        extractor = self._get_extractor(url)
         # Allow extractor to preprocess URL (e.g., Telegram t.me/x -> t.me/s/x)
         fetch_url = extractor.preprocess_url(url)
+        paginated = extractor.name == "telegram" and bool(self.config.start_date)
+        return extractor, fetch_url, paginated
+
+    def _process_url(self, url: str, custom_instructions: Dict = None,
+                     plan: tuple = None, prefetched: Future = None) -> List[ExtractedItem]:
+        """Body of process_url; plan is the url's _plan_fetch result if already
+        computed, prefetched a pending _fetch_content of its fetch_url."""
+        logger.info(f"\n[*] Processing: {url[:80]}...")
+
+        # Get appropriate extractor
+        extractor, fetch_url, paginated = plan or self._plan_fetch(url)
+        logger.info(f"    Using extractor: {extractor.name}")
         if fetch_url != url:
-            print(f"    Normalized URL: {fetch_url[:60]}...")
+            logger.info(f"    Normalized URL: {fetch_url[:60]}...")
 
         # Get combined instructions
         instructions = self._get_instructions_for_url(url, custom_instructions)
 
         # Special handling for Telegram with date range - use pagination
-        if extractor.name == "telegram" and self.config.start_date:
-            print(f"    Fetching historical messages (date range specified)...")
+        if paginated:
+            logger.info(f"    Fetching historical messages (date range specified)...")
             items = self._process_telegram_with_pagination(fetch_url, extractor, instructions)
-            print(f"    Total extracted: {len(items)} items")
+            logger.info(f"    Total extracted: {len(items)} items")
         else:
             # Standard single-page extraction
-            html = self._fetch_content(fetch_url)
+            html = prefetched.result() if prefetched else self._fetch_content(fetch_url)
             if not html:
                 return []
             items = extractor.extract(fetch_url, html, instructions)
-            print(f"    Extracted {len(items)} items")
+            logger.info(f"    Extracted {len(items)} items")
 
         # Apply date filtering
         if self.config.start_date or self.config.end_date:
             original_count = len(items)
             items = self._filter_by_date(items)
             if len(items) != original_count:
-                print(f"    Date filtered: {len(items)} items (from {original_count})")
+                logger.info(f"    Date filtered: {len(items)} items (from {original_count})")
 
         # Apply fetch limit
         if self.config.fetch_limit > 0:
             original_count = len(items)
             items = self._apply_fetch_limit(items)
             if len(items) != original_count:
-                print(f"    Limited to: {len(items)} items")
+                logger.info(f"    Limited to: {len(items)} items")
 
         # Resolve redirects in parallel for speed
         if self.config.resolve_redirects and items:
-            print(f"    Resolving redirects...")
+            logger.info(f"    Resolving redirects...")
             self._resolve_redirects_parallel(items)
 
         return items
 
+    @_flushes_log
     def process_urls(self, urls: List[str], custom_instructions: Dict = None) -> List[ExtractedItem]:
         """
         Process multiple URLs and combine results.
@@ -1566,13 +1819,44 @@ class DataCSVProcessor:
 
         Returns:
             Combined list of ExtractedItem objects
+
+        Pages are fetched ahead on a thread pool while earlier ones are
+        extracted; results keep the order of urls.
         """
         all_items = []
-        for url in urls:
-            items = self.process_url(url, custom_instructions)
-            all_items.extend(items)
+        if len(urls) < 2:
+            for url in urls:
+                all_items.extend(self._process_url(url, custom_instructions))
+            return all_items
+
+        # Bounded fetch-ahead window so at most this many pages sit in memory
+        window = self.config.max_workers * 2
+        pending = deque()
+        url_iter = iter(urls)
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            def submit_next() -> bool:
+                url = next(url_iter, None)
+                if url is None:
+                    return False
+                # Planned once: preprocess_url may itself fetch (Beehiiv archives)
+                plan = self._plan_fetch(url)
+                _, fetch_url, paginated = plan
+                future = None if paginated else executor.submit(self._fetch_content, fetch_url)
+                pending.append((url, plan, future))
+                return True
+
+            while len(pending) < window and submit_next():
+                pass
+            while pending:
+                url, plan, future = pending.popleft()
+                submit_next()
+                all_items.extend(self._process_url(url, custom_instructions,
+                                                   plan=plan, prefetched=future))
+                _log_buffer.flush()  # Show progress per URL
         return all_items
 
+    @_flushes_log
     def process_html(self, html: str, source_url: str = "",
                      custom_instructions: Dict = None) -> List[ExtractedItem]:
         """
@@ -1586,28 +1870,29 @@ class DataCSVProcessor:
         Returns:
             List of ExtractedItem objects
         """
-        print(f"\n[*] Processing HTML content...")
+        logger.info(f"\n[*] Processing HTML content...")
         if source_url:
-            print(f"    Source: {source_url[:80]}")
+            logger.info(f"    Source: {source_url[:80]}")
 
         # Get appropriate extractor
         extractor = self._get_extractor(source_url) if source_url else self.extractors[-1]
-        print(f"    Using extractor: {extractor.name}")
+        logger.info(f"    Using extractor: {extractor.name}")
 
         # Get combined instructions
         instructions = self._get_instructions_for_url(source_url, custom_instructions) if source_url else custom_instructions
 
         # Extract items
         items = extractor.extract(source_url, html, instructions)
-        print(f"    Extracted {len(items)} items")
+        logger.info(f"    Extracted {len(items)} items")
 
         # Resolve redirects in parallel for speed
         if self.config.resolve_redirects and items:
-            print(f"    Resolving redirects...")
+            logger.info(f"    Resolving redirects...")
             self._resolve_redirects_parallel(items)
 
         return items
 
+    @_flushes_log
     def process_file(self, file_path: str, source_url: str = "",
                      custom_instructions: Dict = None) -> List[ExtractedItem]:
         """
@@ -1621,13 +1906,13 @@ class DataCSVProcessor:
         Returns:
             List of ExtractedItem objects
         """
-        print(f"\n[*] Processing file: {file_path}")
+        logger.info(f"\n[*] Processing file: {file_path}")
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 html = f.read()
             return self.process_html(html, source_url, custom_instructions)
         except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
+            logger.warning(f"Error reading file {file_path}: {e}")
             return []
 
     def _resolve_redirects_parallel(self, items: List[ExtractedItem]):
@@ -1653,6 +1938,7 @@ class DataCSVProcessor:
                 except Exception as e:
                     pass  # Keep original URL on error
 
+    @_flushes_log
     def save_to_csv(self, items: List[ExtractedItem], output_path: str,
                     custom_columns: List[str] = None) -> str:
         """
@@ -1668,6 +1954,7 @@ class DataCSVProcessor:
         """
         return self.csv_manager.write_items(items, output_path, custom_columns)
 
+    @_flushes_log
     def enrich_with_grid(self, items: List[ExtractedItem], api_key: str = None, debug: bool = False) -> List[ExtractedItem]:
         """
         Enrich extracted items with The Grid API data.
@@ -1692,50 +1979,56 @@ class DataCSVProcessor:
         try:
             from grid_api import GridEntityMatcher
         except ImportError:
-            print("  [!] Grid API module not available")
+            logger.warning("  [!] Grid API module not available")
             return items
 
-        print(f"\n[*] Enriching {len(items)} items with Grid data...")
+        logger.info(f"\n[*] Enriching {len(items)} items with Grid data...")
 
         matcher = GridEntityMatcher(api_key=api_key)
 
-        for i, item in enumerate(items):
-            # Combine title + description for matching
-            full_text = f"{item.title} {item.description}"
-
-            if debug:
-                print(f"\n  [{i+1}] DEBUG:")
-                print(f"       Title: {item.title[:60]}...")
-                print(f"       Description: {item.description[:60]}..." if item.description else "       Description: (empty)")
-                # Show extracted keywords
-                keywords = matcher.extract_keywords(full_text)
-                print(f"       Keywords: {keywords}")
-
-            match = matcher.match_entity(item.title, item.url, item.description)
-
-            # Add Grid data to custom_fields
-            grid_data = match.to_dict()
-            for key, value in grid_data.items():
-                item.custom_fields[key] = value
-
-            if match.matched:
-                # Show all matched subjects
-                subjects = ", ".join(m.name for m in match.matches[:3])  # Show top 3
-                extra = f" (+{len(match.matches)-3} more)" if len(match.matches) > 3 else ""
-                conf = match.primary.confidence if match.primary else 0
-                print(f"  [{i+1}] ✓ {item.title[:40]}... → {subjects}{extra} (conf: {conf:.2f})")
-            else:
-                # Show why it didn't match
+        # Each match issues several Grid API queries; overlap them across items
+        def match_item(index_item):
+            i, item = index_item
+            return i, matcher.match_entity(item.title, item.url, item.description)
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = [executor.submit(match_item, index_item) for index_item in enumerate(items)]
+            for future in as_completed(futures):
+                i, match = future.result()
+                item = items[i]
+
                 if debug:
-                    print(f"       No match found (no keywords or low confidence)")
+                    logger.info(f"\n  [{i+1}] DEBUG:")
+                    logger.info(f"       Title: {item.title[:60]}...")
+                    logger.info(f"       Description: {item.description[:60]}..." if item.description else "       Description: (empty)")
+                    # Show extracted keywords
+                    keywords = matcher.extract_keywords(f"{item.title} {item.description}")
+                    logger.info(f"       Keywords: {keywords}")
+
+                # Add Grid data to custom_fields
+                grid_data = match.to_dict()
+                for key, value in grid_data.items():
+                    item.custom_fields[key] = value
+
+                if match.matched:
+                    # Show all matched subjects
+                    subjects = ", ".join(m.name for m in match.matches[:3])  # Show top 3
+                    extra = f" (+{len(match.matches)-3} more)" if len(match.matches) > 3 else ""
+                    conf = match.primary.confidence if match.primary else 0
+                    logger.info(f"  [{i+1}] ✓ {item.title[:40]}... → {subjects}{extra} (conf: {conf:.2f})")
                 else:
-                    print(f"  [{i+1}] ✗ {item.title[:40]}...")
+                    # Show why it didn't match
+                    if debug:
+                        logger.info(f"       No match found (no keywords or low confidence)")
+                    else:
+                        logger.info(f"  [{i+1}] ✗ {item.title[:40]}...")
 
         matched_count = sum(1 for item in items if item.custom_fields.get("grid_matched"))
-        print(f"\n[*] Matched {matched_count}/{len(items)} items to Grid entities")
+        logger.info(f"\n[*] Matched {matched_count}/{len(items)} items to Grid entities")
 
         return items
 
+    @_flushes_log
     def research_articles(self, items: List[ExtractedItem],
                           categories: List[str] = None,
                           search_terms: List[str] = None,
@@ -1777,10 +2070,9 @@ class DataCSVProcessor:
         # Normalize categories for comparison
         categories_lower = [c.lower() for c in categories]
 
-        # Build regex pattern for efficient searching
+        # Build regex pattern for efficient searching (matched against lowercased text)
         pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in search_terms) + r')\b',
-            re.IGNORECASE
+            r'\b(' + '|'.join(re.escape(term.lower()) for term in search_terms) + r')\b'
         )
 
         # Filter items to research
@@ -1810,297 +2102,293 @@ class DataCSVProcessor:
 
         if not items_to_research:
             scope = "all categories" if all_items else f"categories: {categories}"
-            print(f"\n[*] No items to research ({scope})")
+            logger.info(f"\n[*] No items to research ({scope})")
             return items
 
         scope_msg = "all items" if all_items else f"categories: {', '.join(categories)}"
-        print(f"\n[*] Researching {len(items_to_research)} articles ({scope_msg}) for mentions of: {', '.join(search_terms)}")
+        logger.info(f"\n[*] Researching {len(items_to_research)} articles ({scope_msg}) for mentions of: {', '.join(search_terms)}")
 
-        # Import Grid matcher once
+        # Import Grid matcher once; workers get the class, or None without Grid
         try:
             from grid_api import GridEntityMatcher
-            grid_available = True
         except ImportError:
-            grid_available = False
+            GridEntityMatcher = None
 
-        for i, item in enumerate(items_to_research):
-            try:
-                print(f"  [{i+1}/{len(items_to_research)}] Fetching: {item.url[:60]}...")
+        total = len(items_to_research)
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = [
+                executor.submit(self._research_one, item, f"{i+1}/{total}",
+                                pattern, GridEntityMatcher, api_key)
+                for i, item in enumerate(items_to_research)
+            ]
+            for future in as_completed(futures):
+                future.result()
+                _log_buffer.flush()  # Show progress per article
+
+        researched_count = sum(1 for item in items_to_research if 'comments' in item.custom_fields)
+        logger.info(f"\n[*] Researched {researched_count}/{len(items_to_research)} articles")
+
+        return items
 
-                # Fetch article content
+    # Concurrent article fetches allowed against a single host
+    MAX_FETCHES_PER_HOST = 2
+
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        """Return the shared semaphore limiting concurrent fetches to url's host."""
+        host = urlparse(url).netloc.lower()
+        with self._host_lock:
+            sem = self._host_semaphores.get(host)
+            if sem is None:
+                sem = self._host_semaphores[host] = threading.Semaphore(self.MAX_FETCHES_PER_HOST)
+            return sem
+
+    def _research_one(self, item: ExtractedItem, position: str, pattern: re.Pattern,
+                      grid_matcher_cls: Optional[type], api_key: str = None):
+        """
+        Research a single article and set item.custom_fields['comments'].
+
+        Runs on a research worker thread; only touches its own item.
+        """
+        try:
+            logger.info(f"  [{position}] Fetching: {item.url[:60]}...")
+
+            # Fetch article content (at most MAX_FETCHES_PER_HOST at once per host)
+            with self._host_semaphore(item.url):
                 html = self._fetch_content(item.url)
-                article_text = ""
-
-                if html:
-                    # Extract ONLY the main article body (avoid related articles, sidebars, etc.)
-                    article_text = self._extract_article_body(html)
-
-                # If direct fetch failed or extracted nothing, try web search fallback
-                if not article_text or len(article_text) < 100:
-                    # Use the item description as search query
-                    search_query = item.description if item.description else item.title
-                    article_text = self._web_search_fallback(search_query, item.url)
-
-                if not article_text or len(article_text) < 100:
-                    # Provide more detail about fetch failure
-                    if not html:
-                        item.custom_fields['comments'] = f"Fetch failed: Could not retrieve {item.url[:40]}..."
-                    else:
-                        item.custom_fields['comments'] = f"Parse failed: No article body extracted (got {len(article_text) if article_text else 0} chars)"
-                    print(f"       → {item.custom_fields['comments']}")
-                    continue
+            article_text = ""
+
+            if html:
+                # Extract ONLY the main article body (avoid related articles, sidebars, etc.)
+                article_text = self._extract_article_body(html)
+
+            # If direct fetch failed or extracted nothing, try web search fallback
+            if not article_text or len(article_text) < 100:
+                # Use the item description as search query
+                search_query = item.description if item.description else item.title
+                article_text = self._web_search_fallback(search_query, item.url)
+
+            if not article_text or len(article_text) < 100:
+                # Provide more detail about fetch failure
+                if not html:
+                    item.custom_fields['comments'] = f"Fetch failed: Could not retrieve {item.url[:40]}..."
+                else:
+                    item.custom_fields['comments'] = f"Parse failed: No article body extracted (got {len(article_text) if article_text else 0} chars)"
+                logger.info(f"       → {item.custom_fields['comments']}")
+                return
 
-                comments = []
-                found_ecosystem_terms = []
-                entities_mentioned = []  # Track all entities for user verification
+            # Lowercased once for every case-insensitive scan below. Offsets
+            # map back to article_text unless lowering changed the length.
+            article_lower = article_text.lower()
+            display_text = article_text if len(article_lower) == len(article_text) else article_lower
 
-                # 1. Search for priority ecosystem mentions
-                try:
-                    mentions = pattern.findall(article_text)
-                    if mentions:
-                        term_counts = {}
-                        for term in mentions:
-                            # Handle both string and tuple results from regex
-                            if isinstance(term, tuple):
-                                term = term[0] if len(term) > 0 else ''
-                            if term and isinstance(term, str):
-                                term_title = term.strip().title()
-                                if term_title:
-                                    term_counts[term_title] = term_counts.get(term_title, 0) + 1
-                                    found_ecosystem_terms.append(term_title)
-
-                        if term_counts:
-                            # Sort by count descending and format for display
-                            sorted_terms = sorted(term_counts.items(), key=lambda x: x[1], reverse=True)
-                            comment_parts = [f"{name} ({count}x)" for name, count in sorted_terms]
-                            if comment_parts:
-                                comments.append(f"Mentions: {', '.join(comment_parts)}")
-                except Exception as regex_err:
-                    print(f"    [!] Regex error: {regex_err}")
-
-                # 2. Extract the MAIN SUBJECT of the article (company/project being discussed)
-                # This is critical for articles about entities NOT in Grid
-                main_subject = None
-                try:
-                    # Look for the main subject in common article patterns
-                    subject_patterns = [
-                        # "X raises/secures/closes $Y" pattern (very common for funding news)
-                        r'\b([A-Z][a-z]+(?:[A-Z][a-z]*)*)\s+(?:raises?|secures?|closes?|announces?|launches?|unveils?)\b',
-                        # "startup X" or "company X" pattern
-                        r'\b(?:startup|company|protocol|platform|exchange|wallet|project)\s+([A-Z][a-z]+(?:[A-Z][a-z]*)*)\b',
-                        # "X, a/the startup/company" pattern
-                        r'\b([A-Z][a-z]+(?:[A-Z][a-z]*)*),?\s+(?:a|the)\s+(?:startup|company|protocol|platform)\b',
-                    ]
-
-                    for sp in subject_patterns:
-                        subject_match = re.search(sp, article_text[:500], re.IGNORECASE)
-                        if subject_match:
-                            candidate = subject_match.group(1)
-                            # Verify it's not a common word
-                            if candidate and len(candidate) > 2 and candidate.lower() not in ['the', 'this', 'that', 'which', 'their']:
-                                main_subject = candidate
-                                break
-                except Exception:
-                    pass
+            comments = []  # (label, value) pairs, joined once at the end
+            found_ecosystem_terms = []
+            entities_mentioned = []  # Track all entities for user verification
 
-                # 3. Extract other entities mentioned in article for user verification
-                try:
-                    entity_patterns = [
-                        # Company/project names with suffixes
-                        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\s+(?:Labs?|Protocol|Network|Finance|Capital|Ventures|Fund|Foundation|Exchange|Wallet|DAO)\b',
-                        # CamelCase names (like DeFi projects)
-                        r'\b([A-Z][a-z]+[A-Z][a-z]+(?:[A-Z][a-z]*)*)\b',
-                        # Names with crypto suffixes
-                        r'\b([A-Z][a-z]+(?:Fi|Swap|Dex|Pay|Lend|Stake|Mint|Chain|Layer|Bridge|Vault|Coin|Token))\b',
-                        # Simple capitalized names (4+ chars to avoid noise)
-                        r'\b([A-Z][a-z]{3,})\b',
-                    ]
-
-                    found_entities = set()
-                    for ep in entity_patterns:
-                        matches = re.findall(ep, article_text[:2000])
-                        for m in matches:
-                            if isinstance(m, tuple):
-                                m = m[0]
-                            if m and len(m) > 3:
-                                found_entities.add(m)
-
-                    # Filter out common words
-                    common_words = {
-                        'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
-                        'January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
-                        'September', 'October', 'November', 'December', 'CEO', 'CTO', 'CFO', 'COO',
-                        'The', 'This', 'That', 'They', 'Their', 'There', 'These', 'Those',
-                        'With', 'From', 'Into', 'About', 'After', 'Before', 'During', 'Through',
-                        'However', 'According', 'While', 'Although', 'Because', 'Since', 'Until',
-                        'Read', 'More', 'Also', 'Other', 'Some', 'Most', 'Many', 'Much', 'Such',
-                        'New', 'First', 'Last', 'Next', 'Year', 'Years', 'Month', 'Week', 'Day'
-                    }
-                    entities_mentioned = [e for e in found_entities if e not in common_words]
-
-                    # Add main subject at the beginning if found
-                    if main_subject and main_subject not in entities_mentioned:
-                        entities_mentioned.insert(0, main_subject)
-                    elif main_subject:
-                        # Move main subject to front
-                        entities_mentioned.remove(main_subject)
-                        entities_mentioned.insert(0, main_subject)
-
-                    entities_mentioned = entities_mentioned[:8]  # Limit to 8
-                except Exception as ent_err:
-                    print(f"    [!] Entity extraction error: {ent_err}")
-                    entities_mentioned = []
-                    if main_subject:
-                        entities_mentioned = [main_subject]
-
-                # 4. Try Grid matching - first on ecosystem terms found, then on keywords
-                if grid_available:
-                    article_matcher = GridEntityMatcher()
-                    best_match = None
-
-                    # Priority: Match ecosystem terms directly (Solana, Tether, Starknet)
-                    for eco_term in set(found_ecosystem_terms):
-                        match = article_matcher.match_entity(eco_term, item.url, article_text[:200])
-                        if match.matched and match.primary and match.primary.confidence >= 0.7:
+            # 1. Search for priority ecosystem mentions
+            try:
+                # Count straight off finditer; no list of every match is built
+                term_counts = Counter(m.group(1).title() for m in pattern.finditer(article_lower))
+                if term_counts:
+                    # Sort by count descending and format for display
+                    sorted_terms = term_counts.most_common()
+                    found_ecosystem_terms = [name for name, _ in sorted_terms]
+                    comment_parts = [f"{name} ({count}x)" for name, count in sorted_terms]
+                    comments.append(("Mentions", ', '.join(comment_parts)))
+            except Exception as regex_err:
+                logger.warning(f"    [!] Regex error: {regex_err}")
+
+            # 2. Extract the MAIN SUBJECT of the article (company/project being discussed)
+            # This is critical for articles about entities NOT in Grid
+            main_subject = None
+            try:
+                # Look for the main subject in common article patterns
+                subject_patterns = [
+                    # "X raises/secures/closes $Y" pattern (very common for funding news)
+                    r'\b([A-Z][a-z]+(?:[A-Z][a-z]*)*)\s+(?:raises?|secures?|closes?|announces?|launches?|unveils?)\b',
+                    # "startup X" or "company X" pattern
+                    r'\b(?:startup|company|protocol|platform|exchange|wallet|project)\s+([A-Z][a-z]+(?:[A-Z][a-z]*)*)\b',
+                    # "X, a/the startup/company" pattern
+                    r'\b([A-Z][a-z]+(?:[A-Z][a-z]*)*),?\s+(?:a|the)\s+(?:startup|company|protocol|platform)\b',
+                ]
+
+                for sp in subject_patterns:
+                    subject_match = re.search(sp, article_text[:500], re.IGNORECASE)
+                    if subject_match:
+                        candidate = subject_match.group(1)
+                        # Verify it's not a common word
+                        if candidate and len(candidate) > 2 and candidate.lower() not in ['the', 'this', 'that', 'which', 'their']:
+                            main_subject = candidate
+                            break
+            except Exception:
+                pass
+
+            # 3. Extract other entities mentioned in article for user verification
+            try:
+                found_entities = set()
+                for m in _ENTITY_RE.finditer(article_text, 0, 2000):
+                    entity = m.group(m.lastgroup)
+                    if entity and len(entity) > 3:
+                        found_entities.add(entity)
+                    if m.lastgroup == 'org':
+                        found_entities.update(_ENTITY_WORD_RE.findall(article_text, m.start(), m.end()))
+
+                # Filter out common words
+                common_words = {
+                    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
+                    'January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
+                    'September', 'October', 'November', 'December', 'CEO', 'CTO', 'CFO', 'COO',
+                    'The', 'This', 'That', 'They', 'Their', 'There', 'These', 'Those',
+                    'With', 'From', 'Into', 'About', 'After', 'Before', 'During', 'Through',
+                    'However', 'According', 'While', 'Although', 'Because', 'Since', 'Until',
+                    'Read', 'More', 'Also', 'Other', 'Some', 'Most', 'Many', 'Much', 'Such',
+                    'New', 'First', 'Last', 'Next', 'Year', 'Years', 'Month', 'Week', 'Day'
+                }
+                entities_mentioned = [e for e in found_entities if e not in common_words]
+
+                # Add main subject at the beginning if found
+                if main_subject and main_subject not in entities_mentioned:
+                    entities_mentioned.insert(0, main_subject)
+                elif main_subject:
+                    # Move main subject to front
+                    entities_mentioned.remove(main_subject)
+                    entities_mentioned.insert(0, main_subject)
+
+                entities_mentioned = entities_mentioned[:8]  # Limit to 8
+            except Exception as ent_err:
+                logger.warning(f"    [!] Entity extraction error: {ent_err}")
+                entities_mentioned = []
+                if main_subject:
+                    entities_mentioned = [main_subject]
+
+            # 4. Try Grid matching - first on ecosystem terms found, then on keywords
+            if grid_matcher_cls is not None:
+                article_matcher = grid_matcher_cls()
+                best_match = None
+
+                # Priority: Match ecosystem terms directly (Solana, Tether, Starknet)
+                for eco_term in found_ecosystem_terms:
+                    match = article_matcher.match_entity(eco_term, item.url, article_text[:200])
+                    if match.matched and match.primary and match.primary.confidence >= 0.7:
+                        best_match = match
+                        break
+
+                # Fallback: Try article body keywords
+                if not best_match:
+                    article_keywords = article_matcher.extract_keywords(article_text[:500])
+                    for kw in article_keywords[:3]:
+                        match = article_matcher.match_entity(kw, item.url, article_text[:200])
+                        if match.matched and match.primary and match.primary.confidence >= 0.8:
                             best_match = match
                             break
 
-                    # Fallback: Try article body keywords
-                    if not best_match:
-                        article_keywords = article_matcher.extract_keywords(article_text[:500])
-                        for kw in article_keywords[:3]:
-                            match = article_matcher.match_entity(kw, item.url, article_text[:200])
-                            if match.matched and match.primary and match.primary.confidence >= 0.8:
-                                best_match = match
-                                break
-
-                    # Update Grid fields if we found a match
-                    if best_match and best_match.matched:
-                        for key, value in best_match.to_dict().items():
-                            item.custom_fields[key] = value
-                        # Show all matched subjects
-                        subjects = ", ".join(m.name for m in best_match.matches[:2])
-                        comments.append(f"Grid: {subjects}")
-
-                        # LLM analysis for Grid profile suggestions
-                        try:
-                            from grid_api import analyze_grid_profile_with_llm
-                            primary_match = best_match.primary
-                            print(f"       [LLM Debug] primary={primary_match is not None}, text={len(article_text) if article_text else 0}, key={'set' if api_key else 'None'}")
-                            if primary_match and article_text and api_key:
-                                entity_name = primary_match.name
-                                print(f"       [LLM] Analyzing: {entity_name}")
-                                # Try to get profile details (works for profiles, may be empty for assets)
-                                profile_details = article_matcher.client.get_profile_details(entity_name)
-                                # If no profile found, create minimal context from the match
-                                if not profile_details.get("profile"):
-                                    profile_details = {
-                                        "profile": {
-                                            "name": entity_name,
-                                            "descriptionShort": primary_match.description or f"{primary_match.grid_type}: {entity_name}"
-                                        },
-                                        "products": [],
-                                        "assets": []
-                                    }
-                                suggestion = analyze_grid_profile_with_llm(article_text, profile_details, api_key=api_key)
-                                if suggestion:
-                                    comments.append(f"Suggest: {suggestion}")
-                                else:
-                                    print(f"       [LLM] No suggestion returned")
-                            elif not api_key:
-                                print(f"       [LLM] Skipped - no API key")
-                        except Exception as llm_err:
-                            print(f"       [!] LLM error: {llm_err}")
-                            pass  # LLM analysis is optional
-
-                # 5. ALWAYS check for USDT/Solana/Starknet support (even with fuzzy matches)
-                # Extract context to confirm actual support vs just mentions
-                try:
-                    support_findings = []
-                    support_ecosystems = {
-                        'Solana': ['solana', 'sol'],
-                        'Starknet': ['starknet', 'strk'],
-                        'USDT': ['usdt', 'tether']
-                    }
-
-                    # Positive support indicators
-                    support_indicators = [
-                        r'(?:launch|deploy|build|integrate|support|add|enable|live|available|expand)\w*\s+(?:on|to|for|with)',
-                        r'(?:on|to|for|with)\s+\w*\s*(?:launch|deploy|integration|support)',
-                        r'(?:native|built|powered)\s+(?:on|by)',
-                        r'(?:chain|network|blockchain|ecosystem)',
-                        r'(?:wallet|swap|bridge|dex|defi|nft)',
-                    ]
-                    support_pattern_str = '|'.join(support_indicators)
-
-                    for ecosystem, terms in support_ecosystems.items():
-                        term_pattern = '|'.join(re.escape(t) for t in terms)
-                        # Find mentions with surrounding context (100 chars before/after)
-                        context_pattern = re.compile(
-                            r'.{0,100}\b(' + term_pattern + r')\b.{0,100}',
-                            re.IGNORECASE | re.DOTALL
-                        )
-
-                        context_matches = context_pattern.findall(article_text)
-                        if context_matches:
-                            # Check if any context suggests actual support
-                            full_contexts = context_pattern.finditer(article_text)
-                            for ctx_match in full_contexts:
-                                context = ctx_match.group(0).strip()
-                                # Check for support indicators in context
-                                if re.search(support_pattern_str, context, re.IGNORECASE):
-                                    # Clean up the context for display
-                                    context_clean = ' '.join(context.split())[:150]
-                                    support_findings.append(f"{ecosystem}: \"{context_clean}...\"")
-                                    break
+                # Update Grid fields if we found a match
+                if best_match and best_match.matched:
+                    for key, value in best_match.to_dict().items():
+                        item.custom_fields[key] = value
+                    # Show all matched subjects
+                    subjects = ", ".join(m.name for m in best_match.matches[:2])
+                    comments.append(("Grid", subjects))
+
+                    # LLM analysis for Grid profile suggestions
+                    try:
+                        from grid_api import analyze_grid_profile_with_llm
+                        primary_match = best_match.primary
+                        logger.info(f"       [LLM Debug] primary={primary_match is not None}, text={len(article_text) if article_text else 0}, key={'set' if api_key else 'None'}")
+                        if primary_match and article_text and api_key:
+                            entity_name = primary_match.name
+                            logger.info(f"       [LLM] Analyzing: {entity_name}")
+                            # Try to get profile details (works for profiles, may be empty for assets)
+                            profile_details = article_matcher.client.get_profile_details(entity_name)
+                            # If no profile found, create minimal context from the match
+                            if not profile_details.get("profile"):
+                                profile_details = {
+                                    "profile": {
+                                        "name": entity_name,
+                                        "descriptionShort": primary_match.description or f"{primary_match.grid_type}: {entity_name}"
+                                    },
+                                    "products": [],
+                                    "assets": []
+                                }
+                            suggestion = analyze_grid_profile_with_llm(article_text, profile_details, api_key=api_key)
+                            if suggestion:
+                                comments.append(("Suggest", suggestion))
                             else:
-                                # No strong support indicator, but term was mentioned
-                                support_findings.append(f"{ecosystem}: mentioned (verify manually)")
-
-                    if support_findings:
-                        # Include source URL for reference
-                        support_summary = "; ".join(support_findings[:3])  # Limit to 3 ecosystems
-                        comments.append(f"Support check [{item.url}]: {support_summary}")
-                except Exception as support_err:
-                    print(f"    [!] Support check error: {support_err}")
-
-                # 6. Add entities mentioned section for verification
-                if entities_mentioned:
-                    comments.append(f"Entities: {', '.join(entities_mentioned[:6])}")
-
-                # Combine comments
-                if comments:
-                    item.custom_fields['comments'] = ' | '.join(comments)
-                    print(f"       → {item.custom_fields['comments']}")
-                else:
-                    item.custom_fields['comments'] = "No relevant mentions"
-                    print(f"       → No relevant mentions")
+                                logger.info(f"       [LLM] No suggestion returned")
+                        elif not api_key:
+                            logger.info(f"       [LLM] Skipped - no API key")
+                    except Exception as llm_err:
+                        logger.warning(f"       [!] LLM error: {llm_err}")
+                        pass  # LLM analysis is optional
+
+            # 5. ALWAYS check for USDT/Solana/Starknet support (even with fuzzy matches)
+            # Extract context to confirm actual support vs just mentions
+            try:
+                support_findings = []
+                mentioned = set()
+                supported = {}
+                # Cheap substring prefilter: most articles mention none of the terms
+                has_terms = any(t in article_lower for t in _ECOSYSTEM_TERMS)
+                for m in (_ECOSYSTEM_MENTION_RE.finditer(article_lower) if has_terms else ()):
+                    ecosystem = _ECOSYSTEM_GROUPS[m.lastgroup]
+                    mentioned.add(ecosystem)
+                    if ecosystem in supported:
+                        continue
+                    start = max(0, m.start() - _SUPPORT_CONTEXT_CHARS)
+                    end = m.end() + _SUPPORT_CONTEXT_CHARS
+                    # Check for support indicators in context
+                    if _SUPPORT_INDICATOR_RE.search(article_lower, start, end):
+                        # Clean up the context for display (original casing)
+                        context_clean = ' '.join(display_text[start:end].split())[:150]
+                        supported[ecosystem] = f"{ecosystem}: \"{context_clean}...\""
+                        if len(supported) == len(_SUPPORT_ECOSYSTEMS):
+                            break
 
-            except Exception as e:
-                import traceback
-                tb = traceback.format_exc()
-                # Include more context in error message
-                error_detail = str(e)
-                if 'timeout' in error_detail.lower():
-                    item.custom_fields['comments'] = f"Timeout: {item.url[:30]}... took too long"
-                elif 'connection' in error_detail.lower() or 'refused' in error_detail.lower():
-                    item.custom_fields['comments'] = f"Connection error: Could not reach {item.url[:30]}..."
-                elif '403' in error_detail or '401' in error_detail:
-                    item.custom_fields['comments'] = f"Access denied: {item.url[:30]}... requires auth"
-                elif '404' in error_detail:
-                    item.custom_fields['comments'] = f"Not found: {item.url[:30]}... may be deleted"
-                elif 'unpack' in error_detail.lower():
-                    # Log full traceback for debugging tuple unpacking errors
-                    print(f"       [DEBUG] Tuple unpack error at: {tb[-500:]}")
-                    item.custom_fields['comments'] = f"Parse error: Data format issue in article text"
-                else:
-                    item.custom_fields['comments'] = f"Research error: {error_detail[:80]}"
-                print(f"       → {item.custom_fields['comments']}")
+                for ecosystem in _SUPPORT_ECOSYSTEMS:
+                    if ecosystem in supported:
+                        support_findings.append(supported[ecosystem])
+                    elif ecosystem in mentioned:
+                        # No strong support indicator, but term was mentioned
+                        support_findings.append(f"{ecosystem}: mentioned (verify manually)")
+
+                if support_findings:
+                    # Include source URL for reference
+                    support_summary = "; ".join(support_findings[:3])  # Limit to 3 ecosystems
+                    comments.append((f"Support check [{item.url}]", support_summary))
+            except Exception as support_err:
+                logger.warning(f"    [!] Support check error: {support_err}")
+
+            # 6. Add entities mentioned section for verification
+            if entities_mentioned:
+                comments.append(("Entities", ', '.join(entities_mentioned[:6])))
+
+            # Combine comments
+            if comments:
+                item.custom_fields['comments'] = ' | '.join(f"{label}: {value}" for label, value in comments)
+                logger.info(f"       → {item.custom_fields['comments']}")
+            else:
+                item.custom_fields['comments'] = "No relevant mentions"
+                logger.info(f"       → No relevant mentions")
 
-        researched_count = sum(1 for item in items_to_research if 'comments' in item.custom_fields)
-        print(f"\n[*] Researched {researched_count}/{len(items_to_research)} articles")
+        except Exception as e:
+            # Include more context in error message
+            error_detail = str(e)
+            err_lower = error_detail.lower()
+            for keys, template in _RESEARCH_ERROR_COMMENTS:
+                if any(k in err_lower for k in keys):
+                    if keys == ('unpack',) and logger.isEnabledFor(logging.DEBUG):
+                        # Log full traceback for debugging tuple unpacking errors
+                        tb = traceback.format_exc()
+                        logger.info(f"       [DEBUG] Tuple unpack error at: {tb[-500:]}")
+                    item.custom_fields['comments'] = template.format(url=item.url[:30])
+                    break
+            else:
+                item.custom_fields['comments'] = f"Research error: {error_detail[:80]}"
+            logger.info(f"       → {item.custom_fields['comments']}")
 
-        return items
+    # Raw HTML handed to the article parser is capped (the result is cut to
+    # 10000 chars anyway); bounds parse time and memory on multi-MB pages
+    MAX_ARTICLE_HTML = 512 * 1024
 
     def _extract_article_body(self, html: str) -> str:
         """
@@ -2111,7 +2399,63 @@ class DataCSVProcessor:
         - Comments sections
         - Infinite scroll content
         - Footer content
+
+        Uses selectolax (lexbor) when installed, BeautifulSoup otherwise.
+        With config.fast_mode, skips the DOM entirely and returns all page
+        text left after stripping non-content blocks (no content targeting).
         """
+        # Nothing worth parsing: empty/tiny bodies, JSON, or PDF bytes
+        if not html or len(html) < 200:
+            return ""
+        if html.lstrip()[:4].startswith(('{', '[', '%PDF')):
+            return ""
+
+        html = html[:self.MAX_ARTICLE_HTML]
+
+        if self.config.fast_mode:
+            text = _TAG_RE.sub(' ', _BLOCK_STRIP_RE.sub(' ', html))
+            return _WS_RE.sub(' ', unescape(text)).strip()[:10000]
+
+        if HAS_SELECTOLAX:
+            try:
+                return self._extract_article_body_lexbor(html)
+            except Exception as e:
+                logger.warning(f"    [!] selectolax parse failed, using BeautifulSoup: {e}")
+        return self._extract_article_body_bs4(html)
+
+    def _extract_article_body_lexbor(self, html: str) -> str:
+        """selectolax/lexbor implementation of _extract_article_body."""
+        tree = LexborHTMLParser(html)
+
+        # Remove elements that are definitely not article content (one pass in C)
+        tree.strip_tags(_NON_CONTENT_TAGS)
+
+        # Remove common "related articles" patterns (by class or id). Matches
+        # come back in document order; removing in reverse frees nested
+        # matches before their ancestors.
+        for node in reversed(tree.css(_RELATED_SELECTOR)):
+            node.decompose()
+
+        # Priority 1: <article> tag, 2: common content class names, 3: <main> tag
+        article_content = tree.css_first('article')
+        if article_content is None:
+            article_content = tree.css_first(_CONTENT_CLASS_SELECTOR)
+        if article_content is None:
+            article_content = tree.css_first('main')
+
+        # Priority 4: whole body
+        if article_content is None:
+            article_content = tree.body or tree.root
+
+        if article_content is None:
+            return ""
+
+        text = article_content.text(separator=' ', strip=True)
+        # Clean up excessive whitespace, limit to reasonable article length
+        return _WS_RE.sub(' ', text).strip()[:10000]
+
+    def _extract_article_body_bs4(self, html: str) -> str:
+        """BeautifulSoup implementation of _extract_article_body."""
         # Try lxml first (faster), fall back to html.parser if lxml fails on malformed HTML
         try:
             soup = BeautifulSoup(html, 'lxml')
@@ -2119,25 +2463,12 @@ class DataCSVProcessor:
             soup = BeautifulSoup(html, 'html.parser')
 
         # Remove elements that are definitely not article content
-        for tag in soup.find_all(['script', 'style', 'nav', 'footer', 'header',
-                                   'aside', 'iframe', 'noscript', 'form']):
+        for tag in soup.find_all(_NON_CONTENT_TAGS):
             tag.decompose()
 
-        # Remove common "related articles" patterns
-        related_patterns = [
-            'related', 'recommended', 'more-stories', 'more-articles',
-            'also-read', 'you-may-like', 'trending', 'popular',
-            'sidebar', 'widget', 'advertisement', 'ad-container',
-            'social-share', 'comments', 'newsletter', 'subscribe'
-        ]
-
-        for pattern in related_patterns:
-            # Remove by class
-            for tag in soup.find_all(class_=lambda x: x and pattern in x.lower()):
-                tag.decompose()
-            # Remove by id
-            for tag in soup.find_all(id=lambda x: x and pattern in x.lower()):
-                tag.decompose()
+        # Remove common "related articles" patterns (by class or id)
+        for tag in soup.select(_RELATED_SELECTOR):
+            tag.decompose()
 
         # Try to find the main article content using semantic tags
         article_content = None
@@ -2149,14 +2480,7 @@ class DataCSVProcessor:
 
         # Priority 2: Common content class names
         if not article_content:
-            content_classes = ['article-content', 'article-body', 'post-content',
-                              'entry-content', 'story-body', 'article__body',
-                              'content-body', 'main-content', 'article-text']
-            for cls in content_classes:
-                found = soup.find(class_=lambda x: x and cls in str(x).lower())
-                if found:
-                    article_content = found
-                    break
+            article_content = soup.select_one(_CONTENT_CLASS_SELECTOR)
 
         # Priority 3: <main> tag
         if not article_content:
@@ -2174,7 +2498,7 @@ class DataCSVProcessor:
             text = article_content.get_text(separator=' ', strip=True)
 
             # Clean up excessive whitespace
-            text = ' '.join(text.split())
+            text = _WS_RE.sub(' ', text).strip()
 
             # Limit to reasonable article length (avoid infinite scroll content)
             # Most articles are under 10000 characters
@@ -2182,6 +2506,7 @@ class DataCSVProcessor:
 
         return ""
 
+    @_flushes_log
     def deduplicate_csv(self, csv_path: str, key_column: str = 'url') -> int:
         """Remove duplicates from CSV file."""
         return self.csv_manager.deduplicate(csv_path, key_column)
@@ -2203,15 +2528,33 @@ def load_custom_instructions(path: str) -> Dict:
         "blocked_domains": ["twitter.com", "facebook.com", "linkedin.com"],
         "csv_columns": ["title", "url", "category", "source_name", "date_published"]
     }
+
+    Parsed files are memoized on (path, mtime), so editing the file still
+    takes effect on the next call. Each call returns its own copy.
     """
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    try:
+        if mtime is None:
+            return _read_custom_instructions(path)
+        return copy.deepcopy(_load_custom_instructions_cached(path, mtime))
     except Exception as e:
-        print(f"Error loading custom instructions: {e}")
+        logger.warning(f"Error loading custom instructions: {e}")
         return {}
 
 
+def _read_custom_instructions(path: str) -> Dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_custom_instructions_cached(path: str, mtime: float) -> Dict:
+    return _read_custom_instructions(path)
+
+
 def save_custom_instructions(instructions: Dict, path: str):
     """Save custom instructions to JSON file."""
     with open(path, 'w') as f:
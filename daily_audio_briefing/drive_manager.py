@@ -17,8 +17,11 @@ Auth flow:
 import os
 import sys
 import json
-import glob
+import tempfile
+import time
+import threading
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
@@ -39,16 +42,53 @@ except ImportError:
 # OAuth scope — only files/folders created by this app
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
-# Cached service to avoid repeated auth + discovery doc parsing
-_cached_service = None
+# Cached service to avoid repeated auth + discovery doc parsing. Kept per
+# thread: googleapiclient services (httplib2) are not thread-safe, and uploads
+# run on a worker pool. Bumping the generation invalidates every thread's copy.
+_service_local = threading.local()
+_service_generation = 0
 _reauth_needed = False
+# Serializes reading/refreshing/writing the token file across upload workers
+_token_lock = threading.Lock()
+
+# Parallel uploads per week folder, and the stagger between the first workers
+# so they don't hit Drive's per-user rate limit in one burst
+UPLOAD_WORKERS = 16
+UPLOAD_STAGGER_SECONDS = 0.1
+
+
+def _reset_cached_services():
+    """Drop the cached Drive service in every thread (new creds, sign-out, re-auth)."""
+    global _service_generation
+    _service_generation += 1
+
+
+def _write_token(token_path: str, token_data: Dict):
+    """Write the token file atomically (temp file + rename), owner-only."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(token_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(token_data, f)
+        os.chmod(tmp_path, 0o600)  # Owner-only read/write
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _reset_thread_service():
+    """Drop this thread's cached Drive service to force a fresh connection."""
+    _service_local.service = None
 
 
 def flag_reauth_needed():
     """Mark Drive as needing re-authentication (expired/revoked refresh token)."""
-    global _reauth_needed, _cached_service
+    global _reauth_needed
     _reauth_needed = True
-    _cached_service = None
+    _reset_cached_services()
 
 
 def is_reauth_needed():
@@ -162,13 +202,11 @@ def sign_in() -> Dict[str, Any]:
 
         token_path = _get_token_path()
         os.makedirs(os.path.dirname(token_path), exist_ok=True)
-        with open(token_path, 'w') as f:
-            json.dump(token_data, f)
-        os.chmod(token_path, 0o600)  # Owner-only read/write
+        with _token_lock:
+            _write_token(token_path, token_data)
 
         # Clear cached service so it picks up new creds
-        global _cached_service
-        _cached_service = None
+        _reset_cached_services()
 
         return {'success': True, 'email': email, 'error': None}
 
@@ -178,8 +216,7 @@ def sign_in() -> Dict[str, Any]:
 
 def sign_out():
     """Revoke OAuth token with Google, then remove stored token file."""
-    global _cached_service
-    _cached_service = None
+    _reset_cached_services()
     token_path = _get_token_path()
     if os.path.exists(token_path):
         # Attempt to revoke the token server-side so it can't be reused if leaked
@@ -207,45 +244,46 @@ def get_drive_service():
     Automatically refreshes expired tokens using the stored refresh token.
     Raises RuntimeError if not signed in.
     """
-    global _cached_service
-
     if not DRIVE_AVAILABLE:
         raise RuntimeError("Google API packages not installed")
 
-    if _cached_service is not None:
-        return _cached_service
+    cached = getattr(_service_local, 'service', None)
+    if cached is not None and getattr(_service_local, 'generation', None) == _service_generation:
+        return cached
 
     token_path = _get_token_path()
     if not os.path.exists(token_path):
         raise RuntimeError("Not signed in. Click 'Sign in with Google' in Settings.")
 
-    creds = OAuthCredentials.from_authorized_user_file(token_path)
+    # One thread at a time reads and refreshes the token; threads that waited
+    # then read the token the first one saved instead of refreshing again
+    with _token_lock:
+        creds = OAuthCredentials.from_authorized_user_file(token_path)
 
-    # Refresh if expired
-    if creds.expired and creds.refresh_token:
-        try:
-            creds.refresh(Request())
-            # Save refreshed token
-            token_data = json.loads(creds.to_json())
-            # Preserve email
+        # Refresh if expired
+        if creds.expired and creds.refresh_token:
             try:
-                with open(token_path, 'r') as f:
-                    old_data = json.load(f)
-                if '_user_email' in old_data:
-                    token_data['_user_email'] = old_data['_user_email']
-            except Exception:
-                pass
-            with open(token_path, 'w') as f:
-                json.dump(token_data, f)
-            os.chmod(token_path, 0o600)  # Owner-only read/write
-        except Exception as e:
-            raise RuntimeError(f"Token refresh failed: {e}. Try signing in again.")
+                creds.refresh(Request())
+                # Save refreshed token
+                token_data = json.loads(creds.to_json())
+                # Preserve email
+                try:
+                    with open(token_path, 'r') as f:
+                        old_data = json.load(f)
+                    if '_user_email' in old_data:
+                        token_data['_user_email'] = old_data['_user_email']
+                except Exception:
+                    pass
+                _write_token(token_path, token_data)
+            except Exception as e:
+                raise RuntimeError(f"Token refresh failed: {e}. Try signing in again.")
 
     if not creds.valid and not creds.refresh_token:
         raise RuntimeError("Token expired and no refresh token. Please sign in again.")
 
     service = build('drive', 'v3', credentials=creds)
-    _cached_service = service
+    _service_local.service = service
+    _service_local.generation = _service_generation
     return service
 
 
@@ -292,7 +330,6 @@ def file_exists_in_folder(filename: str, folder_id: str) -> Optional[str]:
     Returns the file's Drive ID if found, None otherwise.
     Retries on transient SSL/connection errors (stale connections in long-running daemon).
     """
-    global _cached_service
     query = (
         f"name = '{filename}' "
         f"and '{folder_id}' in parents "
@@ -308,8 +345,7 @@ def file_exists_in_folder(filename: str, folder_id: str) -> Optional[str]:
             return files[0]['id'] if files else None
         except Exception as e:
             if attempt < 2 and ('ssl' in str(e).lower() or 'connection' in str(e).lower()):
-                _cached_service = None  # Force fresh connection
-                import time
+                _reset_thread_service()  # Force fresh connection
                 time.sleep(2 ** attempt)
                 continue
             raise
@@ -322,7 +358,6 @@ def upload_file(local_path: str, folder_id: str, skip_existing: bool = True) ->
     Returns:
         Dict with keys: id, name, size_bytes, status ('uploaded'|'skipped'|'error').
     """
-    global _cached_service
     filename = os.path.basename(local_path)
 
     if skip_existing:
@@ -344,7 +379,8 @@ def upload_file(local_path: str, folder_id: str, skip_existing: bool = True) ->
     last_err = None
     for attempt in range(3):
         try:
-            _cached_service = None  # Force fresh connection on each attempt
+            if attempt:
+                _reset_thread_service()  # Force fresh connection on retries
             service = get_drive_service()
             media = MediaFileUpload(local_path, mimetype=mime_type, resumable=True)
             uploaded = service.files().create(
@@ -359,7 +395,6 @@ def upload_file(local_path: str, folder_id: str, skip_existing: bool = True) ->
         except Exception as e:
             last_err = e
             if attempt < 2 and ('ssl' in str(e).lower() or 'connection' in str(e).lower()):
-                import time
                 time.sleep(2 ** attempt)
                 continue
             break
@@ -441,36 +476,54 @@ def sync_week_folders(local_base_path: str,
         _status(f"Root folder ready: {root_folder_name}", "green")
 
     # Find local Week_* folders
-    week_folders = sorted(glob.glob(os.path.join(local_base_path, "Week_*")))
+    try:
+        with os.scandir(local_base_path) as it:
+            week_folders = sorted(
+                e.path for e in it if e.name.startswith("Week_") and e.is_dir()
+            )
+    except OSError:
+        week_folders = []
     if not week_folders:
         _status("No weekly folders found locally.", "orange")
         return log
 
     for local_week in week_folders:
         week_name = os.path.basename(local_week)
-        if not os.path.isdir(local_week):
-            continue
 
-        audio_files = (
-            glob.glob(os.path.join(local_week, "*.mp3")) +
-            glob.glob(os.path.join(local_week, "*.wav"))
-        )
+        # One scandir pass per folder; skip dotfiles (e.g. macOS "._" files) like glob did
+        with os.scandir(local_week) as it:
+            audio_files = [
+                e.path for e in it
+                if not e.name.startswith(".")
+                and e.name.lower().endswith((".mp3", ".wav"))
+                and e.is_file()
+            ]
         if not audio_files:
             continue
 
         _status(f"Syncing {week_name} ({len(audio_files)} files)...", "orange")
+        # Folder lookup/creation stays sequential to avoid duplicate-folder races
         week_id = get_or_create_folder(week_name, parent_id=root_id)
 
-        for local_file in audio_files:
-            fname = os.path.basename(local_file)
-            result = upload_file(local_file, week_id)
-            if result['status'] == 'uploaded':
-                size_mb = result.get('size_bytes', 0) / (1024 * 1024)
-                _status(f"  Uploaded: {fname} ({size_mb:.1f}MB)", "green")
-            elif result['status'] == 'skipped':
-                _status(f"  Skipped (exists): {fname}", "gray")
-            else:
-                _status(f"  Error: {fname} — {result.get('reason', 'unknown')[:60]}", "red")
+        # Upload concurrently; the first workers start staggered
+        def _upload(index_file):
+            index, local_file = index_file
+            if index < UPLOAD_WORKERS:
+                time.sleep(index * UPLOAD_STAGGER_SECONDS)
+            return local_file, upload_file(local_file, week_id)
+
+        with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(audio_files))) as executor:
+            futures = [executor.submit(_upload, index_file) for index_file in enumerate(audio_files)]
+            for future in as_completed(futures):
+                local_file, result = future.result()
+                fname = os.path.basename(local_file)
+                if result['status'] == 'uploaded':
+                    size_mb = result.get('size_bytes', 0) / (1024 * 1024)
+                    _status(f"  Uploaded: {fname} ({size_mb:.1f}MB)", "green")
+                elif result['status'] == 'skipped':
+                    _status(f"  Skipped (exists): {fname}", "gray")
+                else:
+                    _status(f"  Error: {fname} — {result.get('reason', 'unknown')[:60]}", "red")
 
     _status("Sync complete.", "green")
     return log
@@ -14,17 +14,22 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import page_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Try to import google.generativeai for summarization
 try:
@@ -33,6 +38,29 @@ try:
 except ImportError:
     HAS_GENAI = False
 
+# Newsletters fetched at once by main()
+MAX_FETCH_WORKERS = 8
+
+# Newsletter date formats tried (after the ISO-8601 fast path) when sorting items
+DATE_FORMATS = ['%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S', '%b %d, %Y', '%B %d, %Y',
+                '%Y-%m-%d', '%m/%d/%Y', '%d %b %Y']
+
+# Page bodies are streamed and cut off at these sizes
+MAX_NEWSLETTER_BYTES = 5 * 1024 * 1024
+MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+FETCH_CHUNK_SIZE = 64 * 1024
+OUTPUT_BUFFER_SIZE = 64 * 1024
+# Content-Type prefixes accepted when a caller only wants HTML
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# One pooled keep-alive session for all fetches, so repeat hosts reuse sockets
+_session = requests.Session()
+_session.headers.update({'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'})
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
 
 def get_data_directory():
     """Get the appropriate data directory for storing output files."""
@@ -65,28 +93,58 @@ def get_week_folder() -> str:
     return folder_path
 
 
+TRACKING_PREFIXES = ('utm_', 'ref', 'source', 'campaign', 'medium', 'fbclid', 'gclid',
+                     'mc_', 'ml_', '_ga', '_gl', 'sref', 'smid', 'unlocked_article_code')
+# Any query key starting with a tracking prefix
+_TRACKER_KEY_RE = re.compile(r'(?:^|&)(?:' + '|'.join(map(re.escape, TRACKING_PREFIXES)) + ')',
+                             re.IGNORECASE)
+
+
 def strip_utm_params(url: str) -> str:
     """Remove UTM and tracking parameters from URL."""
     try:
         from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
         parsed = urlparse(url)
+        # Fast path: no query, or no tracking key in it - only the fragment goes
+        if not parsed.query or not _TRACKER_KEY_RE.search(parsed.query):
+            return urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, parsed.query, ''))
         params = parse_qs(parsed.query, keep_blank_values=True)
-        tracking_prefixes = ('utm_', 'ref', 'source', 'campaign', 'medium', 'fbclid', 'gclid',
-                            'mc_', 'ml_', '_ga', '_gl', 'sref', 'smid', 'unlocked_article_code')
         filtered_params = {k: v for k, v in params.items()
-                         if not any(k.lower().startswith(prefix) for prefix in tracking_prefixes)}
+                         if not k.lower().startswith(TRACKING_PREFIXES)}
         new_query = urlencode(filtered_params, doseq=True) if filtered_params else ''
         return urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, ''))
     except Exception:
         return url
 
 
+# Config lists matched case-insensitively as substrings. normalize_config
+# lowercases them once and compiles each into one alternation stored under
+# '_<key>_re' (None when the list is empty), so a check is a single scan.
+_LOWERED_CONFIG_KEYS = ('blocked_domains', 'exclude_patterns', 'include_patterns', 'exclude_sections')
+
+
+def normalize_config(config: Dict) -> Dict:
+    """Return a copy of config with the pattern lists lowercased and compiled (idempotent)."""
+    normalized = dict(config)
+    for key in _LOWERED_CONFIG_KEYS:
+        patterns = tuple(p.lower() for p in normalized.get(key, ()))
+        if key in normalized:
+            normalized[key] = patterns
+        normalized[f'_{key}_re'] = re.compile('|'.join(map(re.escape, patterns))) if patterns else None
+    return normalized
+
+
+def _config_matches(config: Dict, key: str, text_lower: str) -> bool:
+    pattern = config.get(f'_{key}_re')
+    return pattern is not None and pattern.search(text_lower) is not None
+
+
 def load_config() -> Dict:
     """Load the ExecSum extraction config."""
     config_path = os.path.join(os.path.dirname(__file__), 'extraction_instructions', 'execsum.json')
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return normalize_config(json.load(f))
     except Exception as e:
         print(f"Warning: Could not load config: {e}")
         return {}
@@ -109,42 +167,45 @@ def load_api_key() -> Optional[str]:
     return os.environ.get('GEMINI_API_KEY')
 
 
+# The matchers below expect a config passed through normalize_config
+
 def is_blocked_url(url: str, config: Dict) -> bool:
     """Check if URL should be blocked based on config."""
-    blocked_domains = config.get('blocked_domains', [])
     try:
         parsed = urlparse(url)
         domain = parsed.netloc.lower().replace('www.', '')
-        return any(blocked.lower() in domain for blocked in blocked_domains)
+        return _config_matches(config, 'blocked_domains', domain)
     except Exception:
         return False
 
 
 def matches_exclude_pattern(text: str, config: Dict) -> bool:
     """Check if text matches exclusion patterns."""
-    exclude_patterns = config.get('exclude_patterns', [])
-    text_lower = text.lower()
-    return any(pattern.lower() in text_lower for pattern in exclude_patterns)
+    return _config_matches(config, 'exclude_patterns', text.lower())
 
 
 def matches_include_pattern(text: str, config: Dict) -> bool:
     """Check if text matches any include pattern (for whitelist filtering)."""
-    include_patterns = config.get('include_patterns', [])
-    if not include_patterns:
+    if not config.get('include_patterns'):
         return True  # No include patterns means include all
-    text_lower = text.lower()
-    return any(pattern.lower() in text_lower for pattern in include_patterns)
+    return _config_matches(config, 'include_patterns', text.lower())
 
 
 def is_in_excluded_section(section: str, config: Dict) -> bool:
     """Check if section is in the excluded sections list."""
-    exclude_sections = config.get('exclude_sections', [])
-    section_lower = section.lower()
-    return any(exc.lower() in section_lower for exc in exclude_sections)
+    return _config_matches(config, 'exclude_sections', section.lower())
 
 
 def get_source_name(url: str) -> str:
     """Get readable source name from URL."""
+    try:
+        return _source_name_for_netloc(urlparse(url).netloc)
+    except Exception:
+        return 'Unknown'
+
+
+@functools.lru_cache(maxsize=4096)
+def _source_name_for_netloc(netloc: str) -> str:
     domain_map = {
         'reuters.com': 'Reuters',
         'bloomberg.com': 'Bloomberg',
@@ -155,80 +216,226 @@ def get_source_name(url: str) -> str:
         'economist.com': 'The Economist',
         'awealthofcommonsense.com': 'A Wealth of Common Sense',
     }
+    domain = netloc.lower().replace('www.', '')
+    for key, name in domain_map.items():
+        if key in domain:
+            return name
+    return domain.split('.')[0].title()
+
+
+# Keyword sets for the Markets / Headline Roundup line filters, each compiled
+# into one case-insensitive alternation (plain substring semantics)
+def _keyword_re(keywords) -> re.Pattern:
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+_MARKETS_SKIP_RE = _keyword_re(['subscribe', 'click', 'join', 'autopilot', 'litquidity', 'beehiiv'])
+_MARKET_INDICATOR_RE = _keyword_re([
+    '%', 'bps', 'ath', 'all-time', 'high', 'low', 'rally', 'surge', 'drop',
+    'fell', 'rose', 'climb', 'spread', 'dollar', 'gold', 'silver', 'stock',
+    's&p', 'dow', 'nasdaq', 'index', 'yield', 'bond', 'treasury', 'bitcoin',
+    'oil', 'copper', 'platinum', 'palladium', 'nickel', 'iron', 'commodity'
+])
+_HEADLINE_SKIP_RE = _keyword_re(['subscribe', 'click', 'join', 'autopilot', 'litquidity',
+                                 'beehiiv', 'merch', 'fundable', 'here', 'listen', 'take a'])
+_SOURCE_SUFFIX_RE = re.compile('|'.join(map(re.escape, [
+    '(BBG)', '(RT)', '(CNBC)', '(FT)', '(WSJ)', '(NYT)', '(NBC)', '(TC)'
+])))
+
+_MULTI_NL_RE = re.compile(r'\n+')
+_SOURCE_PAREN_RE = re.compile(r'\([A-Z]{2,4}\)$|\((?:Bloomberg|Reuters|CNBC|WSJ|FT)\)$')
+_EMPTY_PARENS_END_RE = re.compile(r'\s*\(\s*\)\s*$')
+_OPEN_PAREN_END_RE = re.compile(r'\s*\($')
+_DANGLING_PAREN_RE = re.compile(r'\s*\(\s*$')
+_ARTICLE_CLASS_RE = re.compile(r'article|content|story|post')
+# Newsletter date fallbacks, tried in order against the top of the page text
+_DATE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},?\s+\d{4}',
+    r'\d{1,2}/\d{1,2}/\d{4}',
+    r'\d{4}-\d{2}-\d{2}',
+)]
+
+# clean_item_for_audio: source suffixes to drop, and abbreviations to expand.
+# Abbreviations are matched with lookarounds so the surrounding spaces stay
+# available to the next match; the first alternative wins at a position.
+_AUDIO_SUFFIX_RE = re.compile('|'.join(map(re.escape, [
+    '(BBG)', '(RT)', '(CNBC)', '(FT)', '(WSJ)', '(NYT)', '(NBC)', '(TC)',
+    '(ExecSum)', '(Bloomberg)', '(Reuters)', '(Financial Times)'
+])))
+_AUDIO_ABBREV_PATTERNS = [
+    (r'(?<= )bps', 'basis points'),
+    (r'(?<= )BPS', 'basis points'),
+    (r'(?<= )bp(?= )', 'basis point'),
+    (r'(?<= )bp(?=\.)', 'basis point'),
+    (r'(?<= )YoY', 'year over year'),
+    (r'(?<= )YTD', 'year to date'),
+    (r'(?<= )ATH', 'all-time high'),
+    (r'(?<= )QoQ', 'quarter over quarter'),
+    (r'(?<= )MoM', 'month over month'),
+    (r'(?<= )1Y(?= )', 'one-year'),
+    (r'(?<= )2Y(?= )', 'two-year'),
+    (r'(?<= )3Y(?= )', 'three-year'),
+    (r'(?<= )4Y(?= )', 'four-year'),
+    (r'(?<= )5Y(?= )', 'five-year'),
+    (r'(?<= )7Y(?= )', 'seven-year'),
+    (r'(?<= )10Y(?= )', 'ten-year'),
+    (r'(?<= )30Y(?= )', 'thirty-year'),
+    (r'Y-', '-year-'),
+]
+_AUDIO_ABBREVS = {f'a{i}': new for i, (_, new) in enumerate(_AUDIO_ABBREV_PATTERNS)}
+_AUDIO_ABBREV_RE = re.compile('|'.join(
+    f'(?P<a{i}>{pattern})' for i, (pattern, _) in enumerate(_AUDIO_ABBREV_PATTERNS)
+))
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
+# Section headers and the markers that end each section. Markets headers and
+# end markers share one alternation so a single finditer yields every boundary;
+# '*Markets' both ends one section and starts the next. For the roundup, a
+# search from the header finds the earliest end marker instead of one find() each.
+_MARKETS_BOUNDS_RE = re.compile(
+    r'(?P<both>\*Markets)|(?P<start>\nMarkets\n)|(?P<end>' + '|'.join(map(re.escape, [
+        'Earnings', 'Prediction Markets', 'Headline Roundup', 'Deal Flow',
+        'Before The Bell', "Exec's Picks", 'Execs Picks'
+    ])) + ')'
+)
+_ROUNDUP_START_RE = re.compile(r'Headline Roundup')
+_ROUNDUP_END_RE = re.compile('|'.join(map(re.escape, [
+    'Deal Flow', 'M&A', 'VC', 'IPO', 'Funds', 'Prediction Markets',
+    'Meme Cleanser', "Exec's Picks", 'Execs Picks', 'Related Posts',
+    '*Markets', 'Markets'
+])))
+
+# Article pages only need their content containers; everything else is skipped at parse time
+ARTICLE_STRAINER = SoupStrainer(['article', 'main', 'section', 'div', 'p', 'h1', 'h2'])
+
+
+def parse_html(markup, parse_only: SoupStrainer = None, from_encoding: str = None) -> BeautifulSoup:
+    """Parse HTML (str or bytes) with lxml (faster), falling back to html.parser if lxml is unavailable or fails."""
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower().replace('www.', '')
-        for key, name in domain_map.items():
-            if key in domain:
-                return name
-        return domain.split('.')[0].title()
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only, from_encoding=from_encoding)
     except Exception:
-        return 'Unknown'
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only, from_encoding=from_encoding)
+
+
+def read_capped(response, limit: int) -> bytes:
+    """Read a streamed response body in chunks, stopping after limit bytes."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    response.close()
+    return b''.join(chunks)[:limit]
+
+
+def fetch_page(url: str, timeout: int, limit: int, html_only: bool = False,
+               cache: bool = True) -> Tuple[bytes, Optional[str]]:
+    """Fetch a page body (capped at limit bytes) and its encoding, via the on-disk page cache.
+
+    html_only: refuse responses whose Content-Type says they are not HTML
+    (PDFs, images, video) before any of the body is downloaded.
+    cache: read and write the page cache; pass False for pages that change
+    (archive/index pages), which must always be fetched fresh.
+
+    Raises on network/HTTP errors; failed fetches are not cached.
+    """
+    cache_dir = os.path.join(get_data_directory(), 'page_cache') if cache else None
+    cached = page_cache.get(cache_dir, url)
+    if cached is not None:
+        return cached
+    response = _session.get(url, timeout=timeout, stream=True)
+    response.raise_for_status()
+    if html_only:
+        # Headers arrive before the body, so this costs no extra request
+        content_type = response.headers.get('Content-Type', '').lower()
+        if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+            response.close()
+            raise ValueError(f"not an HTML page ({content_type.split(';')[0]})")
+    body = read_capped(response, limit)
+    page_cache.put(cache_dir, url, body, response.encoding)
+    return body, response.encoding
+
+
+def title_key(text: str) -> int:
+    """Dedup key for a headline: hash of its first 50 chars, case-folded."""
+    return hash(text[:50].casefold())
 
 
 def get_clean_page_text(soup) -> str:
     """Get page text with proper line breaks between elements."""
-    # Get the HTML, replace <br> tags with newlines in the string
-    html_str = str(soup)
+    # One walk of the parsed tree: every text node becomes its own line, so
+    # <br> and block boundaries already break lines without re-parsing
+    page_text = soup.get_text(separator='\n', strip=True)
 
-    # Replace various br tag formats with newlines
-    html_str = re.sub(r'<br\s*/?>', '\n', html_str, flags=re.IGNORECASE)
+    # Stripped nodes never start or end with a newline, so blank lines only
+    # come from newlines inside a single text node
+    if '\n\n' in page_text:
+        page_text = _MULTI_NL_RE.sub('\n', page_text)
 
-    # Also ensure block elements create line breaks
-    for tag in ['</p>', '</div>', '</li>', '</h1>', '</h2>', '</h3>', '</h4>', '</h5>', '</h6>']:
-        html_str = html_str.replace(tag, tag + '\n')
+    return page_text
 
-    # Parse again and get text
-    temp_soup = BeautifulSoup(html_str, 'html.parser')
-    page_text = temp_soup.get_text(separator='\n', strip=True)
 
-    # Normalize multiple newlines
-    page_text = re.sub(r'\n+', '\n', page_text)
+def _section_starts(header_re: re.Pattern, page_text: str, skip: int) -> List[int]:
+    """Offsets of section headers, ignoring any within skip chars of the previous one."""
+    starts = []
+    next_allowed = 0
+    for m in header_re.finditer(page_text):
+        if m.start() >= next_allowed:
+            starts.append(m.start())
+            next_allowed = m.start() + skip
+    return starts
 
-    return page_text
 
+def _section_spans(bounds_re: re.Pattern, page_text: str, skip: int) -> List[Tuple[int, int]]:
+    """(start, end) of each section in one scan of page_text.
 
-def extract_markets_section(soup, config: Dict) -> List[Dict]:
-    """Extract bullet points from the Markets section (no hyperlinks needed)."""
+    bounds_re names its groups 'start', 'end' or 'both'. Headers within skip
+    chars of the previous header are ignored, and a section ends at the first
+    end marker at least skip chars past its header (or the end of the text).
+    """
+    spans = []
+    open_starts = []
+    next_allowed = 0
+    for m in bounds_re.finditer(page_text):
+        pos = m.start()
+        kind = m.lastgroup
+        if kind != 'start' and open_starts:
+            # Close every open section this marker is far enough past
+            still_open = []
+            for start in open_starts:
+                if pos >= start + skip:
+                    spans.append((start, pos))
+                else:
+                    still_open.append(start)
+            open_starts = still_open
+        if kind != 'end' and pos >= next_allowed:
+            open_starts.append(pos)
+            next_allowed = pos + skip
+    spans.extend((start, len(page_text)) for start in open_starts)
+    spans.sort()
+    return spans
+
+
+def extract_markets_section(soup, config: Dict, page_text: str = None) -> List[Dict]:
+    """Extract bullet points from the Markets section (no hyperlinks needed).
+
+    page_text: get_clean_page_text(soup), if the caller already has it
+    """
     items = []
     bullet_items = []
 
     # Get clean page text with proper line breaks
-    page_text = get_clean_page_text(soup)
+    if page_text is None:
+        page_text = get_clean_page_text(soup)
 
     # Find all Markets sections (there may be multiple per newsletter)
-    markets_starts = []
-    idx = 0
-    while True:
-        # Look for *Markets or standalone Markets header
-        star_idx = page_text.find('*Markets', idx)
-        plain_idx = page_text.find('\nMarkets\n', idx)
-
-        if star_idx == -1 and plain_idx == -1:
-            break
-
-        if star_idx != -1 and (plain_idx == -1 or star_idx < plain_idx):
-            markets_starts.append(star_idx)
-            idx = star_idx + 10
-        else:
-            markets_starts.append(plain_idx)
-            idx = plain_idx + 10
-
-    if not markets_starts:
+    markets_spans = _section_spans(_MARKETS_BOUNDS_RE, page_text, 10)
+    if not markets_spans:
         return items
 
-    # Section end markers
-    section_markers = ['Earnings', 'Prediction Markets', 'Headline Roundup', 'Deal Flow',
-                      'Before The Bell', "Exec's Picks", 'Execs Picks', '*Markets']
-
-    for markets_idx in markets_starts:
-        # Find where this section ends
-        end_idx = len(page_text)
-        for marker in section_markers:
-            idx = page_text.find(marker, markets_idx + 10)
-            if idx != -1 and idx < end_idx:
-                end_idx = idx
-
+    for markets_idx, end_idx in markets_spans:
         markets_text = page_text[markets_idx:end_idx]
 
         # Split into lines and extract bullet points
@@ -245,24 +452,21 @@ def extract_markets_section(soup, config: Dict) -> List[Dict]:
                 continue
 
             # Skip marketing/promo content
-            if any(skip in line.lower() for skip in ['subscribe', 'click', 'join', 'autopilot', 'litquidity', 'beehiiv']):
+            if _MARKETS_SKIP_RE.search(line):
                 continue
 
             # Include if it looks like market data
-            if len(line) > 20 and any(indicator in line.lower() for indicator in
-                ['%', 'bps', 'ath', 'all-time', 'high', 'low', 'rally', 'surge', 'drop',
-                 'fell', 'rose', 'climb', 'spread', 'dollar', 'gold', 'silver', 'stock',
-                 's&p', 'dow', 'nasdaq', 'index', 'yield', 'bond', 'treasury', 'bitcoin',
-                 'oil', 'copper', 'platinum', 'palladium', 'nickel', 'iron', 'commodity']):
+            if len(line) > 20 and _MARKET_INDICATOR_RE.search(line):
                 bullet_items.append(line)
 
     # Filter and create items from bullet points
-    seen = set()
+    seen: set[int] = set()
     for bullet in bullet_items:
         # Skip duplicates
-        if bullet[:50].lower() in seen:
+        key = title_key(bullet)
+        if key in seen:
             continue
-        seen.add(bullet[:50].lower())
+        seen.add(key)
 
         # Apply include/exclude pattern filtering
         if matches_exclude_pattern(bullet, config):
@@ -284,43 +488,30 @@ def extract_markets_section(soup, config: Dict) -> List[Dict]:
     return items
 
 
-def extract_headline_roundup(soup, config: Dict) -> List[Dict]:
+def extract_headline_roundup(soup, config: Dict, page_text: str = None) -> List[Dict]:
     """Extract items from the Headline Roundup section.
 
     In ExecSum, headlines are often plain text followed by a source link in parentheses.
     E.g., "Data centers will need over $3T in investments through 2030 (BBG)"
+
+    page_text: get_clean_page_text(soup), if the caller already has it
     """
     items = []
     headline_items = []
 
     # Get clean page text with proper line breaks
-    page_text = get_clean_page_text(soup)
+    if page_text is None:
+        page_text = get_clean_page_text(soup)
 
     # Find all Headline Roundup sections (there may be multiple per newsletter)
-    roundup_starts = []
-    idx = 0
-    while True:
-        roundup_idx = page_text.find('Headline Roundup', idx)
-        if roundup_idx == -1:
-            break
-        roundup_starts.append(roundup_idx)
-        idx = roundup_idx + 20
-
+    roundup_starts = _section_starts(_ROUNDUP_START_RE, page_text, 20)
     if not roundup_starts:
         return items
 
-    # Section end markers
-    section_markers = ['Deal Flow', 'M&A', 'VC', 'IPO', 'Funds', 'Prediction Markets',
-                      'Meme Cleanser', "Exec's Picks", 'Execs Picks', 'Related Posts',
-                      '*Markets', 'Markets']
-
     for roundup_idx in roundup_starts:
-        # Find where this section ends
-        end_idx = len(page_text)
-        for marker in section_markers:
-            marker_idx = page_text.find(marker, roundup_idx + 20)
-            if marker_idx != -1 and marker_idx < end_idx:
-                end_idx = marker_idx
+        # Section ends at the earliest end marker after its header
+        end_match = _ROUNDUP_END_RE.search(page_text, roundup_idx + 20)
+        end_idx = end_match.start() if end_match else len(page_text)
 
         roundup_text = page_text[roundup_idx:end_idx]
 
@@ -334,22 +525,18 @@ def extract_headline_roundup(soup, config: Dict) -> List[Dict]:
                 continue
 
             # Skip marketing/promo content
-            skip_words = ['subscribe', 'click', 'join', 'autopilot', 'litquidity',
-                         'beehiiv', 'merch', 'fundable', 'here', 'listen', 'take a']
-            if any(skip in line.lower() for skip in skip_words):
+            if _HEADLINE_SKIP_RE.search(line):
                 continue
 
             # Check if line looks like a news headline
             # Typically ends with source like (BBG), (RT), (CNBC), etc.
-            has_source = bool(re.search(r'\([A-Z]{2,4}\)$|\(Bloomberg\)$|\(Reuters\)$|\(CNBC\)$|\(WSJ\)$|\(FT\)$', line))
+            has_source = bool(_SOURCE_PAREN_RE.search(line))
 
             # Include if it has a source suffix or looks substantive (5+ words)
             words = line.split()
             if len(words) >= 5 or has_source:
                 # Clean up source suffixes
-                clean_line = line
-                for suffix in ['(BBG)', '(RT)', '(CNBC)', '(FT)', '(WSJ)', '(NYT)', '(NBC)', '(TC)']:
-                    clean_line = clean_line.replace(suffix, '').strip()
+                clean_line = _SOURCE_SUFFIX_RE.sub('', line).strip()
 
                 # Skip truncated or incomplete headlines
                 if clean_line.endswith('...') or clean_line.endswith('driving') or clean_line.endswith('landmark'):
@@ -362,12 +549,13 @@ def extract_headline_roundup(soup, config: Dict) -> List[Dict]:
                 headline_items.append(clean_line)
 
     # Deduplicate and filter
-    seen = set()
+    seen: set[int] = set()
     for headline in headline_items:
         # Skip duplicates
-        if headline[:50].lower() in seen:
+        key = title_key(headline)
+        if key in seen:
             continue
-        seen.add(headline[:50].lower())
+        seen.add(key)
 
         # Apply exclude pattern filtering
         if matches_exclude_pattern(headline, config):
@@ -397,16 +585,23 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
         Tuple of (items list, newsletter_date string or None)
     """
     print(f"Fetching: {url}")
+    # Callers may pass a raw json.load()ed config
+    config = normalize_config(config)
 
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        # Only a published issue (/p/<slug>) is fixed; archive and home
+        # pages list the latest issue and must be fetched fresh each run
+        is_issue = urlparse(url).path.startswith('/p/')
+        body, encoding = fetch_page(url, 30, MAX_NEWSLETTER_BYTES, cache=is_issue)
     except Exception as e:
         print(f"  Error fetching: {e}")
         return [], None
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # Full parse: section detection walks siblings/parents of every link.
+    # The raw bytes go straight to the parser (no decoded copy) and are
+    # dropped once the tree exists.
+    soup = parse_html(body, from_encoding=encoding)
+    del body
 
     # Extract newsletter date from the page
     date_str = None
@@ -437,14 +632,8 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
     if not date_str:
         # Look for date pattern in page text near the top
         page_text = soup.get_text()[:2000]  # First 2000 chars
-        import re
-        date_patterns = [
-            r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},?\s+\d{4}',
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{4}-\d{2}-\d{2}'
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        for pattern in _DATE_RES:
+            match = pattern.search(page_text)
             if match:
                 date_str = match.group(0)
                 break
@@ -452,24 +641,27 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
     if date_str:
         print(f"  Newsletter date: {date_str}")
 
+    # Shared by the Markets and Headline Roundup text scans
+    page_text = get_clean_page_text(soup)
+
     items = []
-    seen_urls = set()
-    seen_titles = set()
+    seen_urls: set[int] = set()
+    seen_titles: set[int] = set()
 
     # First, extract Markets section bullet points (no hyperlinks needed)
     if config.get('extract_markets_section', True):
-        markets_items = extract_markets_section(soup, config)
+        markets_items = extract_markets_section(soup, config, page_text)
         items.extend(markets_items)
         for item in markets_items:
-            seen_titles.add(item['title'][:50].lower())
+            seen_titles.add(title_key(item['title']))
         if markets_items:
             print(f"  Found {len(markets_items)} Markets section bullet points")
 
     # Extract Headline Roundup items (plain text headlines with source suffixes)
-    headline_items = extract_headline_roundup(soup, config)
+    headline_items = extract_headline_roundup(soup, config, page_text)
     items.extend(headline_items)
     for item in headline_items:
-        seen_titles.add(item['title'][:50].lower())
+        seen_titles.add(title_key(item['title']))
     if headline_items:
         print(f"  Found {len(headline_items)} Headline Roundup items")
 
@@ -480,9 +672,10 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
             continue
 
         clean_url = strip_utm_params(href)
-        if clean_url in seen_urls:
+        url_hash = hash(clean_url)
+        if url_hash in seen_urls:
             continue
-        seen_urls.add(clean_url)
+        seen_urls.add(url_hash)
 
         # Check if blocked
         if is_blocked_url(clean_url, config):
@@ -505,8 +698,8 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
                               'Bloomberg', 'Reuters', 'CNBC', 'Financial Times', 'Wall Street Journal']:
                     headline_text = headline_text.replace(suffix, '').strip()
                 # Clean up trailing punctuation and parentheses
-                headline_text = re.sub(r'\s*\(\s*\)\s*$', '', headline_text).strip()
-                headline_text = re.sub(r'\s*\($', '', headline_text).strip()
+                headline_text = _EMPTY_PARENS_END_RE.sub('', headline_text).strip()
+                headline_text = _OPEN_PAREN_END_RE.sub('', headline_text).strip()
 
         if not headline_text or len(headline_text) < 10:
             continue
@@ -540,7 +733,7 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
             continue
 
         # Skip if we already have this headline from text extraction
-        if headline_text[:50].lower() in seen_titles:
+        if title_key(headline_text) in seen_titles:
             continue
 
         # Determine section by looking at surrounding content
@@ -573,41 +766,64 @@ def extract_newsletter_content(url: str, config: Dict) -> Tuple[List[Dict], Opti
     return items, date_str
 
 
+# Section keywords in priority order (first listed wins when several appear)
+SECTION_KEYWORDS = {
+    'Headline Roundup': 'Headline Roundup',
+    'Deal Flow': 'Deal Flow',
+    'M&A': 'M&A / Investments',
+    'VC': 'VC',
+    'IPO': 'IPO / Listings',
+    'SPAC': 'SPAC',
+    'Debt': 'Debt',
+    'Bankruptcy': 'Bankruptcy / Restructuring',
+    'Funds': 'Funds / Secondaries',
+    "Exec's Picks": 'Execs Picks',
+    'Markets': 'Markets'
+}
+_SECTION_PRIORITY = {keyword: i for i, keyword in enumerate(SECTION_KEYWORDS)}
+# No keyword overlaps another, so finditer sees every keyword present
+_SECTION_KEYWORD_RE = re.compile('|'.join(map(re.escape, SECTION_KEYWORDS)))
+
+
+def _match_section(text: str) -> Optional[str]:
+    """Section for the highest-priority keyword in text, or None."""
+    found = {m.group() for m in _SECTION_KEYWORD_RE.finditer(text)}
+    if not found:
+        return None
+    return SECTION_KEYWORDS[min(found, key=_SECTION_PRIORITY.__getitem__)]
+
+
+def _text_prefix(element, length: int) -> str:
+    """First length chars of element.get_text(strip=True), without joining the whole subtree."""
+    parts = []
+    size = 0
+    for string in element.stripped_strings:
+        parts.append(string)
+        size += len(string)
+        if size >= length:
+            break
+    return ''.join(parts)[:length]
+
+
 def determine_section(element) -> str:
     """Determine section based on DOM position."""
-    section_keywords = {
-        'Headline Roundup': 'Headline Roundup',
-        'Deal Flow': 'Deal Flow',
-        'M&A': 'M&A / Investments',
-        'VC': 'VC',
-        'IPO': 'IPO / Listings',
-        'SPAC': 'SPAC',
-        'Debt': 'Debt',
-        'Bankruptcy': 'Bankruptcy / Restructuring',
-        'Funds': 'Funds / Secondaries',
-        "Exec's Picks": 'Execs Picks',
-        'Markets': 'Markets'
-    }
-
     current = element
     for _ in range(30):
         if current is None:
             break
 
-        # Check text content
-        text = current.get_text(strip=True) if hasattr(current, 'get_text') else str(current)
-
-        for keyword, section_name in section_keywords.items():
-            if keyword in text[:100]:
-                return section_name
+        # Check text content (only the first 100 chars are ever looked at)
+        text = _text_prefix(current, 100) if hasattr(current, 'stripped_strings') else str(current)[:100]
+        section = _match_section(text)
+        if section:
+            return section
 
         # Check previous siblings
         prev = current.find_previous_sibling(['h1', 'h2', 'h3', 'h4', 'strong'])
         if prev:
-            prev_text = prev.get_text(strip=True)
-            for keyword, section_name in section_keywords.items():
-                if keyword in prev_text:
-                    return section_name
+            section = _match_section(prev.get_text(strip=True))
+            if section:
+                return section
 
         current = current.parent
 
@@ -617,18 +833,16 @@ def determine_section(element) -> str:
 def fetch_article_content(url: str) -> Optional[str]:
     """Fetch article content for summarization."""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        body, encoding = fetch_page(url, 15, MAX_ARTICLE_BYTES, html_only=True)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = parse_html(body, parse_only=ARTICLE_STRAINER, from_encoding=encoding)
 
         # Remove unwanted elements
         for elem in soup.find_all(['script', 'style', 'nav', 'header', 'footer', 'aside']):
             elem.decompose()
 
         # Try to find article content
-        article = soup.find('article') or soup.find(class_=re.compile(r'article|content|story|post'))
+        article = soup.find('article') or soup.find(class_=_ARTICLE_CLASS_RE)
         if article:
             text = article.get_text(separator='\n', strip=True)
         else:
@@ -647,52 +861,34 @@ def fetch_article_content(url: str) -> Optional[str]:
 def clean_item_for_audio(text: str) -> str:
     """Clean a single news item for audio output without using AI."""
     # Remove source suffixes
-    for suffix in ['(BBG)', '(RT)', '(CNBC)', '(FT)', '(WSJ)', '(NYT)', '(NBC)', '(TC)',
-                   '(ExecSum)', '(Bloomberg)', '(Reuters)', '(Financial Times)']:
-        text = text.replace(suffix, '').strip()
+    text = _AUDIO_SUFFIX_RE.sub('', text).strip()
 
     # Remove trailing open parenthesis (leftover from incomplete source removal)
-    text = re.sub(r'\s*\(\s*$', '', text)
-
-    # Expand common abbreviations
-    replacements = [
-        (' bps', ' basis points'),
-        (' BPS', ' basis points'),
-        (' bp ', ' basis point '),
-        (' bp.', ' basis point.'),
-        (' YoY', ' year over year'),
-        (' YTD', ' year to date'),
-        (' ATH', ' all-time high'),
-        (' QoQ', ' quarter over quarter'),
-        (' MoM', ' month over month'),
-        (' 1Y ', ' one-year '),
-        (' 2Y ', ' two-year '),
-        (' 3Y ', ' three-year '),
-        (' 4Y ', ' four-year '),
-        (' 5Y ', ' five-year '),
-        (' 7Y ', ' seven-year '),
-        (' 10Y ', ' ten-year '),
-        (' 30Y ', ' thirty-year '),
-        ('Y-', '-year-'),
-        ('2Y-10Y', '2-year-10-year'),
-    ]
-    for old, new in replacements:
-        text = text.replace(old, new)
+    text = _DANGLING_PAREN_RE.sub('', text)
+
+    # Expand common abbreviations (one pass over the text)
+    text = _AUDIO_ABBREV_RE.sub(lambda m: _AUDIO_ABBREVS[m.lastgroup], text)
 
     # Clean up double spaces
-    while '  ' in text:
-        text = text.replace('  ', ' ')
+    text = _MULTI_SPACE_RE.sub(' ', text)
 
     return text.strip()
 
 
-def summarize_items_with_ai(items: List[Dict], api_key: str) -> str:
-    """Process items for audio output. Uses simple text cleanup instead of AI to avoid dropping items."""
-    # Don't use AI for the main processing - it drops items
-    # Instead, do simple programmatic cleanup
+# Junk items (promo copy, truncated fragments) dropped from audio output
+_AUDIO_SKIP_RE = _keyword_re([
+    'middle east', "jensen huang's ces speech", 'potential scotus',
+    'path ahead for venezuela', 'litney partners', 'take a listen',
+    'stavmarket', 'updated for 202', 'straight from the source',
+    'schedule a demo', 'hour well spent', 'has built the universe',
+    'managers with over', 'collectively rely on', 'stavtar',
+    'connect to vendors', 'manage their vendors'
+])
+_INCOMPLETE_ENDINGS = ('...', 'driving', 'landmark', ' after', ' its')
 
-    output_lines = []
 
+def _iter_audio_lines(items: List[Dict]) -> Iterator[str]:
+    """Yield item titles cleaned for audio, dropping empty, junk and incomplete ones."""
     for item in items:
         title = item.get('title', '').strip()
 
@@ -701,64 +897,49 @@ def summarize_items_with_ai(items: List[Dict], api_key: str) -> str:
             continue
 
         # Skip items that are clearly incomplete or junk
-        skip_phrases = ['middle east', "jensen huang's ces speech", 'potential scotus',
-                       'path ahead for venezuela', 'litney partners', 'take a listen',
-                       'stavmarket', 'updated for 202', 'straight from the source',
-                       'schedule a demo', 'hour well spent', 'has built the universe',
-                       'managers with over', 'collectively rely on', 'stavtar',
-                       'connect to vendors', 'manage their vendors']
-        if any(phrase in title.lower() for phrase in skip_phrases):
+        if _AUDIO_SKIP_RE.search(title):
             continue
 
         # Skip items ending with incomplete phrases
-        if title.endswith('...') or title.endswith('driving') or title.endswith('landmark') or title.endswith(' after') or title.endswith(' its'):
+        if title.endswith(_INCOMPLETE_ENDINGS):
             continue
 
         # Clean the item for audio
         clean_title = clean_item_for_audio(title)
 
         if clean_title and len(clean_title) > 10:
-            output_lines.append(clean_title)
+            yield clean_title
 
-    return '\n'.join(output_lines)
 
+def _audio_lines(items: List[Dict]) -> str:
+    """Clean item titles for audio as one newline-separated string."""
+    return '\n'.join(_iter_audio_lines(items))
 
-def create_basic_summary(items: List[Dict]) -> str:
-    """Create a basic summary without AI - clean output for audio."""
-    output_lines = []
-
-    for item in items:
-        title = item.get('title', '').strip()
-
-        # Skip empty or too-short items
-        if not title or len(title) < 10:
-            continue
 
-        # Skip junk items
-        skip_phrases = ['middle east', "jensen huang's ces speech", 'potential scotus',
-                       'path ahead for venezuela', 'litney partners', 'take a listen',
-                       'stavmarket', 'updated for 202', 'straight from the source',
-                       'schedule a demo', 'hour well spent', 'has built the universe',
-                       'managers with over', 'collectively rely on', 'stavtar',
-                       'connect to vendors', 'manage their vendors']
-        if any(phrase in title.lower() for phrase in skip_phrases):
-            continue
+def write_lines(filepath: str, lines: Iterable[str]) -> None:
+    """Stream lines to a file as they're produced, newline-separated (no trailing newline)."""
+    with open(filepath, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+        separator = ''
+        for line in lines:
+            f.write(separator)
+            f.write(line)
+            separator = '\n'
 
-        # Skip items ending with incomplete phrases
-        if title.endswith('...') or title.endswith('driving') or title.endswith('landmark') or title.endswith(' after') or title.endswith(' its'):
-            continue
 
-        # Clean the item for audio
-        clean_title = clean_item_for_audio(title)
+def summarize_items_with_ai(items: List[Dict], api_key: str) -> str:
+    """Process items for audio output. Uses simple text cleanup instead of AI to avoid dropping items."""
+    # Don't use AI for the main processing - it drops items
+    # Instead, do simple programmatic cleanup
+    return _audio_lines(items)
 
-        if clean_title and len(clean_title) > 10:
-            output_lines.append(clean_title)
 
-    return '\n'.join(output_lines)
+def create_basic_summary(items: List[Dict]) -> str:
+    """Create a basic summary without AI - clean output for audio."""
+    return _audio_lines(items)
 
 
-def save_output(content: str, newsletter_urls: List[str]) -> str:
-    """Save the output to the weekly folder."""
+def save_output(lines: Iterable[str], newsletter_urls: List[str]) -> str:
+    """Save the output lines to the weekly folder."""
     week_folder = get_week_folder()
 
     # Generate filename with date and time to avoid overwriting
@@ -767,8 +948,7 @@ def save_output(content: str, newsletter_urls: List[str]) -> str:
     filepath = os.path.join(week_folder, filename)
 
     # Always write fresh (don't append)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    write_lines(filepath, lines)
 
     return filepath
 
@@ -805,8 +985,17 @@ def main():
     all_items = []
     newsletter_dates = {}  # Track dates for sorting
 
-    for url in urls:
-        items, newsletter_date = extract_newsletter_content(url, config)
+    # Fetch newsletters concurrently; map() keeps results in URL order.
+    # Without AI the run is dominated by HTML parsing, which threads can't
+    # spread across cores, so each newsletter gets its own process instead.
+    if args.no_ai and len(urls) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(len(urls), os.cpu_count() or 1))
+    else:
+        executor = ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(urls)))
+    with executor:
+        results = list(executor.map(functools.partial(extract_newsletter_content, config=config), urls))
+
+    for url, (items, newsletter_date) in zip(urls, results):
         if newsletter_date:
             newsletter_dates[url] = newsletter_date
         for item in items:
@@ -815,24 +1004,37 @@ def main():
 
     # Sort items by newsletter date (oldest first for chronological narrative)
     if newsletter_dates:
-        def get_item_date(item):
-            url = item.get('source_url', '')
-            date_str = newsletter_dates.get(url, '')
+        last_fmt = None  # Newsletters share a date format, so try the last match first
+
+        def parse_newsletter_date(date_str):
+            nonlocal last_fmt
             if not date_str:
                 return datetime.min
 
             # Clean up date string - remove timezone suffix if present
             date_str = date_str.split('+')[0].split('Z')[0].strip()
 
+            # Most newsletter timestamps are ISO-8601, which fromisoformat
+            # parses far faster than strptime
+            try:
+                return datetime.fromisoformat(date_str).replace(tzinfo=None)
+            except ValueError:
+                pass
+
             # Try to parse common date formats
-            for fmt in ['%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S', '%b %d, %Y', '%B %d, %Y', '%Y-%m-%d', '%m/%d/%Y', '%d %b %Y']:
+            for fmt in ([last_fmt] if last_fmt else []) + DATE_FORMATS:
                 try:
-                    return datetime.strptime(date_str, fmt)
+                    parsed = datetime.strptime(date_str, fmt)
                 except (ValueError, TypeError):
                     continue
+                last_fmt = fmt
+                return parsed
             return datetime.min  # Put items without dates first
 
-        all_items.sort(key=get_item_date)
+        # Items share their newsletter's date, so parse each newsletter's once
+        # rather than once per item
+        sort_dates = {url: parse_newsletter_date(date_str) for url, date_str in newsletter_dates.items()}
+        all_items.sort(key=lambda item: sort_dates.get(item.get('source_url', ''), datetime.min))
         print(f"\nSorted {len(all_items)} items by newsletter date (oldest first)")
 
     if not all_items:
@@ -841,25 +1043,23 @@ def main():
 
     print(f"\nTotal items to process: {len(all_items)}")
 
-    # Generate summary
-    if args.no_ai:
-        content = create_basic_summary(all_items)
-    else:
+    # Generate summary. Both paths use the same cleanup (see
+    # summarize_items_with_ai), so lines are cleaned lazily and streamed to
+    # the output file instead of being joined into one string first.
+    if not args.no_ai:
         api_key = load_api_key()
         if api_key:
             print("\nGenerating AI summary...")
-            content = summarize_items_with_ai(all_items, api_key)
         else:
             print("Warning: No API key found. Using basic summary.")
-            content = create_basic_summary(all_items)
+    lines = _iter_audio_lines(all_items)
 
     # Save output
     if args.output:
         filepath = args.output
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_lines(filepath, lines)
     else:
-        filepath = save_output(content, urls)
+        filepath = save_output(lines, urls)
 
     print(f"\nOutput saved to: {filepath}")
     return 0
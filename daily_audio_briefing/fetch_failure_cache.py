@@ -0,0 +1,127 @@
+"""
+Fetch Failure Cache — Negative cache for URLs that could not be fetched.
+
+Records URLs where every fetch method failed so re-runs skip them for a
+backoff window instead of paying the full timeout on each method again.
+The window doubles with each consecutive failure (60s, 120s, ... capped at
+1 hour) and an entry is cleared as soon as the URL fetches successfully.
+Used by data_csv_processor.py (DataCSVProcessor._fetch_content).
+
+Cache file: failed_urls.json (in cache_dir, resolved by the caller)
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+CACHE_FILENAME = 'failed_urls.json'
+BASE_BACKOFF_SECONDS = 60
+MAX_BACKOFF_SECONDS = 3600
+TTL_SECONDS = 24 * 3600  # Forget failures this long after their retry time
+
+
+def _empty_cache():
+    """Return an empty cache structure."""
+    return {
+        'version': 1,
+        'urls': {}
+    }
+
+
+def url_key(url):
+    """Return the cache key for a URL."""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def backoff_seconds(failures):
+    """Return the retry delay after the given number of consecutive failures."""
+    return min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2 ** max(failures - 1, 0))
+
+
+def should_skip(cache_data, url, now=None):
+    """Return True if url failed recently and is still inside its backoff window."""
+    entry = cache_data.get('urls', {}).get(url_key(url))
+    if not entry:
+        return False
+    now = time.time() if now is None else now
+    return now < entry.get('next_retry_at', 0)
+
+
+def record_failure(cache_data, url, now=None):
+    """Record a failed fetch of url and push its next retry out.
+
+    Returns:
+        The updated entry {"failures": n, "next_retry_at": ts}
+    """
+    now = time.time() if now is None else now
+    urls = cache_data.setdefault('urls', {})
+    key = url_key(url)
+    failures = urls.get(key, {}).get('failures', 0) + 1
+    entry = {
+        'failures': failures,
+        'next_retry_at': now + backoff_seconds(failures)
+    }
+    urls[key] = entry
+    return entry
+
+
+def clear_failure(cache_data, url):
+    """Forget any recorded failure for url. Returns True if one was removed."""
+    return cache_data.get('urls', {}).pop(url_key(url), None) is not None
+
+
+def load_cache(cache_dir=None):
+    """Load the failed URL cache from disk.
+
+    Args:
+        cache_dir: Directory containing failed_urls.json
+
+    Returns:
+        Cache dict with structure {"version": 1, "urls": {key: {...}}}
+        Returns empty structure if file is missing, empty, or corrupt.
+    """
+    if not cache_dir:
+        return _empty_cache()
+    cache_path = os.path.join(cache_dir, CACHE_FILENAME)
+    if not os.path.exists(cache_path):
+        return _empty_cache()
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or 'urls' not in data:
+            logger.warning("Failure cache file has invalid structure, returning empty cache")
+            return _empty_cache()
+        return data
+    except (json.JSONDecodeError, IOError, OSError) as e:
+        logger.warning(f"Failed to load failure cache: {e}")
+        return _empty_cache()
+
+
+def save_cache(cache_dir=None, cache_data=None, now=None):
+    """Save the failed URL cache to disk, dropping long-expired entries.
+
+    Args:
+        cache_dir: Directory to write failed_urls.json into
+        cache_data: Cache dict to save
+    """
+    if not cache_dir or cache_data is None:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = os.path.join(cache_dir, CACHE_FILENAME)
+    now = time.time() if now is None else now
+    cleaned_urls = {
+        key: entry for key, entry in cache_data.get('urls', {}).items()
+        if entry.get('next_retry_at', 0) + TTL_SECONDS >= now
+    }
+    cleaned_data = {
+        'version': cache_data.get('version', 1),
+        'urls': cleaned_urls
+    }
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cleaned_data, f, indent=2)
+        logger.debug(f"Saved failure cache with {len(cleaned_urls)} entries to {cache_path}")
+    except (IOError, OSError) as e:
+        logger.error(f"Failed to save failure cache: {e}")
@@ -1,5 +1,6 @@
 """File operations for the Audio Briefing application."""
 import os
+import shutil
 import sys
 
 
@@ -120,18 +121,20 @@ class FileManager:
             key: API key to save
         """
         env_path = os.path.join(self.base_dir, ".env")
-        lines = []
-        
-        if os.path.exists(env_path):
-            with open(env_path, "r") as f:
-                lines = f.readlines()
-        
-        # Remove existing GEMINI_API_KEY line
-        lines = [line for line in lines if not line.strip().startswith("GEMINI_API_KEY=")]
-        lines.append(f"GEMINI_API_KEY={key}\n")
-        
-        with open(env_path, "w") as f:
-            f.writelines(lines)
+        tmp_path = env_path + ".tmp"
+
+        # Copy the other lines across in one pass, then swap the file in
+        # atomically so an interrupted save never leaves a truncated .env
+        with open(tmp_path, "w") as out:
+            if os.path.exists(env_path):
+                with open(env_path, "r") as f:
+                    for line in f:
+                        # Remove existing GEMINI_API_KEY line
+                        if not line.strip().startswith("GEMINI_API_KEY="):
+                            out.write(line)
+                shutil.copymode(env_path, tmp_path)
+            out.write(f"GEMINI_API_KEY={key}\n")
+        os.replace(tmp_path, env_path)
     
     def load_text_file(self, file_path):
         """Load content from a text file and save to summary.txt.
@@ -1,14 +1,18 @@
 import os
+import re
 import sys
 import datetime
-import dateparser
-import google.generativeai as genai
-import scrapetube
-import yt_dlp
-import glob
+import functools
+import json
+import threading
 import argparse
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+import text_cache
+from transcript_dedup import TranscriptIndex
+
 # Load environment variables
 load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -30,26 +34,52 @@ def get_resource_path(filename):
 
 OUTPUT_FILE = "summary.txt"
 SPECIFIC_OUTPUT_DIR = "Specific Video Lists"
+SUMMARY_CACHE_DIR = "summary_cache"
+TRANSCRIPT_CACHE_DIR = "transcript_cache"
+# YouTube channels processed at once per day
+MAX_CHANNEL_WORKERS = 8
+# Transcript characters sent to the model per video
+TRANSCRIPT_CHAR_LIMIT = 50000
+# Subtitle downloads run ahead of summarization, per channel
+MAX_TRANSCRIPT_WORKERS = 5
+# Consecutive videos with transcripts up to this long are summarized
+# together, up to MAX_SUMMARY_BATCH per request (one call instead of several
+# against the free tier's requests-per-minute limit)
+SHORT_TRANSCRIPT_CHARS = 12000
+MAX_SUMMARY_BATCH = 5
+# How far past the date window a listed video must be before process_channel
+# stops reading the (newest-first) channel listing
+FEED_ORDER_SLACK = datetime.timedelta(days=1)
+# Most recent summaries shown to the model as dedup context
+SUMMARY_CONTEXT_ENTRIES = 5
+# LLM summary calls in flight at once across all channels, to stay under
+# provider rate limits (and not swamp a local Ollama fallback)
+MAX_CONCURRENT_SUMMARIES = 5
+_summary_slots = threading.BoundedSemaphore(MAX_CONCURRENT_SUMMARIES)
 # These are config files that may be bundled with the app
 CHANNELS_FILE = get_resource_path("channels.txt")
 SOURCES_JSON = get_resource_path("sources.json")
 
 def log(msg):
+    # No per-line flush: a terminal is already line-buffered, and every runner
+    # (subprocess capture, in-process StringIO, web_app) reads output at the end
     print(f"[DEBUG] {msg}")
-    sys.stdout.flush()
 
 def get_week_folder(target_date):
     """Create and return week-based folder path matching audio file organization"""
     year, week, _ = target_date.isocalendar()
     folder_name = f"Week_{week}_{year}"
-    
-    if not os.path.exists(folder_name):
+
+    try:
         os.makedirs(folder_name)
         log(f"Created new folder: {folder_name}")
-        
+    except FileExistsError:
+        pass
+
     return folder_name
 
 def setup_gemini(model_name="gemini-2.5-flash"):
+    import google.generativeai as genai
     env_key = os.environ.get("GEMINI_API_KEY")
     if env_key:
         log(f"Using GEMINI_API_KEY from environment variable.")
@@ -65,22 +95,37 @@ def setup_gemini(model_name="gemini-2.5-flash"):
     log(f"Using model: {model_name}")
     return genai.GenerativeModel(model_name)
 
+# Everything clean_vtt drops, in one sweep over the whole file: header lines,
+# cue numbers and cue timing lines, plus cue markup (<c>, <00:00:01.000>, ...)
+# inside caption lines
+_VTT_CLEAN_RE = re.compile(
+    r"^[^\S\n]*(?:(?:WEBVTT|Kind:|Language:)[^\n]*|\d+[^\S\n]*|[^\n]*-->[^\n]*)$|<[^>\n]+>",
+    re.MULTILINE,
+)
+
+# Speech disfluencies removed before sending to AI
+_FILLER_RES = [re.compile(p) for p in (
+    r'\b[Uu]h+\b',           # uh, uhh, uhhh
+    r'\b[Uu]m+\b',           # um, umm, ummm
+    r'\b[Hh]mm+\b',          # hmm, hmmm
+    r'\b[Ee]r+\b(?!\w)',     # er, err (but not "error", "era", etc.)
+    r'\b[Aa]h+\b',           # ah, ahh
+)]
+_DOUBLE_SPACE_RE = re.compile(r'  +')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' ([,.])')
+
 def clean_vtt(text):
-    import re
-    lines = text.splitlines()
+    """Clean VTT captions given as a string or any iterable of lines (e.g. an open file)."""
+    if not isinstance(text, str):
+        text = "".join(text)
     cleaned = []
     last_line = ""
-    for line in lines:
+    # Only blank lines and repeats are left for Python to drop; comparing
+    # after the sweep means a caption repeated with and without word timings
+    # is only sent to the model once
+    for line in _VTT_CLEAN_RE.sub("", text).splitlines():
         line = line.strip()
-        if not line: continue
-        if "-->" in line: continue
-        if line.isdigit(): continue
-        if line.startswith("WEBVTT"): continue
-        if line.startswith("Kind:"): continue
-        if line.startswith("Language:"): continue
-        if line == last_line: continue
-        if "<" in line and ">" in line:
-            line = re.sub(r"<[^>]+>", "", line)
+        if not line or line == last_line: continue
         cleaned.append(line)
         last_line = line
 
@@ -89,63 +134,87 @@ def clean_vtt(text):
     # Remove speech disfluencies before sending to AI
     # This catches filler words the AI model sometimes misses,
     # especially in later videos when context is large
-    filler_patterns = [
-        r'\b[Uu]h+\b',           # uh, uhh, uhhh
-        r'\b[Uu]m+\b',           # um, umm, ummm
-        r'\b[Hh]mm+\b',          # hmm, hmmm
-        r'\b[Ee]r+\b(?!\w)',     # er, err (but not "error", "era", etc.)
-        r'\b[Aa]h+\b',           # ah, ahh
-    ]
-    for pattern in filler_patterns:
-        text = re.sub(pattern, '', text)
+    for pattern in _FILLER_RES:
+        text = pattern.sub('', text)
 
     # Clean up artifacts: double spaces, space before punctuation
-    text = re.sub(r'  +', ' ', text)
-    text = re.sub(r' ([,.])', r'\1', text)
+    text = _DOUBLE_SPACE_RE.sub(' ', text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
 
     return text
 
+SUBTITLE_YDL_OPTS = {
+    "skip_download": True,
+    "writesubtitles": True,
+    "writeautomaticsub": True,
+    "subtitleslangs": ["en"],
+    "subtitlesformat": "vtt/best",
+    "quiet": True,
+    "no_warnings": True,
+    # Only captions are used: don't fetch the HLS/DASH format manifests or
+    # list auto-translated subtitle tracks for each video
+    "extractor_args": {"youtube": {"skip": ["hls", "dash", "translated_subs"]}},
+}
+_ydl_local = threading.local()
+
+def _subtitle_downloader():
+    """This thread's YoutubeDL for subtitle lookups, created on first use.
+
+    YoutubeDL setup (option parsing, extractor registration) is costly, so one
+    instance is reused per thread.
+    """
+    ydl = getattr(_ydl_local, "ydl", None)
+    if ydl is None:
+        import yt_dlp
+        ydl = yt_dlp.YoutubeDL(SUBTITLE_YDL_OPTS)
+        _ydl_local.ydl = ydl
+    return ydl
+
+# YouTube video ids double as transcript cache file names
+_VIDEO_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
 def get_transcript_text(video_id):
+    """Return the cleaned English transcript for a video, or None.
+
+    Transcripts are cached on disk by video id, so re-running a day (or an
+    overlapping --days range) skips the yt-dlp lookup for videos already seen.
+    """
+    cache_dir = None
+    if _VIDEO_ID_RE.match(video_id or ""):
+        cache_dir = os.path.join(get_data_directory(), TRANSCRIPT_CACHE_DIR)
+        cached = text_cache.get(cache_dir, video_id)
+        if cached is not None:
+            return cached
+    text = _download_transcript(video_id)
+    text_cache.put(cache_dir, video_id, text)
+    return text
+
+
+def _download_transcript(video_id):
     url = f"https://www.youtube.com/watch?v={video_id}"
-    temp_prefix = f"temp_sub_{video_id}"
-    for f in glob.glob(f"{temp_prefix}*"):
-        try: os.remove(f)
-        except: pass
-
-    ydl_opts = {
-        "skip_download": True,
-        "writesubtitles": True,
-        "writeautomaticsub": True,
-        "subtitleslangs": ["en"],
-        "outtmpl": temp_prefix,
-        "quiet": True,
-        "no_warnings": True,
-    }
+    # Let yt-dlp pick the English track (manual before automatic, vtt
+    # preferred) without writing anything, then fetch it straight into memory
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
+        ydl = _subtitle_downloader()
+        info = ydl.extract_info(url, download=False)
     except Exception as e:
         log(f"  -> yt-dlp download error: {e}")
         return None
-    
-    files = glob.glob(f"{temp_prefix}*.vtt")
-    if not files:
-        files = glob.glob(f"{temp_prefix}*")
-        files = [f for f in files if f.endswith((".vtt", ".ttml", ".srv1", ".srt"))]
-    
-    if not files:
+
+    requested = (info or {}).get("requested_subtitles") or {}
+    subtitle = requested.get("en") or next(iter(requested.values()), None)
+    if not subtitle:
         return None
-        
-    filename = files[0]
+
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = subtitle.get("data")
+        if content is None:
+            with ydl.urlopen(subtitle["url"]) as response:
+                content = response.read().decode("utf-8")
     except Exception as e:
-        log(f"  -> Error reading file: {e}")
+        log(f"  -> Error reading subtitles: {e}")
         return None
-    for f in files:
-        try: os.remove(f)
-        except: pass
     return clean_vtt(content)
 
 def get_data_directory():
@@ -163,7 +232,11 @@ def get_data_directory():
         return os.path.dirname(os.path.abspath(__file__))
 
 def load_custom_instructions():
-    """Load custom instructions from file if it exists. Checks data directory first."""
+    """Load custom instructions from file if it exists. Checks data directory first.
+
+    File contents are memoized on (path, mtime): summarize_text asks for them
+    on every video, and editing the file still takes effect on the next call.
+    """
     # Try data directory first (persistent across reinstalls)
     data_dir = get_data_directory()
     paths_to_try = [
@@ -174,181 +247,350 @@ def load_custom_instructions():
 
     for path in paths_to_try:
         try:
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if content:
-                        return content
+            content = _read_custom_instructions(path, os.path.getmtime(path))
+            if content:
+                return content
         except Exception:
             pass
     return ""
 
-def summarize_text(model, text, previous_context="", channel_url=""):
-    try:
-        custom_instructions = load_custom_instructions()
-        custom_section = (
-            "\n\nUSER PROFILE & PREFERENCES (MANDATORY — these override the comprehensiveness "
-            f"guidance above; obey every omit/filter instruction):\n{custom_instructions}\n"
-            if custom_instructions else ""
+@functools.lru_cache(maxsize=8)
+def _read_custom_instructions(path, mtime):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+def trim_transcript(text, limit=TRANSCRIPT_CHAR_LIMIT):
+    """Fit a transcript into limit chars, keeping its opening and its ending.
+
+    Long videos usually close with their conclusions, which a plain
+    text[:limit] cut would drop.
+    """
+    if len(text) <= limit:
+        return text
+    separator = "\n...\n"
+    head = limit * 3 // 5
+    tail = limit - head - len(separator)
+    return text[:head] + separator + text[-tail:]
+
+@functools.lru_cache(maxsize=8)
+def _summary_instructions(custom_instructions, promoter_channel=False):
+    """Build the fixed part of the summary prompt once per set of instructions.
+
+    It leads every prompt, ahead of the per-call context and transcript, so
+    consecutive Gemini calls share a long identical prefix that the API's
+    implicit context caching bills at the cached-token rate.
+    """
+    custom_section = (
+        "\n\nUSER PROFILE & PREFERENCES (MANDATORY — these override the comprehensiveness "
+        f"guidance above; obey every omit/filter instruction):\n{custom_instructions}\n"
+        if custom_instructions else ""
+    )
+
+    # Channel-specific topic suppression: drop Sui coverage from Raoul Pal /
+    # Real Vision channels (paid Sui promoters), per user preference.
+    sui_clause = ""
+    if promoter_channel:
+        sui_clause = (
+            "8. CHANNEL-SPECIFIC RULE (MANDATORY): This video is from a Raoul Pal / Real Vision "
+            "channel, which promotes the Sui blockchain. OMIT every mention of Sui (the SUI token, "
+            "Sui Network, or Sui ecosystem). If nothing of substance remains afterward, output ONLY: "
+            "\"Skipped [Video Title] as promotional.\"\n"
         )
 
-        # Channel-specific topic suppression: drop Sui coverage from Raoul Pal /
-        # Real Vision channels (paid Sui promoters), per user preference.
-        sui_clause = ""
-        _chan = (channel_url or "").lower()
-        if "realvision" in _chan or "raoulpal" in _chan:
-            sui_clause = (
-                "8. CHANNEL-SPECIFIC RULE (MANDATORY): This video is from a Raoul Pal / Real Vision "
-                "channel, which promotes the Sui blockchain. OMIT every mention of Sui (the SUI token, "
-                "Sui Network, or Sui ecosystem). If nothing of substance remains afterward, output ONLY: "
-                "\"Skipped [Video Title] as promotional.\"\n"
-            )
+    return (
+        "You are an expert news analyst producing content for an AUDIO BRIEFING.\n"
+        "Use the following rules to summarize the provided video transcript.\n\n"
+        "RULES:\n"
+        "1. Cross-Message Deduplication: If duplicative, output ONLY: \"Skipped [Video Title] as duplicative.\"\n"
+        "2. Tutorials/Promotions: If tutorial/promo, output ONLY: \"Skipped [Video Title] as tutorial/promotion.\"\n"
+        "3. Chart Technical Analysis: If the video is PRIMARILY about chart patterns, trading setups, "
+        "price targets, RSI/MACD/indicators, candlestick analysis, or order blocks, "
+        "output ONLY: \"Skipped [Video Title] as technical analysis.\"\n"
+        "3b. Omit Promotional Content (even when the rest of the video is worth keeping): "
+        "Cut every sponsor read, advertisement, paid promotion, promo/discount code, giveaway, "
+        "affiliate/referral pitch, and ALL invitations to join or subscribe to a paid group, Discord, "
+        "Telegram, Patreon, newsletter, or trading 'community'/private platform (e.g. 'join our Empire "
+        "community', 'link in the description', 'members get the charts'). Do not name or describe these offers.\n"
+        "3c. Omit Intraday/Short-Term TA (even inside non-TA videos): Drop short-term chart calls, specific "
+        "price levels and targets, support/resistance, indicator readings, candlestick/order-block talk, and "
+        "rapid-fire per-coin 'shitcoin' rundowns. Keep only higher-timeframe macro view, sentiment, narrative "
+        "shifts, and fundamentals.\n"
+        "4. Comprehensive Coverage: Extract ALL key insights, unique perspectives, and actionable information. "
+        "Don't skip important details, data points, analysis, or unique angles that provide value or 'alpha' "
+        "(subject to the omit rules in 2, 3b, and 3c, which always take priority).\n"
+        "5. Key Points to Capture:\n"
+        "   - All significant data, statistics, and metrics\n"
+        "   - Unique insights, contrarian views, or novel analysis\n"
+        "   - Actionable information and specific recommendations\n"
+        "   - Important context, reasoning, and causal relationships\n"
+        "   - Notable predictions, forecasts, or forward-looking statements\n"
+        "6. Format Requirements for AUDIO (Text-to-Speech):\n"
+        "   - Write in a natural, conversational style suitable for reading aloud.\n"
+        "   - DO NOT use symbols like #, *, -, or bullet points.\n"
+        "   - Use phrases like First, Additionally, Furthermore, Moreover, Finally, instead of lists.\n"
+        "   - Write out dates (e.g., December fifth).\n"
+        "   - NO timestamps.\n"
+        "   - Organize into coherent paragraphs with smooth transitions.\n"
+        "7. Transcript Cleanup (CRITICAL — apply this rule rigorously regardless of context length): "
+        "The source is a raw video transcript. You MUST remove ALL speech disfluencies — "
+        "um, uh, uhh, ah, hmm, like, you know, I mean, sort of, kind of, right, okay so. "
+        "Remove verbal tics, false starts, self-corrections, and direct-address phrases "
+        "(hey guys, what's up everyone). Paraphrase conversational/rambling sections into "
+        "clean prose. The output MUST read as polished writing, never a transcription. "
+        "If any filler word remains in your output, you have failed this rule.\n"
+        f"{sui_clause}"
+        f"{custom_section}\n"
+    )
+
+def _generate_cached(model, prompt, caller):
+    """Send prompt down the LLM fallback chain, or reuse the stored response
+    to an identical prompt (re-runs of a day). None if every provider failed."""
+    cache_dir = os.path.join(get_data_directory(), SUMMARY_CACHE_DIR)
+    cache_key = text_cache.summary_key(getattr(model, "model_name", ""), prompt)
+    cached = text_cache.get(cache_dir, cache_key)
+    if cached is not None:
+        log("  -> Using cached summary.")
+        return cached
+
+    from llm_fallback import generate_with_fallback
+    with _summary_slots:
+        result = generate_with_fallback(prompt, gemini_model=model, caller=caller)
+    if result:
+        text_cache.put(cache_dir, cache_key, result)
+    return result
 
+def summarize_text(model, text, previous_context="", channel_url=""):
+    try:
+        _chan = (channel_url or "").lower()
         prompt = (
-            "You are an expert news analyst producing content for an AUDIO BRIEFING.\n"
-            "Use the following rules to summarize the provided video transcript.\n\n"
-            
+            _summary_instructions(load_custom_instructions(), "realvision" in _chan or "raoulpal" in _chan) +
             "CONTEXT (Summaries processed so far):\n"
             f"{previous_context}\n\n"
-            
-            "RULES:\n"
-            "1. Cross-Message Deduplication: If duplicative, output ONLY: \"Skipped [Video Title] as duplicative.\"\n"
-            "2. Tutorials/Promotions: If tutorial/promo, output ONLY: \"Skipped [Video Title] as tutorial/promotion.\"\n"
-            "3. Chart Technical Analysis: If the video is PRIMARILY about chart patterns, trading setups, "
-            "price targets, RSI/MACD/indicators, candlestick analysis, or order blocks, "
-            "output ONLY: \"Skipped [Video Title] as technical analysis.\"\n"
-            "3b. Omit Promotional Content (even when the rest of the video is worth keeping): "
-            "Cut every sponsor read, advertisement, paid promotion, promo/discount code, giveaway, "
-            "affiliate/referral pitch, and ALL invitations to join or subscribe to a paid group, Discord, "
-            "Telegram, Patreon, newsletter, or trading 'community'/private platform (e.g. 'join our Empire "
-            "community', 'link in the description', 'members get the charts'). Do not name or describe these offers.\n"
-            "3c. Omit Intraday/Short-Term TA (even inside non-TA videos): Drop short-term chart calls, specific "
-            "price levels and targets, support/resistance, indicator readings, candlestick/order-block talk, and "
-            "rapid-fire per-coin 'shitcoin' rundowns. Keep only higher-timeframe macro view, sentiment, narrative "
-            "shifts, and fundamentals.\n"
-            "4. Comprehensive Coverage: Extract ALL key insights, unique perspectives, and actionable information. "
-            "Don't skip important details, data points, analysis, or unique angles that provide value or 'alpha' "
-            "(subject to the omit rules in 2, 3b, and 3c, which always take priority).\n"
-            "5. Key Points to Capture:\n"
-            "   - All significant data, statistics, and metrics\n"
-            "   - Unique insights, contrarian views, or novel analysis\n"
-            "   - Actionable information and specific recommendations\n"
-            "   - Important context, reasoning, and causal relationships\n"
-            "   - Notable predictions, forecasts, or forward-looking statements\n"
-            "6. Format Requirements for AUDIO (Text-to-Speech):\n"
-            "   - Write in a natural, conversational style suitable for reading aloud.\n"
-            "   - DO NOT use symbols like #, *, -, or bullet points.\n"
-            "   - Use phrases like First, Additionally, Furthermore, Moreover, Finally, instead of lists.\n"
-            "   - Write out dates (e.g., December fifth).\n"
-            "   - NO timestamps.\n"
-            "   - Organize into coherent paragraphs with smooth transitions.\n"
-            "7. Transcript Cleanup (CRITICAL — apply this rule rigorously regardless of context length): "
-            "The source is a raw video transcript. You MUST remove ALL speech disfluencies — "
-            "um, uh, uhh, ah, hmm, like, you know, I mean, sort of, kind of, right, okay so. "
-            "Remove verbal tics, false starts, self-corrections, and direct-address phrases "
-            "(hey guys, what's up everyone). Paraphrase conversational/rambling sections into "
-            "clean prose. The output MUST read as polished writing, never a transcription. "
-            "If any filler word remains in your output, you have failed this rule.\n"
-            f"{sui_clause}"
-            f"{custom_section}\n"
-
             "TRANSCRIPT:\n"
-            f"{text[:50000]}"
-        )
-        
-        from llm_fallback import generate_with_fallback
-        result = generate_with_fallback(
-            prompt, gemini_model=model, caller="yt_news.summarize"
+            f"{trim_transcript(text)}"
         )
-        return result or "Skipped [all providers failed]"
+
+        result = _generate_cached(model, prompt, "yt_news.summarize")
+        if not result:
+            return "Skipped [all providers failed]"
+        return result
     except Exception as e:
         log(f"  -> Summarization Error: {e}")
         return f"Error summarizing: {e}"
 
-def process_channel(channel_url, model, shared_context, cutoff_date, cutoff_time=None):
-    log(f"--- Processing Channel: {channel_url} ---")
-    limit = 20
-    # scrapetube has been flaky against YouTube's evolving HTML; use the
-    # combined scrapetube + RSS fallback so transient breakage doesn't blank
-    # out the whole brief.
+# Markdown code fence some models wrap JSON output in
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?|```\s*$", re.IGNORECASE)
+
+def summarize_batch(model, videos, previous_context="", channel_url=""):
+    """Summarize several short videos with one model call.
+
+    videos: list of (title, transcript). Returns one summary (or "Skipped ..."
+    line) per video, in order, or None when the response can't be split -
+    the caller then falls back to summarize_text per video.
+    """
     try:
-        from youtube_rss import fetch_channel_videos_with_fallback
-        videos = fetch_channel_videos_with_fallback(channel_url, limit=limit, debug_log=log)
-        log(f"Fetched {len(videos)} recent videos.")
+        _chan = (channel_url or "").lower()
+        transcripts = "".join(
+            f"=== VIDEO {i}: {title} ===\n{text}\n\n"
+            for i, (title, text) in enumerate(videos, 1)
+        )
+        prompt = (
+            _summary_instructions(load_custom_instructions(), "realvision" in _chan or "raoulpal" in _chan) +
+            "CONTEXT (Summaries processed so far):\n"
+            f"{previous_context}\n\n"
+            f"TRANSCRIPTS ({len(videos)} separate videos - apply the rules to each one on its own):\n"
+            f"{transcripts}"
+            f"Respond with ONLY a JSON array of exactly {len(videos)} strings: the summary "
+            "(or single Skipped line) for each video, in the order given.\n"
+        )
+
+        result = _generate_cached(model, prompt, "yt_news.summarize_batch")
+        if not result:
+            return ["Skipped [all providers failed]"] * len(videos)
+        summaries = json.loads(_JSON_FENCE_RE.sub("", result).strip())
     except Exception as e:
-        log(f"Error fetching videos for {channel_url}: {e}")
-        return [], shared_context
+        log(f"  -> Batch summarization error: {e}")
+        return None
+    if (not isinstance(summaries, list) or len(summaries) != len(videos)
+            or not all(isinstance(summary, str) for summary in summaries)):
+        log("  -> Batch response did not match the videos sent.")
+        return None
+    return summaries
+
+def _summary_batches(videos, max_videos=MAX_SUMMARY_BATCH, char_limit=TRANSCRIPT_CHAR_LIMIT):
+    """Group consecutive short videos for summarize_batch.
+
+    videos yields (title, pub_date, transcript). Transcripts longer than
+    SHORT_TRANSCRIPT_CHARS go out alone; a group stays within max_videos and
+    char_limit characters of transcript, the budget of one long video.
+    """
+    batch, size = [], 0
+    for video in videos:
+        length = len(video[2])
+        if length > SHORT_TRANSCRIPT_CHARS:
+            if batch:
+                yield batch
+                batch, size = [], 0
+            yield [video]
+            continue
+        if batch and (len(batch) >= max_videos or size + length > char_limit):
+            yield batch
+            batch, size = [], 0
+        batch.append(video)
+        size += length
+    if batch:
+        yield batch
+
+# "3 hours ago" / "1 day ago" - almost every publishedTimeText (and all of the
+# RSS fallback's) is one of these, so they skip dateparser entirely
+_RELATIVE_AGO_RE = re.compile(r'^(\d+)\s+(second|minute|hour|day|week)s?\s+ago$', re.IGNORECASE)
+# Ages of at least a week, which can be rejected unparsed for short windows
+_WEEKS_OR_OLDER_RE = re.compile(r'\b(?:weeks?|months?|years?)\s+ago\b', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1)
+def _date_parser():
+    """One reusable English-only parser; dateparser.parse() would run language
+    detection across every locale on each call. Built on first use, as
+    dateparser is slow to import."""
+    import dateparser
+    return dateparser.DateDataParser(languages=['en'], settings={'PREFER_DATES_FROM': 'past'})
+
+@functools.lru_cache(maxsize=1024)
+def _parse_with_dateparser(date_text):
+    """dateparser fallback, memoized: the strings that reach it are absolute
+    dates or month/year-scale ages, shared across channels and days."""
+    return _date_parser().get_date_data(date_text).date_obj
+
+def parse_published_date(date_text):
+    """Parse a YouTube published-time string into a datetime, or None."""
+    match = _RELATIVE_AGO_RE.match(date_text.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2).lower()
+        return datetime.datetime.now() - datetime.timedelta(**{unit + "s": amount})
+    return _parse_with_dateparser(date_text)
+
+# Title patterns that indicate pure technical analysis / chart trading videos
+# These are skipped before transcript fetch to save API calls
+_TA_SKIP_PATTERNS = [
+    r'\bchart\b.*\banalysis\b',
+    r'\btechnical analysis\b',
+    r'\bprice prediction\b',
+    r'\bprice target\b',
+    r'\bsupport and resistance\b',
+    r'\btrading setup\b',
+    r'\btrade setup\b',
+    r'\btrading strategy\b',
+    r'\bscalp(ing)?\b',
+    r'\bbull(ish)? flag\b',
+    r'\bbear(ish)? flag\b',
+    r'\bhead and shoulders\b',
+    r'\bwedge pattern\b',
+    r'\brsi\b.*\bdivergence\b',
+    r'\bfibonacci\b',
+    r'\bElliott wave\b',
+    r'\bmoving average\b',
+    r'\bMACD\b',
+    r'\bBollinger\b',
+    r'\bichimoku\b',
+    r'\bcandlestick\b',
+    r'\border block\b',
+    r'\bbreakout\b.*\btarget\b',
+    r'\blong\b.*\bshort\b.*\btrade\b',
+    r'\brisk.to.reward\b',
+]
+_TA_SKIP_RE = re.compile('|'.join(_TA_SKIP_PATTERNS), re.IGNORECASE)
+
+# Title keywords that strongly suggest TA content (matched as substrings)
+_TA_TITLE_KEYWORDS = [
+    'major move for',
+    'pump incoming',
+    'dump incoming',
+    'buy now',
+    'sell now',
+    'exact target',
+    'next target',
+    'moon soon',
+    'altcoin season',
+    'altcoins to buy',
+]
+
+# Sui-shilling titles from Raoul Pal / Real Vision (user preference)
+_SUI_TITLE_RE = re.compile(r"\bsui\b", re.IGNORECASE)
+
+def process_channel(channel_url, model, shared_context, cutoff_date, cutoff_time=None, channel_videos=None,
+                    seen_transcripts=None):
+    """Summarize a channel's videos matching the cutoff.
+
+    channel_videos: optional {channel_url: videos} dict shared across the
+    days of one run, so a multi-day backfill lists each channel only once.
+    seen_transcripts: optional TranscriptIndex shared by the run's channels;
+    videos whose transcript nearly matches one already seen are skipped
+    without calling the model.
+    """
+    log(f"--- Processing Channel: {channel_url} ---")
+    limit = 20
+    if channel_videos is not None and channel_url in channel_videos:
+        videos = channel_videos[channel_url]
+        log(f"Reusing {len(videos)} recent videos fetched earlier this run.")
+    else:
+        # scrapetube has been flaky against YouTube's evolving HTML; use the
+        # combined scrapetube + RSS fallback so transient breakage doesn't blank
+        # out the whole brief.
+        try:
+            from youtube_rss import fetch_channel_videos_with_fallback
+            videos = fetch_channel_videos_with_fallback(channel_url, limit=limit, debug_log=log)
+            log(f"Fetched {len(videos)} recent videos.")
+        except Exception as e:
+            log(f"Error fetching videos for {channel_url}: {e}")
+            return [], shared_context
+        if channel_videos is not None:
+            channel_videos[channel_url] = videos
 
     new_summaries = []
     # cutoff_date provided by caller; cutoff_time for hours mode
-    
-    # Title patterns that indicate pure technical analysis / chart trading videos
-    # These are skipped before transcript fetch to save API calls
-    TA_SKIP_PATTERNS = [
-        r'\bchart\b.*\banalysis\b',
-        r'\btechnical analysis\b',
-        r'\bprice prediction\b',
-        r'\bprice target\b',
-        r'\bsupport and resistance\b',
-        r'\btrading setup\b',
-        r'\btrade setup\b',
-        r'\btrading strategy\b',
-        r'\bscalp(ing)?\b',
-        r'\bbull(ish)? flag\b',
-        r'\bbear(ish)? flag\b',
-        r'\bhead and shoulders\b',
-        r'\bwedge pattern\b',
-        r'\brsi\b.*\bdivergence\b',
-        r'\bfibonacci\b',
-        r'\bElliott wave\b',
-        r'\bmoving average\b',
-        r'\bMACD\b',
-        r'\bBollinger\b',
-        r'\bichimoku\b',
-        r'\bcandlestick\b',
-        r'\border block\b',
-        r'\bbreakout\b.*\btarget\b',
-        r'\blong\b.*\bshort\b.*\btrade\b',
-        r'\brisk.to.reward\b',
-    ]
-    import re as _re
-    _ta_regex = _re.compile('|'.join(TA_SKIP_PATTERNS), _re.IGNORECASE)
-
-    # Title keywords that strongly suggest TA content (matched as substrings)
-    TA_TITLE_KEYWORDS = [
-        'major move for',
-        'pump incoming',
-        'dump incoming',
-        'buy now',
-        'sell now',
-        'exact target',
-        'next target',
-        'moon soon',
-        'altcoin season',
-        'altcoins to buy',
-    ]
+    _chan = channel_url.lower()
+    promoter_channel = "realvision" in _chan or "raoulpal" in _chan
+
+    # Age in whole days of the oldest video the date filter can accept
+    now = datetime.datetime.now()
+    if cutoff_time is not None:
+        max_age_days = (now - cutoff_time).days
+        oldest_wanted = cutoff_time
+    elif cutoff_date is not None:
+        max_age_days = (now.date() - cutoff_date.date()).days
+        oldest_wanted = datetime.datetime.combine(cutoff_date.date(), datetime.time())
+    else:
+        max_age_days = None
+        oldest_wanted = None
 
     processed_count = 0
     videos_on_target_date = 0
+    matched = []
     for video in videos:
-
-
-        video_id = video["videoId"]
-        title = video["title"]["runs"][0]["text"]
+        try:
+            video_id = video["videoId"]
+            title = video["title"]["runs"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            log("  [SKIP] Video record without id/title")
+            continue
 
         # Skip pure technical analysis / chart trading videos
         title_lower = title.lower()
-        if _ta_regex.search(title) or any(kw in title_lower for kw in TA_TITLE_KEYWORDS):
+        if _TA_SKIP_RE.search(title) or any(kw in title_lower for kw in _TA_TITLE_KEYWORDS):
             log(f"  [SKIP-TA] Technical analysis video: {title[:60]}...")
             continue
 
         # Skip Sui-shilling videos from Raoul Pal / Real Vision (user preference)
-        _chan = channel_url.lower()
-        if ("realvision" in _chan or "raoulpal" in _chan) and _re.search(r"\bsui\b", title, _re.IGNORECASE):
+        if promoter_channel and _SUI_TITLE_RE.search(title):
             log(f"  [SKIP-SUI] Sui video from RealVision/Raoul: {title[:60]}...")
             continue
 
-        date_info = video.get("publishedTimeText", {}).get("simpleText")
+        date_info = (video.get("publishedTimeText") or {}).get("simpleText")
+
+        # "N weeks/months/years ago" can't fall inside a window shorter than a week
+        if date_info and max_age_days is not None and max_age_days < 7 and _WEEKS_OR_OLDER_RE.search(date_info):
+            log(f"  [SKIP] Too old: {title[:50]}... ({date_info})")
+            continue
 
         pub_date = None
         if date_info:
@@ -358,12 +600,19 @@ def process_channel(channel_url, model, shared_context, cutoff_date, cutoff_time
                 if clean_date.startswith(prefix):
                     clean_date = clean_date[len(prefix):]
                     break
-            pub_date = dateparser.parse(clean_date)
+            pub_date = parse_published_date(clean_date)
 
             # Log parsing details for debugging
             if not pub_date:
                 log(f"  [DATE] Failed to parse: '{date_info}' (cleaned: '{clean_date}')")
 
+        # Channel listings are newest first, so once a video is clearly older
+        # than the window every later one is too (FEED_ORDER_SLACK allows for
+        # streams and premieres listed slightly out of order)
+        if pub_date and oldest_wanted is not None and pub_date < oldest_wanted - FEED_ORDER_SLACK:
+            log(f"  [STOP] Older than the window from here on: {title[:50]}... ({date_info})")
+            break
+
         if cutoff_time is not None:
             # Hours mode: filter by timestamp
             if not pub_date:
@@ -385,29 +634,62 @@ def process_channel(channel_url, model, shared_context, cutoff_date, cutoff_time
             videos_on_target_date += 1
 
         log(f"  [MATCH] {title[:50]}... ({date_info} -> {pub_date})")
-        transcript = get_transcript_text(video_id)
-        if not transcript:
-            log("  -> SKIPPING: No transcript found.")
-            continue
+        matched.append((video_id, title, pub_date))
+
+    def ready_videos(transcript_futures):
+        """Yield (title, pub_date, transcript) for matched videos worth summarizing."""
+        for (video_id, title, pub_date), transcript_future in zip(matched, transcript_futures):
+            log(f"  [VIDEO] {title[:50]}...")
+            transcript = transcript_future.result()
+            if not transcript:
+                log("  -> SKIPPING: No transcript found.")
+                continue
+
+            if seen_transcripts is not None:
+                original = seen_transcripts.claim(title, transcript)
+                if original is not None:
+                    log(f"  -> SKIPPING: Near-duplicate of '{original[:50]}'.")
+                    continue
+
+            log("  -> Transcript retrieved.")
+            yield title, pub_date, transcript
+
+    # Download transcripts ahead in the background while earlier videos are
+    # summarized. Summaries stay sequential so each one still sees the
+    # previous ones as context; runs of short videos share one request.
+    with ThreadPoolExecutor(max_workers=MAX_TRANSCRIPT_WORKERS) as executor:
+        transcript_futures = [executor.submit(get_transcript_text, video_id) for video_id, _, _ in matched]
+        for batch in _summary_batches(ready_videos(transcript_futures)):
+            summaries = None
+            if len(batch) > 1:
+                log(f"  -> Summarizing {len(batch)} short videos in one request...")
+                current_context_str = "\n".join(shared_context[-SUMMARY_CONTEXT_ENTRIES:])
+                summaries = summarize_batch(model, [(title, transcript) for title, _, transcript in batch],
+                                            current_context_str, channel_url=channel_url)
+                if summaries is None:
+                    log("  -> Falling back to one request per video.")
+
+            for i, (title, pub_date, transcript) in enumerate(batch):
+                if summaries is not None:
+                    summary = summaries[i]
+                else:
+                    log(f"  -> Summarizing {title[:50]}...")
+                    current_context_str = "\n".join(shared_context[-SUMMARY_CONTEXT_ENTRIES:])
+                    summary = summarize_text(model, transcript, current_context_str, channel_url=channel_url)
+
+                if summary.strip().startswith("Skipped"):
+                    log(f"  -> Gemini Skipped: {summary.strip()}")
+                    continue
+
+                date_str = pub_date.strftime("%B %d, %Y") if pub_date else "Unknown Date"
+
+                entry = f"Regarding the video {title} published on {date_str}:\n{summary}\n"
+
+                new_summaries.append(entry)
+                shared_context.append(f"Title: {title}\nSummary: {summary}")
+                processed_count += 1
+                log("  -> Summary generated.")
 
-        log("  -> Transcript retrieved. Summarizing...")
-        
-        current_context_str = "\n".join(shared_context[-5:])
-        summary = summarize_text(model, transcript, current_context_str, channel_url=channel_url)
-        
-        if summary.strip().startswith("Skipped"):
-            log(f"  -> Gemini Skipped: {summary.strip()}")
-            continue
-            
-        date_str = pub_date.strftime("%B %d, %Y") if pub_date else "Unknown Date"
-        
-        entry = f"Regarding the video {title} published on {date_str}:\n{summary}\n"
-        
-        new_summaries.append(entry)
-        shared_context.append(f"Title: {title}\nSummary: {summary}")
-        processed_count += 1
-        log("  -> Summary generated.")
-    
     if cutoff_time:
         log(f"DEBUG: Found {videos_on_target_date} videos since {cutoff_time}, created {len(new_summaries)} summaries")
     elif videos_on_target_date > 0:
@@ -417,6 +699,47 @@ def process_channel(channel_url, model, shared_context, cutoff_date, cutoff_time
 
     return new_summaries, shared_context
 
+def process_newsletter(source, target_date):
+    """Extract one newsletter source into a summary entry, or None if it has no items."""
+    from execsum_processor import (
+        extract_newsletter_content,
+        load_config as load_execsum_config,
+        create_basic_summary,
+    )
+
+    newsletter_url = source.get("url", "")
+    config_name = source.get("config")
+    source_name = source.get("name") or newsletter_url.split("/")[2] if "/" in newsletter_url else "Newsletter"
+
+    log(f"--- Processing Newsletter: {newsletter_url} ---")
+
+    # Load extraction config
+    if config_name:
+        config_path = os.path.join(os.path.dirname(__file__), 'extraction_instructions', f'{config_name}.json')
+        if os.path.exists(config_path):
+            with open(config_path, 'r') as f:
+                config = json.load(f)
+            log(f"  Using config: {config_name}")
+        else:
+            config = load_execsum_config()
+            log(f"  Config '{config_name}' not found, using default")
+    else:
+        config = load_execsum_config()
+        log(f"  Using default execsum config")
+
+    # Extract and summarize newsletter content
+    items, newsletter_date = extract_newsletter_content(newsletter_url, config)
+    if not items:
+        log(f"  No relevant items found")
+        return None
+
+    log(f"  Found {len(items)} items")
+    content = create_basic_summary(items)
+    if not content.strip():
+        return None
+    log(f"  -> Newsletter summary added")
+    return f"\n\n=== {source_name} (Articles) ===\n\n\n{content}\n"
+
 def get_data_directory():
     """Get the appropriate data directory for storing output files.
 
@@ -515,9 +838,10 @@ def main():
     newsletter_sources = []
 
     if os.path.exists(SOURCES_JSON):
-        import json
         try:
-            data = json.load(open(SOURCES_JSON))
+            # Binary read lets json detect the encoding; the with closes the handle
+            with open(SOURCES_JSON, "rb") as f:
+                data = json.load(f)
             for s in data.get("sources", []):
                 if not s.get("enabled", True):
                     continue
@@ -589,7 +913,10 @@ def main():
         for day_offset in range(args.days):
             dates_to_process.append(datetime.datetime.now() - datetime.timedelta(days=day_offset))
 
-    shared_context = []
+    # Only the newest entries are ever sent as context, so only those are kept
+    shared_context = collections.deque(maxlen=SUMMARY_CONTEXT_ENTRIES)
+    channel_videos = {}  # Each channel's recent videos, listed once for all days
+    seen_transcripts = TranscriptIndex()  # Near-duplicate check across channels and days
     total_summaries = 0
     log(f"DEBUG: Will save summaries in {os.path.dirname(__file__)}")
 
@@ -601,61 +928,42 @@ def main():
 
         day_summaries = []
 
-        # Process YouTube sources
-        for source in youtube_sources:
-            channel_url = source.get("url", "")
-            summaries, shared_context = process_channel(channel_url, model, shared_context, target_date, cutoff_time)
-            day_summaries.extend(summaries)
+        # Process all of the day's sources concurrently - each one is
+        # network-bound (video list, subtitles, Gemini; newsletter pages).
+        # Every channel sees the context from earlier days; its own additions
+        # are merged back in source order. Results keep the old order:
+        # YouTube sources first, then newsletters.
+        if youtube_sources or newsletter_sources:
+            context_snapshot = list(shared_context)
+            workers = min(MAX_CHANNEL_WORKERS, len(youtube_sources) + len(newsletter_sources))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                channel_futures = [
+                    executor.submit(process_channel, source.get("url", ""), model,
+                                    list(context_snapshot), target_date, cutoff_time, channel_videos,
+                                    seen_transcripts)
+                    for source in youtube_sources
+                ]
+                newsletter_futures = [
+                    executor.submit(process_newsletter, source, target_date)
+                    for source in newsletter_sources
+                ]
+                for future in channel_futures:
+                    summaries, channel_context = future.result()
+                    day_summaries.extend(summaries)
+                    shared_context.extend(channel_context[len(context_snapshot):])
+
+                for future in newsletter_futures:
+                    try:
+                        entry = future.result()
+                    except ImportError as e:
+                        log(f"Warning: Could not import execsum_processor: {e}")
+                        break
+                    except Exception as e:
+                        log(f"Error processing newsletters: {e}")
+                        continue
+                    if entry:
+                        day_summaries.append(entry)
 
-        # Process newsletter sources
-        if newsletter_sources:
-            try:
-                from execsum_processor import (
-                    extract_newsletter_content,
-                    load_config as load_execsum_config,
-                    create_basic_summary,
-                    load_api_key
-                )
-
-                for source in newsletter_sources:
-                    newsletter_url = source.get("url", "")
-                    config_name = source.get("config")
-                    source_name = source.get("name") or newsletter_url.split("/")[2] if "/" in newsletter_url else "Newsletter"
-
-                    log(f"--- Processing Newsletter: {newsletter_url} ---")
-
-                    # Load extraction config
-                    if config_name:
-                        config_path = os.path.join(os.path.dirname(__file__), 'extraction_instructions', f'{config_name}.json')
-                        if os.path.exists(config_path):
-                            import json
-                            with open(config_path, 'r') as f:
-                                config = json.load(f)
-                            log(f"  Using config: {config_name}")
-                        else:
-                            config = load_execsum_config()
-                            log(f"  Config '{config_name}' not found, using default")
-                    else:
-                        config = load_execsum_config()
-                        log(f"  Using default execsum config")
-
-                    # Extract and summarize newsletter content
-                    items, newsletter_date = extract_newsletter_content(newsletter_url, config)
-                    if items:
-                        log(f"  Found {len(items)} items")
-                        content = create_basic_summary(items)
-                        if content.strip():
-                            date_str = newsletter_date or target_date.strftime("%B %d, %Y")
-                            entry = f"\n\n=== {source_name} (Articles) ===\n\n\n{content}\n"
-                            day_summaries.append(entry)
-                            log(f"  -> Newsletter summary added")
-                    else:
-                        log(f"  No relevant items found")
-
-            except ImportError as e:
-                log(f"Warning: Could not import execsum_processor: {e}")
-            except Exception as e:
-                log(f"Error processing newsletters: {e}")
         if day_summaries:
             if hours_mode:
                 out_name = f"summary_last_{args.hours}h.txt"
@@ -664,23 +972,19 @@ def main():
             week_folder = get_week_folder(target_date)
             save_path = os.path.join(week_folder, out_name)
             log(f"DEBUG: Attempting to write {len(day_summaries)} summaries to: {save_path}")
-            log(f"DEBUG: Week folder: {week_folder}")
-            log(f"DEBUG: Week folder exists: {os.path.exists(week_folder)}")
-            log(f"DEBUG: Week folder writable: {os.access(week_folder, os.W_OK)}")
             try:
                 with open(save_path, "w", encoding="utf-8") as f:
                     f.write("\n\n".join(day_summaries))
                 log(f"DEBUG: File write completed. Verifying...")
-                if os.path.exists(save_path):
-                    file_size = os.path.getsize(save_path)
-                    if hours_mode:
-                        log(f"SUCCESS: {len(day_summaries)} summaries for last {args.hours} hour(s) -> {save_path} ({file_size} bytes)")
-                    else:
-                        log(f"SUCCESS: {len(day_summaries)} summaries for {target_date.date()} -> {save_path} ({file_size} bytes)")
+                file_size = os.path.getsize(save_path)
+                if hours_mode:
+                    log(f"SUCCESS: {len(day_summaries)} summaries for last {args.hours} hour(s) -> {save_path} ({file_size} bytes)")
                 else:
-                    log(f"ERROR: File was written but does not exist at {save_path}")
+                    log(f"SUCCESS: {len(day_summaries)} summaries for {target_date.date()} -> {save_path} ({file_size} bytes)")
             except Exception as e:
                 log(f"ERROR: Failed to write {save_path}: {e}")
+                log(f"DEBUG: Week folder exists: {os.path.exists(week_folder)}, "
+                    f"writable: {os.access(week_folder, os.W_OK)}")
                 import traceback
                 log(f"ERROR: Traceback: {traceback.format_exc()}")
             total_summaries += len(day_summaries)
@@ -10,9 +10,12 @@ API Endpoint: https://beta.node.thegrid.id/graphql
 Docs: https://docs.thegrid.id/
 """
 
+import functools
 import re
 import json
+import threading
 import requests
+from collections import OrderedDict
 from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass, field
 from urllib.parse import quote
@@ -23,6 +26,11 @@ from urllib.parse import quote
 # =============================================================================
 
 GRID_API_ENDPOINT = "https://beta.node.thegrid.id/graphql"
+# search_all results kept in memory, shared by every client in the process;
+# names like "Bitcoin" or "Solana" recur across most headlines and batches
+SEARCH_CACHE_SIZE = 4096
+_search_cache: "OrderedDict[Tuple[str, Optional[str], str], Dict[str, List[Dict]]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
 
 # Common crypto project name mappings (for better matching)
 NAME_ALIASES = {
@@ -52,6 +60,91 @@ NAME_ALIASES = {
     "sui": "sui",
 }
 
+# Name suffixes that mark a specific company or spin-off rather than the main
+# project (legal forms, NFT/meme collections); used to down-rank fuzzy matches
+LEGAL_SUFFIXES = (
+    ' s.l.', ' ltd', ' ltd.', ' gmbh', ' inc', ' inc.', ' corp', ' corp.',
+    ' llc', ' plc', ' pte', ' s.a.', ' s.r.l', ' b.v.', ' n.v.', ' a.g.',
+    ' co.', ' company', ' limited', ' corporation', ' d.o.o', ' s.p.a.',
+    ' slugs', ' gang', ' bear', ' bull', ' punks', ' apes', ' club',
+    ' nft', ' dao', ' token', ' coin',  # NFT/meme projects
+)
+
+
+# Stop words - common terms that shouldn't be matched to entities
+KEYWORD_STOP_WORDS = {
+    # Common words
+    'The', 'This', 'That', 'With', 'From', 'Into', 'Over', 'After',
+    'Before', 'About', 'Through', 'During', 'Between', 'Under',
+    'Again', 'Further', 'Then', 'Once', 'Here', 'There', 'When',
+    'Where', 'Why', 'How', 'All', 'Each', 'Few', 'More', 'Most',
+    'Other', 'Some', 'Such', 'Only', 'Own', 'Same', 'Than', 'Too',
+    'Very', 'Just', 'Should', 'Now', 'New', 'CEO', 'CTO', 'CFO',
+    # Business terms (generic - not specific entities)
+    'Million', 'Billion', 'Market', 'Trading', 'Price', 'Token',
+    'Crypto', 'Blockchain', 'Network', 'Protocol', 'Fund', 'Report',
+    'Investment', 'Venture', 'Capital', 'Exchange', 'Platform',
+    'Rally', 'Surge', 'Drop', 'Fall', 'Rise', 'Gain', 'Loss',
+    'Firm', 'Startup', 'Company', 'Group', 'Digital', 'Global',
+    # Common website/CTA words that cause false positives
+    'Sign', 'Spot', 'Read', 'Join', 'Click', 'Share', 'Follow',
+    'Subscribe', 'Contact', 'Learn', 'Watch', 'Start', 'Get',
+    'Free', 'Try', 'Send', 'Submit', 'Enter', 'Create', 'Open',
+    'Save', 'Download', 'Access', 'View', 'Check', 'Find',
+    # Acronyms that cause false positives (matched to wrong entities)
+    'DeFi', 'Defi', 'DEFI', 'NFT', 'Nft', 'DAO', 'Dao',
+    'DEX', 'Dex', 'CEX', 'Cex', 'AMM', 'Amm', 'TVL', 'Tvl',
+    'APY', 'Apy', 'APR', 'Apr', 'ATH', 'Ath', 'FUD', 'Fud',
+    # Days/Months
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December',
+    # Political/news figures - prevent matching to meme tokens
+    'Trump', 'Biden', 'Musk', 'Elon', 'Obama', 'Powell', 'Gensler',
+    'Yellen', 'Congress', 'Senate', 'Federal', 'Reserve', 'Government',
+    # Common news prefixes/sources
+    'Daily', 'Breaking', 'Update', 'Alert', 'News', 'Report',
+    # Locations
+    'Salvador', 'America', 'Latin',
+}
+_STOP_WORDS_LOWER = frozenset(w.lower() for w in KEYWORD_STOP_WORDS)
+
+# Stop phrases for multi-word matches
+KEYWORD_STOP_PHRASES = {
+    'New York', 'United States', 'Wall Street', 'White House',
+    'Hong Kong', 'San Francisco', 'Los Angeles', 'Abu Dhabi',
+    'South Korea', 'North America', 'United Kingdom'
+}
+
+# Map common tickers to full names for searching
+TICKER_NAMES = {
+    'BTC': 'Bitcoin', 'ETH': 'Ethereum', 'SOL': 'Solana',
+    'XRP': 'XRP', 'ADA': 'Cardano', 'DOGE': 'Dogecoin',
+    'DOT': 'Polkadot', 'LINK': 'Chainlink', 'UNI': 'Uniswap',
+    'ARB': 'Arbitrum', 'OP': 'Optimism', 'MATIC': 'Polygon',
+    'AVAX': 'Avalanche', 'ATOM': 'Cosmos', 'NEAR': 'NEAR',
+    'APT': 'Aptos', 'SUI': 'Sui', 'TAO': 'Bittensor',
+    'USDT': 'Tether', 'USDC': 'USDC',
+}
+
+# extract_keywords patterns, in priority order
+# Capitalized multi-word names (company/protocol names)
+_MULTI_WORD_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b')
+# Mixed-case crypto names (BitMEX, dYdX, zkSync, OpenAI)
+_MIXED_CASE_RE = re.compile(r'\b([A-Za-z]*[A-Z][a-z]+[A-Z][a-zA-Z]*|[a-z]+[A-Z][a-zA-Z]+)\b')
+# Ticker symbols in context like "$BTC" or "(ETH)"
+_TICKER_CONTEXT_RE = re.compile(r'[\$\(]([A-Z]{2,5})[\)\s]')
+# Single capitalized words
+_CAPS_RE = re.compile(r'\b[A-Z][a-z]{2,}\b')
+# All-caps tickers (BTC, ETH, XRP, etc.)
+_TICKER_RE = re.compile(r'\b([A-Z]{2,5})\b')
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_boundary_re(name: str):
+    """Compiled pattern matching name as a whole word (names recur across items)."""
+    return re.compile(r'\b' + re.escape(name) + r'\b')
+
 
 # =============================================================================
 # DATA MODELS
@@ -241,6 +334,97 @@ query SearchEntities($search: String!) {
 }
 """
 
+# All four searches in one request (one round trip per keyword in search_all)
+SEARCH_ALL_QUERY = """
+query SearchAll($search: String!) {
+  profileInfos(
+    where: {
+      _or: [
+        { name: { _contains: $search } },
+        { descriptionShort: { _contains: $search } }
+      ]
+    }
+    limit: 10
+  ) {
+    id
+    name
+    descriptionShort
+    profileType {
+      name
+    }
+    profileSector {
+      name
+    }
+  }
+  products(
+    where: {
+      _or: [
+        { name: { _contains: $search } },
+        { description: { _contains: $search } }
+      ]
+    }
+    limit: 10
+  ) {
+    id
+    name
+    description
+    productType {
+      name
+    }
+  }
+  assets(
+    where: {
+      _or: [
+        { name: { _contains: $search } },
+        { ticker: { _contains: $search } }
+      ]
+    }
+    limit: 10
+  ) {
+    id
+    name
+    ticker
+    icon
+  }
+  entities(
+    where: {
+      _or: [
+        { name: { _contains: $search } },
+        { tradeName: { _contains: $search } }
+      ]
+    }
+    limit: 10
+  ) {
+    id
+    name
+    tradeName
+    entityType {
+      name
+    }
+    country {
+      name
+    }
+  }
+}
+"""
+
+# SEARCH_ALL_QUERY's root fields, one aliased copy per term: t<i>_<field>,
+# filtered on $search<i>
+_SEARCH_ALL_FIELDS_RE = re.compile(r'^  (profileInfos|products|assets|entities)\(', re.MULTILINE)
+_SEARCH_ALL_SELECTIONS = SEARCH_ALL_QUERY[SEARCH_ALL_QUERY.index('{') + 1:SEARCH_ALL_QUERY.rindex('}')]
+
+
+@functools.lru_cache(maxsize=16)
+def _search_many_query(count: int) -> str:
+    """Build the query batch_search sends for count terms."""
+    params = ", ".join(f"$search{i}: String!" for i in range(count))
+    selections = "".join(
+        _SEARCH_ALL_FIELDS_RE.sub(rf"  t{i}_\1: \1(", _SEARCH_ALL_SELECTIONS).replace("$search", f"$search{i}")
+        for i in range(count)
+    )
+    return f"\nquery SearchMany({params}) {{{selections}}}\n"
+
+
 # Query to get detailed profile info
 GET_PROFILE_DETAILS_QUERY = """
 query GetProfileDetails($search: String!) {
@@ -350,12 +534,52 @@ class GridAPIClient:
 
     def search_all(self, search_term: str) -> Dict[str, List[Dict]]:
         """Search across all Grid types: profiles, products, assets, and entities."""
-        return {
-            "profiles": self.search_profiles(search_term),
-            "products": self.search_products(search_term),
-            "assets": self.search_assets(search_term),
-            "entities": self.search_entities(search_term),
-        }
+        return self.batch_search([search_term])[search_term]
+
+    def batch_search(self, search_terms: List[str]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Run search_all for several terms in one request; returns {term: results}.
+
+        Uncached terms go out together as aliased copies of SEARCH_ALL_QUERY,
+        so all of a headline's keywords cost a single round trip.
+        Results are cached per endpoint, key and term (LRU, SEARCH_CACHE_SIZE).
+        Grid's _contains filter is case-sensitive, so terms keep their case.
+        """
+        results = {}
+        missing = []
+        with _search_cache_lock:
+            for term in dict.fromkeys(search_terms):
+                cache_key = (self.endpoint, self.api_key, term.strip())
+                cached = _search_cache.get(cache_key)
+                if cached is not None:
+                    _search_cache.move_to_end(cache_key)
+                    results[term] = cached
+                else:
+                    missing.append(term)
+        if not missing:
+            return results
+
+        variables = {f"search{i}": term.strip() for i, term in enumerate(missing)}
+        data = self._execute_query(_search_many_query(len(missing)), variables)
+        if not data and len(missing) > 1:
+            # One bad term or a timeout fails the whole combined request;
+            # retry term by term so only the failing term loses its results
+            for term in missing:
+                results[term] = self.search_all(term)
+            return results
+        for i, term in enumerate(missing):
+            results[term] = {
+                "profiles": data.get(f"t{i}_profileInfos") or [],
+                "products": data.get(f"t{i}_products") or [],
+                "assets": data.get(f"t{i}_assets") or [],
+                "entities": data.get(f"t{i}_entities") or [],
+            }
+        if data:  # Failed requests come back empty; retry those next time
+            with _search_cache_lock:
+                for term in missing:
+                    _search_cache[(self.endpoint, self.api_key, term.strip())] = results[term]
+                while len(_search_cache) > SEARCH_CACHE_SIZE:
+                    _search_cache.popitem(last=False)
+        return results
 
     def get_profile_details(self, profile_name: str) -> Dict:
         """Get detailed profile info by exact name match."""
@@ -400,111 +624,58 @@ class GridEntityMatcher:
         article that happens to mention Bitcoin.
         """
         keywords = []
+        seen_lower = set()  # Lowercased keywords, for case-insensitive dedup
         text_lower = text.lower()
         first_100_chars = text[:100]  # Used by multiple patterns
 
-        # Stop words - common terms that shouldn't be matched to entities
-        stop_words = {
-            # Common words
-            'The', 'This', 'That', 'With', 'From', 'Into', 'Over', 'After',
-            'Before', 'About', 'Through', 'During', 'Between', 'Under',
-            'Again', 'Further', 'Then', 'Once', 'Here', 'There', 'When',
-            'Where', 'Why', 'How', 'All', 'Each', 'Few', 'More', 'Most',
-            'Other', 'Some', 'Such', 'Only', 'Own', 'Same', 'Than', 'Too',
-            'Very', 'Just', 'Should', 'Now', 'New', 'CEO', 'CTO', 'CFO',
-            # Business terms (generic - not specific entities)
-            'Million', 'Billion', 'Market', 'Trading', 'Price', 'Token',
-            'Crypto', 'Blockchain', 'Network', 'Protocol', 'Fund', 'Report',
-            'Investment', 'Venture', 'Capital', 'Exchange', 'Platform',
-            'Rally', 'Surge', 'Drop', 'Fall', 'Rise', 'Gain', 'Loss',
-            'Firm', 'Startup', 'Company', 'Group', 'Digital', 'Global',
-            # Common website/CTA words that cause false positives
-            'Sign', 'Spot', 'Read', 'Join', 'Click', 'Share', 'Follow',
-            'Subscribe', 'Contact', 'Learn', 'Watch', 'Start', 'Get',
-            'Free', 'Try', 'Send', 'Submit', 'Enter', 'Create', 'Open',
-            'Save', 'Download', 'Access', 'View', 'Check', 'Find',
-            # Acronyms that cause false positives (matched to wrong entities)
-            'DeFi', 'Defi', 'DEFI', 'NFT', 'Nft', 'DAO', 'Dao',
-            'DEX', 'Dex', 'CEX', 'Cex', 'AMM', 'Amm', 'TVL', 'Tvl',
-            'APY', 'Apy', 'APR', 'Apr', 'ATH', 'Ath', 'FUD', 'Fud',
-            # Days/Months
-            'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday',
-            'January', 'February', 'March', 'April', 'May', 'June', 'July',
-            'August', 'September', 'October', 'November', 'December',
-            # Political/news figures - prevent matching to meme tokens
-            'Trump', 'Biden', 'Musk', 'Elon', 'Obama', 'Powell', 'Gensler',
-            'Yellen', 'Congress', 'Senate', 'Federal', 'Reserve', 'Government',
-            # Common news prefixes/sources
-            'Daily', 'Breaking', 'Update', 'Alert', 'News', 'Report',
-            # Locations
-            'Salvador', 'America', 'Latin',
-        }
-        stop_words_lower = {w.lower() for w in stop_words}
-
-        # Stop phrases for multi-word matches
-        stop_phrases = {
-            'New York', 'United States', 'Wall Street', 'White House',
-            'Hong Kong', 'San Francisco', 'Los Angeles', 'Abu Dhabi',
-            'South Korea', 'North America', 'United Kingdom'
-        }
-
         # Priority 1: Look for capitalized multi-word names (company/protocol names)
         # These are usually the actual subject
-        multi_word_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b'
-        multi_words = re.findall(multi_word_pattern, text)
+        multi_words = _MULTI_WORD_RE.findall(text)
         for phrase in multi_words:
-            if phrase not in stop_phrases:
+            if phrase not in KEYWORD_STOP_PHRASES:
                 keywords.append(phrase)
+                seen_lower.add(phrase.lower())
 
         # Priority 2: Mixed-case crypto names (BitMEX, dYdX, zkSync, OpenAI)
         # These often appear at the start of headlines
-        mixed_case_pattern = r'\b([A-Za-z]*[A-Z][a-z]+[A-Z][a-zA-Z]*|[a-z]+[A-Z][a-zA-Z]+)\b'
-        mixed_names = re.findall(mixed_case_pattern, first_100_chars)
+        mixed_names = _MIXED_CASE_RE.findall(first_100_chars)
         for name in mixed_names:
-            if len(name) >= 3 and name.lower() not in stop_words_lower and name.lower() not in [k.lower() for k in keywords]:
+            name_lower = name.lower()
+            if len(name) >= 3 and name_lower not in _STOP_WORDS_LOWER and name_lower not in seen_lower:
                 keywords.append(name)
+                seen_lower.add(name_lower)
 
         # Priority 4: Look for ticker symbols in context like "$BTC" or "(ETH)"
-        ticker_context_pattern = r'[\$\(]([A-Z]{2,5})[\)\s]'
-        context_tickers = re.findall(ticker_context_pattern, text)
+        context_tickers = _TICKER_CONTEXT_RE.findall(text)
 
         for ticker in context_tickers:
             ticker_lower = ticker.lower()
             if ticker_lower in NAME_ALIASES:
                 expanded = NAME_ALIASES[ticker_lower]
-                if expanded.lower() not in [k.lower() for k in keywords]:
+                if expanded.lower() not in seen_lower:
                     keywords.append(expanded)
+                    seen_lower.add(expanded.lower())
 
         # Priority 5: Single capitalized words that appear at the START of the text
         # (likely the subject) - not just anywhere in the text
-        caps_pattern = r'\b[A-Z][a-z]{2,}\b'
-        leading_caps = re.findall(caps_pattern, first_100_chars)
+        leading_caps = _CAPS_RE.findall(first_100_chars)
 
         # Priority 6: All-caps tickers (BTC, ETH, XRP, etc.) anywhere in text
-        ticker_pattern = r'\b([A-Z]{2,5})\b'
-        tickers_found = re.findall(ticker_pattern, text[:150])
-
-        # Map common tickers to full names for searching
-        ticker_map = {
-            'BTC': 'Bitcoin', 'ETH': 'Ethereum', 'SOL': 'Solana',
-            'XRP': 'XRP', 'ADA': 'Cardano', 'DOGE': 'Dogecoin',
-            'DOT': 'Polkadot', 'LINK': 'Chainlink', 'UNI': 'Uniswap',
-            'ARB': 'Arbitrum', 'OP': 'Optimism', 'MATIC': 'Polygon',
-            'AVAX': 'Avalanche', 'ATOM': 'Cosmos', 'NEAR': 'NEAR',
-            'APT': 'Aptos', 'SUI': 'Sui', 'TAO': 'Bittensor',
-            'USDT': 'Tether', 'USDC': 'USDC',
-        }
+        tickers_found = _TICKER_RE.findall(text[:150])
 
         for word in leading_caps:
-            if word.lower() not in stop_words_lower and word.lower() not in [k.lower() for k in keywords]:
+            word_lower = word.lower()
+            if word_lower not in _STOP_WORDS_LOWER and word_lower not in seen_lower:
                 keywords.append(word)
+                seen_lower.add(word_lower)
 
         # Add mapped ticker names
         for ticker in tickers_found:
-            if ticker in ticker_map:
-                name = ticker_map[ticker]
-                if name.lower() not in [k.lower() for k in keywords]:
+            if ticker in TICKER_NAMES:
+                name = TICKER_NAMES[ticker]
+                if name.lower() not in seen_lower:
                     keywords.append(name)
+                    seen_lower.add(name.lower())
 
         return keywords[:7]  # Return max 7 keywords - allow more matches
 
@@ -533,18 +704,21 @@ class GridEntityMatcher:
             return result
 
         # Collect all candidate matches with scores
+        text_lower = full_text.lower()
         all_candidates: List[Tuple[GridMatch, float]] = []
         seen_names: set = set()  # Avoid duplicate matches for same subject
 
+        # Search across all Grid types, all keywords at once
+        keyword_results = self.client.batch_search(keywords)
+
         for keyword in keywords:
-            # Search across all Grid types
-            results = self.client.search_all(keyword)
+            results = keyword_results[keyword]
 
             # Score and collect profile matches
             for profile in results.get("profiles", []):
                 match = self._create_match_from_profile(profile)
                 if match.name.lower() not in seen_names:
-                    score = self._score_match(match.name, keyword, full_text)
+                    score = self._score_match(match.name, keyword, text_lower)
                     if score >= 0.7:  # Only keep high-confidence matches
                         match.confidence = score
                         all_candidates.append((match, score))
@@ -554,7 +728,7 @@ class GridEntityMatcher:
             for product in results.get("products", []):
                 match = self._create_match_from_product(product)
                 if match.name.lower() not in seen_names:
-                    score = self._score_match(match.name, keyword, full_text)
+                    score = self._score_match(match.name, keyword, text_lower)
                     if score >= 0.7:
                         match.confidence = score
                         all_candidates.append((match, score))
@@ -564,7 +738,7 @@ class GridEntityMatcher:
             for asset in results.get("assets", []):
                 match = self._create_match_from_asset(asset)
                 if match.name.lower() not in seen_names:
-                    score = self._score_match(match.name, keyword, full_text)
+                    score = self._score_match(match.name, keyword, text_lower)
                     if score >= 0.7:
                         match.confidence = score
                         all_candidates.append((match, score))
@@ -574,7 +748,7 @@ class GridEntityMatcher:
             for entity in results.get("entities", []):
                 match = self._create_match_from_entity(entity)
                 if match.name.lower() not in seen_names:
-                    score = self._score_match(match.name, keyword, full_text)
+                    score = self._score_match(match.name, keyword, text_lower)
                     if score >= 0.7:
                         match.confidence = score
                         all_candidates.append((match, score))
@@ -594,11 +768,14 @@ class GridEntityMatcher:
         self._cache[cache_key] = result
         return result
 
-    def _score_match(self, entity_name: str, keyword: str, full_text: str) -> float:
+    def _score_match(self, entity_name: str, keyword: str, text_lower: str) -> float:
         """
         Score how well an entity matches the keyword and original text.
         Higher score = better match.
 
+        text_lower is the original text, already lowercased by the caller
+        (it is shared by every candidate scored for one item).
+
         Includes relevance filtering to avoid false positives like:
         - "Bitcoinforme S.L." when searching for "Bitcoin"
         - "Solana Slugs" when searching for "Solana"
@@ -608,22 +785,12 @@ class GridEntityMatcher:
 
         entity_lower = entity_name.lower()
         keyword_lower = keyword.lower()
-        text_lower = full_text.lower()
 
         score = 0.0
 
-        # Legal entity suffixes - these indicate a specific company, not the main project
-        legal_suffixes = [
-            ' s.l.', ' ltd', ' ltd.', ' gmbh', ' inc', ' inc.', ' corp', ' corp.',
-            ' llc', ' plc', ' pte', ' s.a.', ' s.r.l', ' b.v.', ' n.v.', ' a.g.',
-            ' co.', ' company', ' limited', ' corporation', ' d.o.o', ' s.p.a.',
-            ' slugs', ' gang', ' bear', ' bull', ' punks', ' apes', ' club',
-            ' nft', ' dao', ' token', ' coin',  # NFT/meme projects
-        ]
-
         # Check if entity has a legal suffix that isn't in the search text
         has_irrelevant_suffix = False
-        for suffix in legal_suffixes:
+        for suffix in LEGAL_SUFFIXES:
             if suffix in entity_lower and suffix not in text_lower:
                 has_irrelevant_suffix = True
                 break
@@ -653,7 +820,7 @@ class GridEntityMatcher:
             score += 0.5
 
         # Strong bonus: full entity name appears in the original text (confirms relevance)
-        if re.search(r'\b' + re.escape(entity_lower) + r'\b', text_lower):
+        if _word_boundary_re(entity_lower).search(text_lower):
             score += 0.6
         # Partial bonus: entity name is in text but maybe not word-bounded
         elif entity_lower in text_lower:
@@ -0,0 +1,98 @@
+"""
+Page Cache — On-disk LRU cache for fetched HTML pages.
+
+Newsletter issues and linked articles don't change once published, so
+re-runs read them from disk instead of the network. Each page is one file
+named by the SHA-1 of its URL; a hit refreshes the file's mtime and the
+oldest files are evicted once the cache holds more than MAX_ENTRIES pages.
+Entries fetched more than TTL_SECONDS ago are treated as misses; the fetch
+time is stored in the file, so reading an entry doesn't extend its life.
+Used by execsum_processor.py (fetch_page).
+
+Cache files: <cache_dir>/<sha1>.page — first line is the fetch time (unix
+seconds) and the response encoding (may be empty), tab-separated; the rest
+is the raw body bytes.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+FILE_SUFFIX = '.page'
+TTL_SECONDS = 7 * 24 * 3600
+MAX_ENTRIES = 500
+
+
+def page_path(cache_dir, url):
+    """Return the cache file path for a URL."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + FILE_SUFFIX)
+
+
+def get(cache_dir, url, now=None):
+    """Return (body, encoding) for a cached, unexpired url, else None."""
+    if not cache_dir:
+        return None
+    path = page_path(cache_dir, url)
+    now = time.time() if now is None else now
+    try:
+        with open(path, 'rb') as f:
+            header, _, body = f.read().partition(b'\n')
+        fetched_at, _, encoding = header.partition(b'\t')
+        if now - float(fetched_at) > TTL_SECONDS:
+            return None
+        os.utime(path, (now, now))  # Mark as recently used
+    except (IOError, OSError, ValueError):
+        return None
+    return body, encoding.decode('ascii', 'replace') or None
+
+
+def put(cache_dir, url, body, encoding=None, now=None):
+    """Store a page body, then evict least recently used pages over MAX_ENTRIES."""
+    if not cache_dir or body is None:
+        return
+    path = page_path(cache_dir, url)
+    now = time.time() if now is None else now
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Unique temp file per writer; concurrent puts of one url can't interleave
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(f'{now:.0f}\t'.encode('ascii') + (encoding or '').encode('ascii', 'replace') + b'\n')
+            f.write(body)
+        os.replace(tmp_path, path)
+        os.utime(path, (now, now))
+    except (IOError, OSError) as e:
+        logger.warning(f"Failed to write page cache entry: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return
+    prune(cache_dir)
+
+
+def prune(cache_dir, max_entries=MAX_ENTRIES):
+    """Delete the least recently used pages beyond max_entries. Returns the number removed."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it
+                       if e.name.endswith(FILE_SUFFIX) and e.is_file()]
+    except OSError:
+        return 0
+    if len(entries) <= max_entries:
+        return 0
+    entries.sort()
+    removed = 0
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    logger.debug(f"Pruned {removed} pages from page cache")
+    return removed
@@ -684,6 +684,9 @@ class Scheduler:
             if self.server_mode:
                 config.max_workers = 2
                 config.resolve_redirects = False
+            # Persist fetch failures so dead URLs are backed off across runs
+            from file_manager import FileManager
+            config.cache_dir = self.data_dir or FileManager().base_dir
             processor = DataCSVProcessor(config)
 
             # Load custom instructions if not default
@@ -76,6 +76,13 @@ except ImportError:
     HAS_REQUESTS = False
     requests = None
 
+# Only advertise content-encodings urllib3 can decode in this environment
+# (br needs brotli, zstd needs zstandard — see requirements files)
+try:
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
 try:
     from bs4 import BeautifulSoup
     HAS_BS4 = True
@@ -296,6 +303,9 @@ def save_sources(sources: List[SourceConfig], sources_json_path: str):
 class SourceFetcher:
     """Unified source fetcher for multiple content types."""
 
+    # Name prefix of the subtitle files yt-dlp writes to the temp dir
+    SUBTITLE_PREFIX = "dab_sub_"
+
     def __init__(self, api_key: str, model_name: str = "gemini-2.0-flash", data_dir: str = ""):
         """Initialize the fetcher with API credentials.
 
@@ -308,6 +318,7 @@ class SourceFetcher:
         self.model_name = model_name
         self.data_dir = data_dir
         self._model = None
+        self._ydl = None
 
     def _get_model(self):
         """Lazy-load the Gemini model."""
@@ -317,13 +328,46 @@ class SourceFetcher:
             self._model = genai.GenerativeModel(self.model_name)
         return self._model
 
+    def _get_subtitle_downloader(self):
+        """Lazy-load the YoutubeDL used for subtitles.
+
+        YoutubeDL setup (option parsing, extractor registration) is costly, so
+        one instance serves every video. Its options never change: subtitle
+        files are named by video ID (SUBTITLE_PREFIX + id) in the temp dir.
+        """
+        if self._ydl is None:
+            import tempfile
+            import yt_dlp
+            self._ydl = yt_dlp.YoutubeDL({
+                "skip_download": True,
+                "writesubtitles": True,
+                "writeautomaticsub": True,
+                "subtitleslangs": ["en"],
+                "outtmpl": os.path.join(tempfile.gettempdir(), self.SUBTITLE_PREFIX + "%(id)s"),
+                "quiet": True,
+                "no_warnings": True,
+            })
+        return self._ydl
+
+    def close(self):
+        """Release the subtitle downloader (its HTTP connections and cookie jar)."""
+        ydl, self._ydl = self._ydl, None
+        if ydl is not None:
+            ydl.__exit__(None, None, None)  # Context-manager exit closes it on every yt-dlp version
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _get_headers(self) -> dict:
         """Get standard HTTP headers for web requests."""
         return {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -583,39 +627,21 @@ class SourceFetcher:
 
     def _get_youtube_transcript(self, video_id: str) -> Optional[str]:
         """Get transcript for a YouTube video using yt_dlp."""
-        import yt_dlp
-        import glob
         import tempfile
 
         url = f"https://www.youtube.com/watch?v={video_id}"
 
-        # Use system temp directory for subtitle files
+        # Subtitle files land in the system temp directory, named by video ID
         temp_dir = tempfile.gettempdir()
-        temp_prefix = os.path.join(temp_dir, f"dab_sub_{video_id}")
-
-        # Clean up any existing temp files
-        for f in glob.glob(f"{temp_prefix}*"):
-            try:
-                os.remove(f)
-            except:
-                pass
-
-        ydl_opts = {
-            "skip_download": True,
-            "writesubtitles": True,
-            "writeautomaticsub": True,
-            "subtitleslangs": ["en"],
-            "outtmpl": temp_prefix,
-            "quiet": True,
-            "no_warnings": True,
-        }
+        name_prefix = self.SUBTITLE_PREFIX + video_id
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            self._get_subtitle_downloader().download([url])
 
-            # Find the subtitle file
-            sub_files = glob.glob(f"{temp_prefix}*.vtt") + glob.glob(f"{temp_prefix}*.srt")
+            # Find the subtitle file (VTT preferred)
+            written = self._temp_files(temp_dir, name_prefix)
+            sub_files = ([f for f in written if f.endswith(".vtt")] +
+                         [f for f in written if f.endswith(".srt")])
             if not sub_files:
                 _debug_log(f"[YouTube] No subtitle files found for {video_id}")
                 return None
@@ -628,13 +654,6 @@ class SourceFetcher:
             transcript = self._clean_vtt(content)
             _debug_log(f"[YouTube] Cleaned transcript: {len(transcript)} chars")
 
-            # Clean up temp files
-            for f in glob.glob(f"{temp_prefix}*"):
-                try:
-                    os.remove(f)
-                except:
-                    pass
-
             return transcript
 
         except Exception as e:
@@ -643,6 +662,28 @@ class SourceFetcher:
             traceback.print_exc()
             return None
 
+        finally:
+            # Clean up temp files on every path, so no stale subtitles are
+            # left for a later run to pick up (and none need clearing first)
+            for f in self._temp_files(temp_dir, name_prefix):
+                try:
+                    os.remove(f)
+                except:
+                    pass
+
+    @staticmethod
+    def _temp_files(temp_dir: str, name_prefix: str) -> List[str]:
+        """Paths of the files in temp_dir whose names start with name_prefix.
+
+        One directory scan with a plain prefix test, instead of a glob per
+        extension over the (often crowded) system temp directory.
+        """
+        try:
+            with os.scandir(temp_dir) as it:
+                return sorted(e.path for e in it if e.name.startswith(name_prefix) and e.is_file())
+        except OSError:
+            return []
+
     # Title patterns indicating pure technical analysis / chart trading videos
     _TA_PATTERNS = re.compile('|'.join([
         r'\bchart\b.*\banalysis\b',
@@ -713,6 +754,19 @@ class SourceFetcher:
             return False
         return bool(self._SUI_PATTERN.search(title))
 
+    # VTT cue markup (<c>, <00:00:01.000>, ...) and header lines to drop
+    _VTT_TAG_RE = re.compile(r"<[^>]+>")
+    _VTT_HEADER_PREFIXES = ("WEBVTT", "Kind:", "Language:")
+    _FILLER_RES = [re.compile(p) for p in (
+        r'\b[Uu]h+\b',           # uh, uhh, uhhh
+        r'\b[Uu]m+\b',           # um, umm, ummm
+        r'\b[Hh]mm+\b',          # hmm, hmmm
+        r'\b[Ee]r+\b(?!\w)',     # er, err (but not "error", "era", etc.)
+        r'\b[Aa]h+\b',           # ah, ahh
+    )]
+    _DOUBLE_SPACE_RE = re.compile(r'  +')
+    _SPACE_BEFORE_PUNCT_RE = re.compile(r' ([,.])')
+
     def _clean_vtt(self, text: str) -> str:
         """Clean VTT subtitle format to plain text, stripping filler words."""
         lines = text.splitlines()
@@ -721,24 +775,15 @@ class SourceFetcher:
 
         for line in lines:
             line = line.strip()
-            if not line:
-                continue
-            if "-->" in line:
-                continue
-            if line.isdigit():
-                continue
-            if line.startswith("WEBVTT"):
-                continue
-            if line.startswith("Kind:"):
-                continue
-            if line.startswith("Language:"):
+            # Blank lines, cue timings, cue numbers and header lines
+            if not line or "-->" in line or line.isdigit() or line.startswith(self._VTT_HEADER_PREFIXES):
                 continue
             if line == last_line:
                 continue
 
             # Remove HTML tags
             if "<" in line and ">" in line:
-                line = re.sub(r"<[^>]+>", "", line)
+                line = self._VTT_TAG_RE.sub("", line)
 
             cleaned.append(line)
             last_line = line
@@ -748,19 +793,12 @@ class SourceFetcher:
         # Remove speech disfluencies before sending to AI.
         # The AI prompt also asks for this, but filler words leak through
         # on later videos when the model's context is large.
-        filler_patterns = [
-            r'\b[Uu]h+\b',           # uh, uhh, uhhh
-            r'\b[Uu]m+\b',           # um, umm, ummm
-            r'\b[Hh]mm+\b',          # hmm, hmmm
-            r'\b[Ee]r+\b(?!\w)',     # er, err (but not "error", "era", etc.)
-            r'\b[Aa]h+\b',           # ah, ahh
-        ]
-        for pattern in filler_patterns:
-            text = re.sub(pattern, '', text)
+        for pattern in self._FILLER_RES:
+            text = pattern.sub('', text)
 
         # Clean up artifacts: double spaces, space before punctuation
-        text = re.sub(r'  +', ' ', text)
-        text = re.sub(r' ([,.])', r'\1', text)
+        text = self._DOUBLE_SPACE_RE.sub(' ', text)
+        text = self._SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
 
         return text
 
@@ -0,0 +1,99 @@
+"""Tests for fetch_failure_cache module."""
+import json
+import os
+import tempfile
+
+import pytest
+
+# Add parent dir to path so we can import the module
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fetch_failure_cache import (
+    load_cache, save_cache, _empty_cache, should_skip, record_failure,
+    clear_failure, backoff_seconds, url_key, CACHE_FILENAME,
+    BASE_BACKOFF_SECONDS, MAX_BACKOFF_SECONDS, TTL_SECONDS
+)
+
+URL = 'https://example.com/dead-article'
+
+
+@pytest.fixture
+def cache_dir():
+    """Create a temporary directory for cache tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestBackoff:
+    def test_first_failure_uses_base(self):
+        assert backoff_seconds(1) == BASE_BACKOFF_SECONDS
+
+    def test_doubles_per_failure(self):
+        assert backoff_seconds(2) == BASE_BACKOFF_SECONDS * 2
+        assert backoff_seconds(3) == BASE_BACKOFF_SECONDS * 4
+
+    def test_capped(self):
+        assert backoff_seconds(50) == MAX_BACKOFF_SECONDS
+
+
+class TestFailureTracking:
+    def test_unknown_url_not_skipped(self):
+        assert should_skip(_empty_cache(), URL, now=1000) is False
+
+    def test_skipped_inside_window(self):
+        cache = _empty_cache()
+        record_failure(cache, URL, now=1000)
+        assert should_skip(cache, URL, now=1000 + BASE_BACKOFF_SECONDS - 1) is True
+
+    def test_retried_after_window(self):
+        cache = _empty_cache()
+        record_failure(cache, URL, now=1000)
+        assert should_skip(cache, URL, now=1000 + BASE_BACKOFF_SECONDS) is False
+
+    def test_repeat_failures_grow_window(self):
+        cache = _empty_cache()
+        record_failure(cache, URL, now=1000)
+        entry = record_failure(cache, URL, now=2000)
+        assert entry['failures'] == 2
+        assert entry['next_retry_at'] == 2000 + BASE_BACKOFF_SECONDS * 2
+
+    def test_clear_failure(self):
+        cache = _empty_cache()
+        record_failure(cache, URL, now=1000)
+        assert clear_failure(cache, URL) is True
+        assert should_skip(cache, URL, now=1000) is False
+        assert clear_failure(cache, URL) is False
+
+
+class TestPersistence:
+    def test_missing_file(self, cache_dir):
+        assert load_cache(cache_dir) == _empty_cache()
+
+    def test_none_dir(self):
+        assert load_cache(None) == _empty_cache()
+
+    def test_corrupt_json(self, cache_dir):
+        with open(os.path.join(cache_dir, CACHE_FILENAME), 'w') as f:
+            f.write("not valid json {{{")
+        assert load_cache(cache_dir) == _empty_cache()
+
+    def test_roundtrip(self, cache_dir):
+        cache = _empty_cache()
+        record_failure(cache, URL, now=1000)
+        save_cache(cache_dir, cache, now=1000)
+        loaded = load_cache(cache_dir)
+        assert should_skip(loaded, URL, now=1001) is True
+
+    def test_expired_entries_dropped(self, cache_dir):
+        cache = _empty_cache()
+        record_failure(cache, URL, now=1000)
+        save_cache(cache_dir, cache, now=1000 + BASE_BACKOFF_SECONDS + TTL_SECONDS + 1)
+        with open(os.path.join(cache_dir, CACHE_FILENAME), 'r') as f:
+            saved = json.load(f)
+        assert url_key(URL) not in saved['urls']
+
+    def test_none_inputs(self):
+        # Should not raise
+        save_cache(None, None)
+        save_cache("", _empty_cache())
@@ -0,0 +1,76 @@
+"""Tests for page_cache module."""
+import os
+import tempfile
+
+import pytest
+
+# Add parent dir to path so we can import the module
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from page_cache import get, put, prune, page_path, TTL_SECONDS, FILE_SUFFIX
+
+URL = 'https://www.execsum.co/p/some-issue'
+
+
+@pytest.fixture
+def cache_dir():
+    """Create a temporary directory for cache tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestGetPut:
+    def test_miss(self, cache_dir):
+        assert get(cache_dir, URL) is None
+
+    def test_none_dir(self):
+        assert get(None, URL) is None
+        put(None, URL, b'<html></html>')  # Should not raise
+
+    def test_roundtrip(self, cache_dir):
+        put(cache_dir, URL, b'<html>\n<p>caf\xc3\xa9</p></html>', 'utf-8')
+        assert get(cache_dir, URL) == (b'<html>\n<p>caf\xc3\xa9</p></html>', 'utf-8')
+
+    def test_missing_encoding(self, cache_dir):
+        put(cache_dir, URL, b'<html></html>')
+        assert get(cache_dir, URL) == (b'<html></html>', None)
+
+    def test_expired(self, cache_dir):
+        put(cache_dir, URL, b'<html></html>', now=1000)
+        assert get(cache_dir, URL, now=1000 + TTL_SECONDS + 1) is None
+
+    def test_reads_do_not_extend_ttl(self, cache_dir):
+        put(cache_dir, URL, b'<html></html>', now=1000)
+        day = 24 * 3600
+        for t in range(1000, 1000 + TTL_SECONDS, day):
+            assert get(cache_dir, URL, now=t) is not None
+        assert get(cache_dir, URL, now=1000 + TTL_SECONDS + day) is None
+
+    def test_no_temp_files_left(self, cache_dir):
+        put(cache_dir, URL, b'<html></html>')
+        assert os.listdir(cache_dir) == [os.path.basename(page_path(cache_dir, URL))]
+
+    def test_creates_directory(self, cache_dir):
+        nested = os.path.join(cache_dir, 'sub', 'dir')
+        put(nested, URL, b'<html></html>')
+        assert os.path.exists(page_path(nested, URL))
+
+
+class TestPrune:
+    def test_evicts_least_recently_used(self, cache_dir):
+        for i in range(3):
+            put(cache_dir, f'{URL}/{i}', b'x', now=1000 + i)
+        # Reading the oldest entry makes it the most recently used
+        get(cache_dir, f'{URL}/0', now=2000)
+        assert prune(cache_dir, max_entries=2) == 1
+        assert get(cache_dir, f'{URL}/1', now=2000) is None
+        assert get(cache_dir, f'{URL}/0', now=2000) is not None
+
+    def test_under_limit(self, cache_dir):
+        put(cache_dir, URL, b'x')
+        assert prune(cache_dir, max_entries=5) == 0
+        assert len([n for n in os.listdir(cache_dir) if n.endswith(FILE_SUFFIX)]) == 1
+
+    def test_missing_dir(self):
+        assert prune('/nonexistent/page/cache') == 0
@@ -0,0 +1,82 @@
+"""Tests for text_cache module."""
+import os
+import tempfile
+
+import pytest
+
+# Add parent dir to path so we can import the module
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from text_cache import get, put, prune, summary_key, TTL_SECONDS
+
+KEY = summary_key('models/gemini-2.5-flash', 'Summarize this transcript')
+
+
+@pytest.fixture
+def cache_dir():
+    """Create a temporary directory for cache tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestSummaryKey:
+    def test_stable(self):
+        assert summary_key('m', 'prompt') == summary_key('m', 'prompt')
+
+    def test_depends_on_model_and_prompt(self):
+        assert summary_key('m1', 'prompt') != summary_key('m2', 'prompt')
+        assert summary_key('m', 'prompt a') != summary_key('m', 'prompt b')
+
+    def test_no_ambiguous_concatenation(self):
+        assert summary_key('ab', 'c') != summary_key('a', 'bc')
+
+
+class TestGetPut:
+    def test_miss(self, cache_dir):
+        assert get(cache_dir, KEY) is None
+
+    def test_none_dir(self):
+        assert get(None, KEY) is None
+        put(None, KEY, 'summary')  # Should not raise
+
+    def test_roundtrip(self, cache_dir):
+        put(cache_dir, KEY, 'First, prices rose — sharply.')
+        assert get(cache_dir, KEY) == 'First, prices rose — sharply.'
+
+    def test_empty_summary_not_stored(self, cache_dir):
+        put(cache_dir, KEY, '')
+        assert get(cache_dir, KEY) is None
+
+    def test_expired(self, cache_dir):
+        put(cache_dir, KEY, 'summary', now=1000)
+        assert get(cache_dir, KEY, now=1000 + TTL_SECONDS + 1) is None
+
+    def test_reads_do_not_extend_ttl(self, cache_dir):
+        put(cache_dir, KEY, 'summary', now=1000)
+        day = 24 * 3600
+        for t in range(1000, 1000 + TTL_SECONDS, day):
+            assert get(cache_dir, KEY, now=t) == 'summary'
+        assert get(cache_dir, KEY, now=1000 + TTL_SECONDS + day) is None
+
+    def test_multiline_text(self, cache_dir):
+        put(cache_dir, KEY, '123\nsecond line\n')
+        assert get(cache_dir, KEY) == '123\nsecond line\n'
+
+    def test_no_temp_files_left(self, cache_dir):
+        put(cache_dir, KEY, 'summary')
+        assert os.listdir(cache_dir) == [KEY + '.txt']
+
+
+class TestPrune:
+    def test_evicts_least_recently_used(self, cache_dir):
+        keys = [summary_key('m', str(i)) for i in range(3)]
+        for i, key in enumerate(keys):
+            put(cache_dir, key, 'summary', now=1000 + i)
+        get(cache_dir, keys[0], now=2000)
+        assert prune(cache_dir, max_entries=2) == 1
+        assert get(cache_dir, keys[1], now=2000) is None
+        assert get(cache_dir, keys[0], now=2000) == 'summary'
+
+    def test_missing_dir(self):
+        assert prune('/nonexistent/text/cache') == 0
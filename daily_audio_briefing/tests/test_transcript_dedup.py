@@ -0,0 +1,73 @@
+"""Tests for transcript_dedup module."""
+import os
+import threading
+
+# Add parent dir to path so we can import the module
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from transcript_dedup import shingles, jaccard, TranscriptIndex
+
+TRANSCRIPT = (
+    "Bitcoin slipped below its recent range overnight as traders priced in a "
+    "slower pace of rate cuts, while ether held up better on renewed inflows "
+    "into spot funds and a busy week of network upgrades ahead"
+)
+
+
+class TestShingles:
+    def test_case_and_punctuation_insensitive(self):
+        assert shingles(TRANSCRIPT) == shingles(TRANSCRIPT.upper().replace(",", " ,"))
+
+    def test_short_text(self):
+        assert len(shingles("just three words")) == 1
+
+    def test_empty(self):
+        assert shingles("") == set()
+
+
+class TestJaccard:
+    def test_identical(self):
+        assert jaccard({1, 2}, {1, 2}) == 1.0
+
+    def test_partial(self):
+        assert jaccard({1, 2, 3}, {2, 3, 4}) == 0.5
+
+    def test_empty(self):
+        assert jaccard(set(), {1}) == 0.0
+
+
+class TestTranscriptIndex:
+    def test_first_claim_is_original(self):
+        index = TranscriptIndex()
+        assert index.claim('a', TRANSCRIPT) is None
+
+    def test_near_duplicate(self):
+        index = TranscriptIndex()
+        index.claim('a', TRANSCRIPT)
+        # Same stream with a short intro tacked on
+        assert index.claim('b', "hey everyone welcome back " + TRANSCRIPT) == 'a'
+
+    def test_different_transcript(self):
+        index = TranscriptIndex()
+        index.claim('a', TRANSCRIPT)
+        other = "Solana developers shipped a client update that cuts block times and fees for users"
+        assert index.claim('b', other) is None
+        # Recorded, so it is now an original too
+        assert index.claim('c', other) == 'b'
+
+    def test_empty_text_not_recorded(self):
+        index = TranscriptIndex()
+        assert index.claim('a', "") is None
+        assert index.claim('b', "") is None
+
+    def test_concurrent_duplicates_have_one_original(self):
+        index = TranscriptIndex()
+        results = []
+        threads = [threading.Thread(target=lambda k=k: results.append(index.claim(k, TRANSCRIPT)))
+                   for k in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results.count(None) == 1
@@ -0,0 +1,103 @@
+"""
+Text Cache — On-disk LRU cache of derived text (LLM summaries, transcripts).
+
+Each cache directory holds one file per key. Entries written more than
+TTL_SECONDS ago are misses; the write time is stored in the file, so reading
+an entry doesn't extend its life. A hit refreshes the file's mtime and the
+least recently used are evicted past MAX_ENTRIES.
+Used by get_youtube_news.py:
+  - summary_cache/: video summaries keyed by summary_key(model, prompt), the
+    SHA-256 of the model name and the full prompt, so a hit is only possible
+    when transcript, context and instructions all match. Re-running a day
+    (after a failure, or with overlapping --days ranges) reuses them.
+  - transcript_cache/: cleaned transcripts keyed by video id; captions don't
+    change once published, so reruns skip the yt-dlp lookup.
+
+Cache files: <cache_dir>/<key>.txt — first line is the write time (unix
+seconds), the rest is the text (UTF-8).
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+FILE_SUFFIX = '.txt'
+TTL_SECONDS = 30 * 24 * 3600
+MAX_ENTRIES = 1000
+
+
+def summary_key(model_name, prompt):
+    """Return the cache key for a prompt sent to a model."""
+    digest = hashlib.sha256()
+    digest.update((model_name or '').encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(prompt.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def get(cache_dir, key, now=None):
+    """Return the cached text for key if present and unexpired, else None."""
+    if not cache_dir:
+        return None
+    path = os.path.join(cache_dir, key + FILE_SUFFIX)
+    now = time.time() if now is None else now
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            written_at, _, text = f.read().partition('\n')
+        if now - float(written_at) > TTL_SECONDS:
+            return None
+        os.utime(path, (now, now))  # Mark as recently used
+    except (IOError, OSError, UnicodeDecodeError, ValueError):
+        return None
+    return text
+
+
+def put(cache_dir, key, text, now=None):
+    """Store text under key, then evict least recently used entries over MAX_ENTRIES."""
+    if not cache_dir or not text:
+        return
+    path = os.path.join(cache_dir, key + FILE_SUFFIX)
+    now = time.time() if now is None else now
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Unique temp file per writer; concurrent puts of one key can't interleave
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(f'{now:.0f}\n')
+            f.write(text)
+        os.replace(tmp_path, path)
+        os.utime(path, (now, now))
+    except (IOError, OSError) as e:
+        logger.warning(f"Failed to write text cache entry: {e}")
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return
+    prune(cache_dir)
+
+
+def prune(cache_dir, max_entries=MAX_ENTRIES):
+    """Delete the least recently used entries beyond max_entries. Returns the number removed."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it
+                       if e.name.endswith(FILE_SUFFIX) and e.is_file()]
+    except OSError:
+        return 0
+    if len(entries) <= max_entries:
+        return 0
+    entries.sort()
+    removed = 0
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    logger.debug(f"Pruned {removed} entries from {cache_dir}")
+    return removed
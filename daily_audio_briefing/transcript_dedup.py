@@ -0,0 +1,63 @@
+"""
+Transcript Dedup — Spot near-identical transcripts before they are summarized.
+
+Channels that clip, re-upload or simulcast the same stream produce
+transcripts that are mostly the same text. Each transcript is reduced to the
+set of hashes of its word 5-grams ("shingles"); two transcripts whose sets
+have a Jaccard similarity of at least THRESHOLD are duplicates.
+Used by get_youtube_news.py, so a duplicate costs a set comparison instead
+of an LLM call that answers "Skipped ... as duplicative."
+
+A run compares each transcript against the few hundred seen before it, so
+exact set comparison is used rather than MinHash/LSH approximations.
+"""
+import re
+import threading
+
+SHINGLE_SIZE = 5
+THRESHOLD = 0.7
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Return the set of hashed word size-grams of text (case-insensitive)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {hash(tuple(words))} if words else set()
+    return {hash(tuple(words[i:i + size])) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a, b):
+    """Jaccard similarity of two shingle sets (0.0 if either is empty)."""
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+class TranscriptIndex:
+    """Thread-safe record of the transcripts seen during one run."""
+
+    def __init__(self, threshold=THRESHOLD):
+        self.threshold = threshold
+        self._entries = []  # (key, shingle set)
+        self._lock = threading.Lock()
+
+    def claim(self, key, text):
+        """Return the key of an earlier near-duplicate of text, else record
+        text under key and return None. Atomic, so of two concurrent
+        duplicates exactly one is treated as the original."""
+        text_shingles = shingles(text)
+        if not text_shingles:
+            return None
+        with self._lock:
+            for other_key, other_shingles in self._entries:
+                # Sets this different in size can't reach the threshold
+                smaller, larger = sorted((len(text_shingles), len(other_shingles)))
+                if smaller < self.threshold * larger:
+                    continue
+                if jaccard(text_shingles, other_shingles) >= self.threshold:
+                    return other_key
+            self._entries.append((key, text_shingles))
+        return None